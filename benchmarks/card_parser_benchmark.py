@@ -0,0 +1,83 @@
+"""
+AutoHire AI - Job Card Parser Benchmark
+Parses saved search result pages with every available card parser and
+reports parse time and allocations (tracemalloc peak) per page,
+checking that all parsers extract the same jobs.
+
+Pages come from a fixtures directory recorded with HTTP_CACHE_MODE=record;
+without one, synthetic LinkedIn-like pages are used.
+
+Usage:
+    python benchmarks/card_parser_benchmark.py [--fixtures data/fixtures/http] [--pages 40] [--cards 25]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import card_parser
+from src.http_cache import HTTP_FIXTURES_DIR
+from benchmarks.http_client_benchmark import result_page_html
+
+
+def load_pages(fixtures_dir: str, pages: int, cards: int):
+    paths = sorted(glob.glob(os.path.join(fixtures_dir, "*.html")))[:pages]
+    if paths:
+        print(f"📂 {len(paths)} fixture pages from {fixtures_dir}")
+        texts = []
+        for path in paths:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                texts.append(f.read())
+        return texts
+    print(f"📂 no fixtures in {fixtures_dir}; using {pages} synthetic pages of {cards} cards")
+    return [result_page_html(cards, start=page * cards) for page in range(pages)]
+
+
+def measure(parser: str, pages):
+    # Timing and allocations are measured in separate passes; tracemalloc slows parsing down
+    started = time.perf_counter()
+    results = [card_parser.parse_job_cards(page, parser) for page in pages]
+    elapsed = time.perf_counter() - started
+
+    peaks = []
+    for page in pages:
+        tracemalloc.start()
+        card_parser.parse_job_cards(page, parser)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peaks.append(peak)
+    return elapsed / len(pages), sum(peaks) / len(peaks), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark job card parsing")
+    parser.add_argument("--fixtures", default=HTTP_FIXTURES_DIR, help="Directory of recorded .html pages")
+    parser.add_argument("--pages", type=int, default=40, help="Pages to parse (default: 40)")
+    parser.add_argument("--cards", type=int, default=25, help="Cards per synthetic page (default: 25)")
+    args = parser.parse_args()
+
+    pages = load_pages(args.fixtures, args.pages, args.cards)
+    size_kb = sum(len(page) for page in pages) / len(pages) / 1024
+    parsers = [name for name in card_parser.CARD_PARSERS if name != "lxml" or card_parser.LXML_AVAILABLE]
+    if not card_parser.LXML_AVAILABLE:
+        print("   (lxml not installed; skipping the lxml parser)")
+
+    print(f"\n   {'parser':<10} {'ms/page':>9} {'peak KB/page':>13} {'jobs':>6}   ({size_kb:.0f} KB/page)")
+    reference = None
+    for name in parsers:
+        seconds, peak, results = measure(name, pages)
+        jobs = sum(len(page_jobs) for page_jobs in results)
+        print(f"   {name:<10} {seconds * 1000:>9.2f} {peak / 1024:>13.0f} {jobs:>6}")
+        if reference is None:
+            reference = results
+        elif results != reference:
+            print(f"   ⚠️  {name} extracted different jobs than {parsers[0]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+AutoHire AI - Category Scorer Benchmark
+Checks that the vectorized CategoryScorer agrees with the per-resume
+classifier (same top category and scores as classify_resume, same confidence
+as get_classification_confidence), then compares docs/sec of the per-resume
+keyword scoring loop with one batched sparse matrix product.
+
+Usage:
+    python benchmarks/category_scorer_benchmark.py [--data-dir data] [--docs 5000]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.classifier_benchmark import load_corpus
+from src import keyword_classifier
+from src.category_scorer import classification_confidences
+
+
+def check_equivalence(texts: list) -> int:
+    """Compare the batch results with classify_resume document by document; returns the mismatch count."""
+    unique = list(dict.fromkeys(texts))
+    scores, top = keyword_classifier.category_scorer.score(unique)
+    batch = keyword_classifier.category_scorer.classify(unique)
+    confidences = classification_confidences(scores)
+    mismatches = 0
+    for text, (label, batch_scores), confidence in zip(unique, batch, confidences):
+        expected_label, expected_scores = keyword_classifier.classify_resume(text)
+        expected_confidence = keyword_classifier.get_classification_confidence(expected_scores)
+        if (label != expected_label or batch_scores != expected_scores
+                or not np.isclose(confidence, expected_confidence)):
+            mismatches += 1
+            print(f"   ❌ mismatch: {expected_label} {expected_scores} vs {label} {batch_scores}")
+    return mismatches
+
+
+def bench_loop(texts: list) -> float:
+    """Per-resume keyword scoring, as classify_resume does after tokenizing."""
+    started = time.perf_counter()
+    for text in texts:
+        scores = {category: 0.0 for category in keyword_classifier.categories}
+        for keyword in keyword_classifier.category_matcher.find_keywords(text):
+            for category in keyword_classifier._keyword_categories.get(keyword, ()):
+                scores[category] += keyword_classifier.categories[category]["weight"]
+        keyword_classifier.get_classification_confidence(scores)
+    return len(texts) / (time.perf_counter() - started)
+
+
+def bench_batch(texts: list) -> float:
+    """One hit matrix and matrix product for the whole corpus."""
+    started = time.perf_counter()
+    scores, _ = keyword_classifier.category_scorer.score(texts)
+    classification_confidences(scores)
+    return len(texts) / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and benchmark vectorized category scoring")
+    parser.add_argument("--data-dir", default="data", help="Folder of PDFs used as the corpus (default: data)")
+    parser.add_argument("--docs", type=int, default=5000, help="Corpus size; PDFs are repeated (default: 5000)")
+    args = parser.parse_args()
+
+    # Per-document info logs would dominate the timings
+    logging.disable(logging.INFO)
+    texts = load_corpus(args.data_dir, args.docs)
+
+    mismatches = check_equivalence(texts)
+    print(f"📄 {len(texts)} documents, {len(set(texts))} distinct: "
+          f"{'✅ batch scores match classify_resume' if not mismatches else f'❌ {mismatches} mismatches'}")
+    print(f"   per-resume loop : {bench_loop(texts):10.1f} docs/sec")
+    print(f"   batched matrix  : {bench_batch(texts):10.1f} docs/sec")
+    if mismatches:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+AutoHire AI - Classifier Benchmark
+Compares docs/sec of the original full spaCy pipeline (one nlp() call per
+resume) with the trimmed, batched classify_resumes API.
+
+Usage:
+    python benchmarks/classifier_benchmark.py [--data-dir data] [--docs 500] [--batch-size 64] [--n-process 1]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import spacy
+
+from src import keyword_classifier
+from src.model_registry import registry
+from src.parser import extract_text_from_pdf
+
+
+def load_corpus(data_dir: str, docs: int) -> list:
+    """Extract the PDFs in data_dir and repeat them to reach the requested corpus size."""
+    texts = []
+    for filename in sorted(os.listdir(data_dir)):
+        if filename.lower().endswith(".pdf"):
+            texts.append(extract_text_from_pdf(os.path.join(data_dir, filename)))
+    if not texts:
+        raise SystemExit(f"❌ No PDFs found in '{data_dir}'")
+    return [texts[i % len(texts)] for i in range(docs)]
+
+
+def bench_full_pipeline(texts: list) -> float:
+    """Old behavior: full en_core_web_sm pipeline, one document at a time."""
+    full_nlp = spacy.load(keyword_classifier.SPACY_MODEL)
+    trimmed_nlp = registry.override(keyword_classifier.SPACY_MODEL, full_nlp)
+    try:
+        started = time.perf_counter()
+        for text in texts:
+            keyword_classifier.classify_resume(text)
+        return len(texts) / (time.perf_counter() - started)
+    finally:
+        registry.override(keyword_classifier.SPACY_MODEL, trimmed_nlp)
+
+
+def bench_trimmed_single(texts: list) -> float:
+    """Trimmed pipeline, still one nlp() call per document."""
+    started = time.perf_counter()
+    for text in texts:
+        keyword_classifier.classify_resume(text)
+    return len(texts) / (time.perf_counter() - started)
+
+
+def bench_trimmed_batched(texts: list, batch_size: int, n_process: int) -> float:
+    """Trimmed pipeline streamed through nlp.pipe."""
+    started = time.perf_counter()
+    keyword_classifier.classify_resumes(texts, batch_size=batch_size, n_process=n_process)
+    return len(texts) / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark resume classification throughput")
+    parser.add_argument("--data-dir", default="data", help="Folder of PDFs used as the corpus (default: data)")
+    parser.add_argument("--docs", type=int, default=500, help="Corpus size; PDFs are repeated (default: 500)")
+    parser.add_argument("--batch-size", type=int, default=64, help="nlp.pipe batch size (default: 64)")
+    parser.add_argument("--n-process", type=int, default=1, help="nlp.pipe worker processes (default: 1)")
+    args = parser.parse_args()
+
+    # Per-document info logs would dominate the timings
+    logging.disable(logging.INFO)
+    texts = load_corpus(args.data_dir, args.docs)
+
+    print(f"📄 {len(texts)} documents")
+    print(f"   full pipeline, per doc   : {bench_full_pipeline(texts):8.1f} docs/sec")
+    print(f"   trimmed pipeline, per doc: {bench_trimmed_single(texts):8.1f} docs/sec")
+    print(f"   trimmed pipeline, nlp.pipe (batch_size={args.batch_size}, n_process={args.n_process}): "
+          f"{bench_trimmed_batched(texts, args.batch_size, args.n_process):8.1f} docs/sec")
+
+
+if __name__ == "__main__":
+    main()
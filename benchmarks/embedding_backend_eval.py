@@ -0,0 +1,93 @@
+"""
+AutoHire AI - Embedding Backend Evaluation
+Compares the int8 and ONNX inference backends of JobMatcher against fp32:
+match-score drift, rank agreement on fixture resumes and jobs, load time and
+encode throughput.
+
+Usage:
+    python benchmarks/embedding_backend_eval.py [--data-dir data] [--jobs 500] [--top-k 10] [--backends fp32 int8 onnx]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.job_matcher_benchmark import RESUME_TEXT, synthetic_jobs
+from benchmarks.resume_chunking_benchmark import spearman, top_k_overlap
+from src import job_matcher as job_matcher_module
+from src.job_matcher import EMBEDDING_BACKENDS, JobMatcher, model_key
+from src.model_registry import registry
+from src.parser import extract_text_from_pdf
+
+
+def load_resumes(data_dir: str) -> dict:
+    """Fixture resumes: every PDF in data_dir, or the built-in sample resume."""
+    resumes = {}
+    if os.path.isdir(data_dir):
+        for filename in sorted(os.listdir(data_dir)):
+            if filename.lower().endswith(".pdf"):
+                resumes[filename] = extract_text_from_pdf(os.path.join(data_dir, filename))
+    return resumes or {"sample resume": RESUME_TEXT}
+
+
+def score_matrix(matcher: JobMatcher, resumes: dict, jobs: list) -> np.ndarray:
+    """(resumes, jobs) match scores on the 0-100 scale used by match_resume_to_jobs."""
+    return np.array([
+        [match["match_score"] for match in matcher.match_resume_to_jobs(text, jobs)]
+        for text in resumes.values()
+    ])
+
+
+def jobs_per_sec(matcher: JobMatcher, jobs: list) -> float:
+    texts = [matcher.job_text(job) for job in jobs]
+    started = time.perf_counter()
+    matcher.model.encode(texts, batch_size=matcher.batch_size, convert_to_numpy=True)
+    return len(texts) / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate quantized/ONNX embedding backends against fp32")
+    parser.add_argument("--data-dir", default="data", help="Folder of fixture PDF resumes (default: data)")
+    parser.add_argument("--jobs", type=int, default=500, help="Synthetic jobs to score (default: 500)")
+    parser.add_argument("--top-k", type=int, default=10, help="Top-k used for overlap (default: 10)")
+    parser.add_argument("--backends", nargs="+", choices=EMBEDDING_BACKENDS, default=list(EMBEDDING_BACKENDS),
+                        help="Backends to evaluate; fp32 is always the reference")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    # Measure the models themselves, not the embedding cache or the job index
+    job_matcher_module.EMBEDDING_CACHE_DIR = ""
+    job_matcher_module.JOB_INDEX_DIR = ""
+
+    resumes = load_resumes(args.data_dir)
+    jobs = synthetic_jobs(args.jobs)
+    print(f"📄 {len(resumes)} resumes x {len(jobs)} jobs")
+
+    reference = None
+    for backend in ["fp32"] + [b for b in args.backends if b != "fp32"]:
+        matcher = JobMatcher(backend=backend)
+        if not matcher.model:
+            print(f"   {backend:<5} ❌ could not be loaded (see log)")
+            continue
+        matcher.model.encode(["warm up"])
+        scores = score_matrix(matcher, resumes, jobs)
+        load_seconds = registry.metrics()[model_key(backend)]["load_seconds"]
+        line = f"   {backend:<5} load {load_seconds:6.2f}s | {jobs_per_sec(matcher, jobs):8.1f} jobs/sec"
+        if reference is None:
+            reference = scores
+        else:
+            drift = np.abs(scores - reference)
+            line += (f" | score drift mean {drift.mean():.3f} max {drift.max():.3f}"
+                     f" | spearman {np.mean([spearman(r, s) for r, s in zip(reference, scores)]):.4f}"
+                     f" | top-{args.top_k} overlap {np.mean([top_k_overlap(r, s, args.top_k) for r, s in zip(reference, scores)]):.0%}")
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
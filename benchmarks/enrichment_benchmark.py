@@ -0,0 +1,115 @@
+"""
+AutoHire AI - Job Enrichment Benchmark
+Enriches jobs from a local stand-in for LinkedIn posting pages (some of
+them slow) and reports how many postings got a description within the
+budget and the wall-clock time, then repeats the search: postings already
+fetched come from the job store and the budget goes to the rest.
+
+Usage:
+    python benchmarks/enrichment_benchmark.py [--jobs 60] [--latency-ms 300] [--slow-every 7] [--budget 3]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.job_enricher import JobEnricher
+from src.job_matcher import JobMatcher
+from src.job_store import JobStore
+from src.rate_limit import HostRateLimiter
+
+DESCRIPTIONS = [
+    "Build REST API services in Python with Django, PostgreSQL and Docker on AWS.",
+    "Analyse product data with SQL, pandas and Tableau; run A/B testing with the growth team.",
+    "Train deep learning models in PyTorch for NLP and computer vision; deploy with Kubernetes.",
+    "Develop React and TypeScript front ends against GraphQL microservices.",
+]
+
+DETAIL_HTML = """<!DOCTYPE html><html><head><title>Job</title>{filler}</head><body>
+<section class="core-section-container description"><div class="description__text description__text--rich">
+<section class="show-more-less-html"><div class="show-more-less-html__markup">
+<p>{description}</p><ul><li>Good communication</li><li>Team player</li></ul>
+</div></section></div></section><footer>footer</footer></body></html>"""
+
+
+def start_detail_server(latency_seconds: float, slow_every: int) -> ThreadingHTTPServer:
+    """Posting pages at /jobs/view/<n>; every slow_every-th posting takes 10x the latency."""
+    filler = "<script>window.__data = {};</script>" * 50
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        wbufsize = -1
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            number = int(self.path.rstrip("/").rsplit("/", 1)[-1])
+            slow = slow_every and number % slow_every == 0
+            time.sleep(latency_seconds * (10 if slow else 1))
+            body = DETAIL_HTML.format(filler=filler, description=DESCRIPTIONS[number % len(DESCRIPTIONS)]).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(label: str, enricher: JobEnricher, jobs):
+    started = time.perf_counter()
+    enriched = enricher.enrich(jobs)
+    elapsed = time.perf_counter() - started
+    print(f"   {label:<10} {elapsed:6.2f}s | {enriched:>3}/{len(jobs)} enriched | {enricher.stats()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark job description enrichment")
+    parser.add_argument("--jobs", type=int, default=60, help="Postings to enrich (default: 60)")
+    parser.add_argument("--latency-ms", type=float, default=300, help="Detail page latency (default: 300)")
+    parser.add_argument("--slow-every", type=int, default=7, help="Every n-th page is 10x slower (default: 7)")
+    parser.add_argument("--budget", type=float, default=3.0, help="Enrichment budget in seconds (default: 3)")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    server = start_detail_server(args.latency_ms / 1000, args.slow_every)
+    base = f"http://127.0.0.1:{server.server_address[1]}/jobs/view"
+
+    def make_jobs():
+        return [{"title": "Software Engineer", "company": "Acme", "location": "Pune, India",
+                 "link": f"{base}/{i}", "source": "LinkedIn"} for i in range(args.jobs)]
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        store = JobStore(os.path.join(work_dir, "jobs.db"))
+
+        def make_enricher():
+            return JobEnricher(job_store=store, max_jobs=args.jobs, budget_seconds=args.budget,
+                               rate_limiter=HostRateLimiter(rate=1e6, capacity=1000))
+
+        print(f"🔎 {args.jobs} postings, {args.latency_ms:.0f} ms/page (every {args.slow_every}th 10x slower), "
+              f"{make_enricher().workers} workers, {args.budget:.1f}s budget")
+        jobs = make_jobs()
+        run("first", make_enricher(), jobs)
+        time.sleep(args.latency_ms * 10 / 1000)  # let the fetches running at the deadline land in the store
+        run("second", make_enricher(), make_jobs())
+        run("third", make_enricher(), make_jobs())
+
+        enriched = next(job for job in jobs if job.get("description"))
+        print(f"\n   Embedded text before: {JobMatcher.job_text(make_jobs()[0])!r}")
+        print(f"   Embedded text after:  {JobMatcher.job_text(enriched)!r}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
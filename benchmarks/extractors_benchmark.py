@@ -0,0 +1,87 @@
+"""
+AutoHire AI - PDF Extraction Benchmark
+Runs every installed text-extraction backend over a folder of PDFs and reports
+pages/sec, peak RSS and text similarity to the pdfplumber output.
+
+Usage:
+    python benchmarks/extractors_benchmark.py [--data-dir data] [--repeat 3]
+"""
+
+import argparse
+import difflib
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.extractors import available_extractors, get_extractor
+
+REFERENCE_BACKEND = "pdfplumber"
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of the current process in MB."""
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run_backend(backend: str, pdf_files: list, repeat: int) -> dict:
+    """Extract every PDF with one backend; runs in a fresh process so peak RSS is isolated."""
+    extractor = get_extractor(backend)
+    texts, pages, elapsed = {}, 0, 0.0
+    for _ in range(repeat):
+        for path in pdf_files:
+            started = time.perf_counter()
+            page_texts = list(extractor.iter_pages(path))
+            elapsed += time.perf_counter() - started
+            pages += len(page_texts)
+            texts[path] = "\n".join(t for t in page_texts if t)
+    return {"pages": pages, "seconds": elapsed, "peak_rss_mb": _peak_rss_mb(), "texts": texts}
+
+
+def text_similarity(a: str, b: str) -> float:
+    """Token-level similarity ratio between two extractions (1.0 = identical token streams)."""
+    return difflib.SequenceMatcher(None, a.split(), b.split(), autojunk=False).ratio()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PDF text-extraction backends")
+    parser.add_argument("--data-dir", default="data", help="Folder of PDFs to extract (default: data)")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes over the folder per backend (default: 3)")
+    args = parser.parse_args()
+
+    pdf_files = sorted(
+        os.path.join(args.data_dir, f) for f in os.listdir(args.data_dir) if f.lower().endswith(".pdf")
+    )
+    if not pdf_files:
+        print(f"❌ No PDFs found in '{args.data_dir}'")
+        return
+
+    backends = available_extractors()
+    print(f"📄 {len(pdf_files)} PDFs | backends: {', '.join(backends)}")
+
+    # Spawn gives every backend a clean interpreter, so RSS isn't inherited from earlier runs
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for backend in backends:
+        with context.Pool(1) as pool:
+            results[backend] = pool.apply(_run_backend, (backend, pdf_files, args.repeat))
+
+    reference = results.get(REFERENCE_BACKEND)
+    print(f"\n{'backend':<12} {'pages/sec':>10} {'peak RSS MB':>12} {'similarity':>11}")
+    for backend, result in results.items():
+        pages_per_sec = result["pages"] / result["seconds"] if result["seconds"] else 0.0
+        if reference:
+            scores = [text_similarity(reference["texts"][p], result["texts"][p]) for p in pdf_files]
+            similarity = f"{sum(scores) / len(scores):.3f}"
+        else:
+            similarity = "n/a"
+        print(f"{backend:<12} {pages_per_sec:>10.1f} {result['peak_rss_mb']:>12.1f} {similarity:>11}")
+
+
+if __name__ == "__main__":
+    main()
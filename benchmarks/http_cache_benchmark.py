@@ -0,0 +1,78 @@
+"""
+AutoHire AI - HTTP Cache Benchmark
+Runs the same scrape_linkedin_jobs searches against a local stand-in for the
+LinkedIn search page: live (no cache), through a warm response cache, with
+every entry stale (If-None-Match revalidation), and in replay mode from
+recorded fixtures with the server shut down.
+
+Usage:
+    python benchmarks/http_cache_benchmark.py [--queries 50] [--cards 25] [--latency-ms 150]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import http_cache, web_scraper
+from src.rate_limit import HostRateLimiter
+from benchmarks.http_client_benchmark import result_page_html, start_stand_in_server
+
+
+def run(label: str, terms):
+    found = 0
+    started = time.perf_counter()
+    for term in terms:
+        found += len(web_scraper.scrape_linkedin_jobs(term, "India"))
+    elapsed = time.perf_counter() - started
+    print(f"   {label:<14} {elapsed / len(terms) * 1000:8.2f} ms/search | {found:>6} jobs | {http_cache.cache_stats()}")
+    return found
+
+
+def configure(cache_dir: str, mode: str, fixtures_dir: str):
+    http_cache.HTTP_CACHE_DIR = cache_dir
+    http_cache.HTTP_CACHE_MODE = mode
+    http_cache.HTTP_FIXTURES_DIR = fixtures_dir
+    http_cache._cache = None
+    http_cache._fixtures = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the HTTP response cache and fixture replay")
+    parser.add_argument("--queries", type=int, default=50, help="Distinct searches (default: 50)")
+    parser.add_argument("--cards", type=int, default=25, help="Job cards per page (default: 25)")
+    parser.add_argument("--latency-ms", type=float, default=150, help="Simulated server latency (default: 150)")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    server = start_stand_in_server(result_page_html(args.cards), latency_seconds=args.latency_ms / 1000)
+    web_scraper.LINKEDIN_SEARCH_URL = f"http://127.0.0.1:{server.server_address[1]}/jobs/search"
+    web_scraper.rate_limiter = HostRateLimiter(rate=1e6, capacity=1000)
+    web_scraper.SCRAPE_MAX_JOBS = web_scraper.SCRAPE_PAGE_SIZE  # one results page per search
+    terms = [f"python {i}" for i in range(args.queries)]
+
+    print(f"🌐 stand-in server at {web_scraper.LINKEDIN_SEARCH_URL}, {args.cards} cards/page, "
+          f"{args.latency_ms:.0f} ms latency, {args.queries} searches")
+    with tempfile.TemporaryDirectory() as work_dir:
+        cache_dir, fixtures_dir = os.path.join(work_dir, "cache"), os.path.join(work_dir, "fixtures")
+
+        configure("", "record", fixtures_dir)
+        live = run("live + record", terms)
+        configure(cache_dir, "", fixtures_dir)
+        run("cold cache", terms)
+        cached = run("warm cache", terms)
+        http_cache._cache.ttl_seconds = 0  # every entry is stale: 304 revalidation, no body
+        run("revalidate", terms)
+        server.shutdown()
+        configure("", "replay", fixtures_dir)
+        replayed = run("replay", terms)
+
+    print(f"\n   Same results from cache and replay: {live == cached == replayed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+AutoHire AI - HTTP Client Benchmark
+Runs scrape_linkedin_jobs against a local stand-in for the LinkedIn search
+page and compares the pooled, retrying session with a bare requests.get per
+call: latency, connection reuse, and how many results survive a server that
+intermittently answers 429/503.
+
+Usage:
+    python benchmarks/http_client_benchmark.py [--requests 200] [--cards 25] [--flaky-every 5]
+"""
+
+import argparse
+import functools
+import hashlib
+import logging
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from unittest import mock
+
+import requests
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import http_cache, http_client, web_scraper
+from src.rate_limit import HostRateLimiter
+
+CARD_HTML = """
+<li>
+  <div class="base-card relative w-full hover:no-underline focus:no-underline base-card--link base-search-card job-search-card">
+    <a class="base-card__full-link absolute top-0 right-0 bottom-0 left-0 p-0 z-[2]" href="https://in.linkedin.com/jobs/view/{slug}-{job_id}?position={position}&amp;pageNum=0&amp;refId=abc&amp;trackingId=xyz">
+      <span class="sr-only">{title}</span>
+    </a>
+    <div class="search-entity-media"><img class="artdeco-entity-image" data-delayed-url="https://media.licdn.com/logo.png" alt="{company}"></div>
+    <div class="base-search-card__info">
+      <h3 class="base-search-card__title">
+            {title}
+      </h3>
+      <h4 class="base-search-card__subtitle">
+        <a class="hidden-nested-link" href="https://in.linkedin.com/company/{company_slug}">{company}</a>
+      </h4>
+      <div class="base-search-card__metadata">
+        <span class="job-search-card__location">{location}</span>
+        <div class="job-posting-benefits text-sm"><span class="job-posting-benefits__text">Actively Hiring</span></div>
+        <time class="job-search-card__listdate" datetime="2025-01-15">2 days ago</time>
+      </div>
+    </div>
+  </div>
+</li>
+"""
+
+TITLES = ["Software Engineer Intern", "Data Analyst", "Backend Developer", "ML Engineer", "Product Analyst"]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli"]
+LOCATIONS = ["Pune, Maharashtra, India", "Bengaluru, Karnataka, India", "Hyderabad, Telangana, India"]
+
+
+def result_page_html(cards: int = 25, start: int = 0) -> str:
+    """A LinkedIn-like job search results page with `cards` job cards, ids from `start`."""
+    items = []
+    for i in range(start, start + cards):
+        title, company = TITLES[i % len(TITLES)], COMPANIES[i % len(COMPANIES)]
+        items.append(CARD_HTML.format(
+            slug=title.lower().replace(" ", "-"), job_id=3800000000 + i, position=i - start + 1, title=title,
+            company=company, company_slug=company.lower(), location=LOCATIONS[i % len(LOCATIONS)],
+        ))
+    filler = "<script>window.__data = {};</script>" * 20
+    return (f"<!DOCTYPE html><html><head><title>Jobs</title>{filler}</head><body>"
+            f"<header><nav>LinkedIn</nav></header><main><section><ul class=\"jobs-search__results-list\">"
+            f"{''.join(items)}</ul></section></main><footer>footer</footer></body></html>")
+
+
+def start_stand_in_server(page, flaky_every: int = 0, latency_seconds: float = 0.0) -> ThreadingHTTPServer:
+    """
+    Serve `page` on localhost, with an ETag that If-None-Match can revalidate
+    against. `page` is the HTML, or a function of the request's `start`
+    offset returning the HTML of that results page. Every flaky_every-th
+    request gets a 429 or 503 instead, and every response is delayed by
+    latency_seconds.
+    """
+    counter = {"count": 0}
+    lock = threading.Lock()
+    render = page if callable(page) else (lambda start: page)
+
+    @functools.lru_cache(maxsize=None)
+    def body_and_etag(start: int):
+        body = render(start).encode("utf-8")
+        return body, f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+        # One write per response, so keep-alive connections don't hit Nagle/delayed-ACK stalls
+        wbufsize = -1
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            if latency_seconds:
+                time.sleep(latency_seconds)
+            with lock:
+                counter["count"] += 1
+                count = counter["count"]
+            if flaky_every and count % flaky_every == 0:
+                status = 429 if count % (2 * flaky_every) == 0 else 503
+                self.send_response(status)
+                self.send_header("Retry-After", "0")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            start = int(parse_qs(urlsplit(self.path).query).get("start", ["0"])[0])
+            body, etag = body_and_etag(start)
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def bare_get(url, headers=None, timeout=10, rate_limiter=None, **kwargs):
+    """The original behavior: a fresh connection per call and no retries."""
+    return requests.get(url, headers=headers, timeout=timeout, **kwargs)
+
+
+def run(label: str, count: int):
+    http_client.metrics.reset()
+    found = 0
+    started = time.perf_counter()
+    for i in range(count):
+        found += len(web_scraper.scrape_linkedin_jobs(f"python {i}", "India"))
+    elapsed = time.perf_counter() - started
+    print(f"   {label:<16} {elapsed / count * 1000:7.2f} ms/search | {found:>6} jobs | {http_client.metrics.snapshot()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the pooled, retrying HTTP client")
+    parser.add_argument("--requests", type=int, default=200, help="Searches per mode (default: 200)")
+    parser.add_argument("--cards", type=int, default=25, help="Job cards per page (default: 25)")
+    parser.add_argument("--flaky-every", type=int, default=5, help="Every n-th response is a 429/503; 0 disables (default: 5)")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    server = start_stand_in_server(result_page_html(args.cards), args.flaky_every)
+    web_scraper.LINKEDIN_SEARCH_URL = f"http://127.0.0.1:{server.server_address[1]}/jobs/search"
+    web_scraper.rate_limiter = HostRateLimiter(rate=1e6, capacity=1000)  # measure the client, not politeness
+    http_cache.HTTP_CACHE_DIR = ""  # every search must reach the server
+    http_cache.HTTP_CACHE_MODE = ""
+    web_scraper.SCRAPE_MAX_JOBS = web_scraper.SCRAPE_PAGE_SIZE  # one results page per search
+
+    print(f"🌐 stand-in server at {web_scraper.LINKEDIN_SEARCH_URL}, {args.cards} cards/page, "
+          f"flaky every {args.flaky_every or 'never'}")
+    with mock.patch.object(http_client, "get", bare_get):
+        run("bare requests", args.requests)
+    run("pooled session", args.requests)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
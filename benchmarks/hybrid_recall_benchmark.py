@@ -0,0 +1,90 @@
+"""
+AutoHire AI - Hybrid Matching Recall Benchmark
+Measures how many of the brute-force semantic top-k jobs survive the BM25
+shortlist of JobMatcher.match_many, and how long each mode takes, at several
+shortlist sizes.
+
+Usage:
+    python benchmarks/hybrid_recall_benchmark.py [--data-dir data] [--jobs 5000] [--top-k 20] [--shortlists 100 300 1000]
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.embedding_backend_eval import load_resumes
+from benchmarks.job_matcher_benchmark import synthetic_jobs
+from src import job_matcher as job_matcher_module
+from src.job_matcher import JobMatcher
+
+SKILLS = {
+    "Software Engineer": ["python", "java", "rest apis", "microservices", "git", "sql"],
+    "Data Analyst": ["sql", "excel", "tableau", "statistics", "pandas", "dashboards"],
+    "Backend Developer": ["python", "django", "flask", "postgresql", "docker", "apis"],
+    "ML Engineer": ["pytorch", "tensorflow", "machine learning", "mlops", "python", "kubernetes"],
+    "Product Manager": ["roadmap", "stakeholders", "agile", "user research", "analytics"],
+    "Security Analyst": ["siem", "incident response", "firewall", "vulnerability", "compliance"],
+    "DevOps Engineer": ["aws", "terraform", "kubernetes", "docker", "ci/cd", "linux"],
+    "Data Scientist": ["machine learning", "statistics", "python", "nlp", "scikit-learn", "pandas"],
+    "Frontend Developer": ["react", "javascript", "typescript", "css", "html", "redux"],
+    "QA Engineer": ["selenium", "test automation", "pytest", "jira", "regression testing"],
+}
+
+
+def jobs_with_descriptions(count: int, seed: int = 7) -> list:
+    """synthetic_jobs plus a short skills-based description per posting."""
+    rng = random.Random(seed)
+    jobs = synthetic_jobs(count, seed)
+    for job in jobs:
+        base_title = next(title for title in SKILLS if title in job["title"])
+        skills = rng.sample(SKILLS[base_title], 3) + rng.sample(sorted({s for v in SKILLS.values() for s in v}), 2)
+        job["description"] = f"We are hiring a {job['title']} with experience in {', '.join(skills)}."
+    return jobs
+
+
+def timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BM25 shortlist recall against brute-force semantic matching")
+    parser.add_argument("--data-dir", default="data", help="Folder of fixture PDF resumes (default: data)")
+    parser.add_argument("--jobs", type=int, default=5000, help="Synthetic jobs to match (default: 5000)")
+    parser.add_argument("--top-k", type=int, default=20, help="Matches per resume (default: 20)")
+    parser.add_argument("--shortlists", type=int, nargs="+", default=[100, 300, 1000], help="Shortlist sizes")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    # Keep every mode on equal footing: no embedding cache, no index writes
+    job_matcher_module.EMBEDDING_CACHE_DIR = ""
+    job_matcher_module.JOB_INDEX_DIR = ""
+    matcher = JobMatcher()
+    if not matcher.model:
+        raise SystemExit("❌ SentenceTransformer model could not be loaded")
+
+    resumes = list(load_resumes(args.data_dir).values())
+    jobs = jobs_with_descriptions(args.jobs)
+    matcher.match_many(resumes, jobs[:10])  # warm up
+
+    exact, exact_seconds = timed(lambda: matcher.match_many(resumes, jobs, top_k=args.top_k, shortlist=0))
+    print(f"📄 {len(resumes)} resumes x {len(jobs)} jobs, top-{args.top_k}")
+    print(f"   brute force     : {exact_seconds:7.2f}s")
+    for shortlist in args.shortlists:
+        hybrid, seconds = timed(lambda: matcher.match_many(resumes, jobs, top_k=args.top_k, shortlist=shortlist))
+        recalls = [
+            len({m["job"]["link"] for m in e} & {m["job"]["link"] for m in h}) / max(1, len(e))
+            for e, h in zip(exact, hybrid)
+        ]
+        print(f"   shortlist {shortlist:>5} : {seconds:7.2f}s ({exact_seconds / seconds:5.1f}x) | "
+              f"recall@{args.top_k} {sum(recalls) / len(recalls):.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+AutoHire AI - Job Matcher Benchmark
+Measures jobs/sec of JobMatcher.match_resume_to_jobs against the original
+one-encode-per-job loop at several job-list sizes.
+
+Usage:
+    python benchmarks/job_matcher_benchmark.py [--sizes 10 100 10000] [--batch-size 64] [--legacy-limit 1000]
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sentence_transformers import util
+
+from src.job_matcher import JobMatcher
+
+RESUME_TEXT = (
+    "Computer science graduate with internships in backend development. Built REST APIs in Python "
+    "and Flask, deployed Docker containers on AWS, and trained scikit-learn models for churn prediction. "
+    "Skills: Python, Java, SQL, Git, Docker, Kubernetes, pandas, NumPy, machine learning."
+)
+
+TITLES = ["Software Engineer", "Data Analyst", "Backend Developer", "ML Engineer", "Product Manager",
+          "Security Analyst", "DevOps Engineer", "Data Scientist", "Frontend Developer", "QA Engineer"]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries", "Wayne Enterprises"]
+LOCATIONS = ["Pune", "Bengaluru", "Hyderabad", "Remote", "Mumbai", "Chennai"]
+
+
+def synthetic_jobs(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    return [
+        {
+            "title": f"{rng.choice(['Junior', 'Senior', 'Associate', ''])} {rng.choice(TITLES)}".strip(),
+            "company": rng.choice(COMPANIES),
+            "location": rng.choice(LOCATIONS),
+            "link": f"https://example.com/jobs/{i}",
+            "source": "Synthetic",
+        }
+        for i in range(count)
+    ]
+
+
+def legacy_match(matcher: JobMatcher, resume_text: str, jobs: list) -> list:
+    """The original implementation: one encode and one cosine call per job."""
+    resume_embedding = matcher.model.encode(resume_text, convert_to_tensor=True)
+    matches = []
+    for job in jobs:
+        job_embedding = matcher.model.encode(matcher.job_text(job), convert_to_tensor=True)
+        score = util.pytorch_cos_sim(resume_embedding, job_embedding)[0][0].item()
+        matches.append({"job": job, "match_score": score * 100})
+    return matches
+
+
+def jobs_per_sec(func, jobs: list) -> float:
+    started = time.perf_counter()
+    func(jobs)
+    return len(jobs) / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark job matching throughput")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 10000], help="Job-list sizes")
+    parser.add_argument("--batch-size", type=int, default=64, help="Encode batch size (default: 64)")
+    parser.add_argument("--legacy-limit", type=int, default=1000,
+                        help="Skip the per-job legacy loop above this size (default: 1000)")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    matcher = JobMatcher(batch_size=args.batch_size)
+    if not matcher.model:
+        raise SystemExit("❌ SentenceTransformer model could not be loaded")
+
+    # Warm up so the first measurement doesn't include lazy initialization
+    matcher.match_resume_to_jobs(RESUME_TEXT, synthetic_jobs(4))
+
+    print(f"{'jobs':>8} {'legacy jobs/sec':>16} {'batched jobs/sec':>17} {'speedup':>8}")
+    for size in args.sizes:
+        jobs = synthetic_jobs(size)
+        batched = jobs_per_sec(lambda j: matcher.match_resume_to_jobs(RESUME_TEXT, j), jobs)
+        if size <= args.legacy_limit:
+            legacy = jobs_per_sec(lambda j: legacy_match(matcher, RESUME_TEXT, j), jobs)
+            print(f"{size:>8} {legacy:>16.1f} {batched:>17.1f} {batched / legacy:>7.1f}x")
+        else:
+            print(f"{size:>8} {'skipped':>16} {batched:>17.1f} {'-':>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+AutoHire AI - Pagination Benchmark
+Walks a paginated stand-in for the LinkedIn search results with
+iter_linkedin_jobs and reports time to the first job, total time and pages
+fetched for different prefetch depths, then how many page requests an early
+stop saves.
+
+Usage:
+    python benchmarks/pagination_benchmark.py [--jobs 200] [--results 500] [--latency-ms 200]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import http_cache, http_client, web_scraper
+from src.rate_limit import HostRateLimiter
+from benchmarks.http_client_benchmark import result_page_html, start_stand_in_server
+
+
+def walk(max_jobs: int, prefetch: int, stop_after: int = None):
+    """(seconds to first job, total seconds, jobs, requests) of one paginated search."""
+    http_client.metrics.reset()
+    first = None
+    jobs = 0
+    started = time.perf_counter()
+    stream = web_scraper.iter_linkedin_jobs("python developer", "India", max_jobs=max_jobs, prefetch=prefetch)
+    for _ in stream:
+        if first is None:
+            first = time.perf_counter() - started
+        jobs += 1
+        if stop_after is not None and jobs >= stop_after:
+            stream.close()
+            break
+    total = time.perf_counter() - started
+    time.sleep(0.5)  # let cancelled prefetches settle before counting requests
+    return first or 0.0, total, jobs, http_client.metrics.snapshot()["requests"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark paginated, prefetching job scraping")
+    parser.add_argument("--jobs", type=int, default=200, help="Job budget per search (default: 200)")
+    parser.add_argument("--results", type=int, default=500, help="Results the server has (default: 500)")
+    parser.add_argument("--latency-ms", type=float, default=200, help="Simulated server latency (default: 200)")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    page_size = web_scraper.SCRAPE_PAGE_SIZE
+    server = start_stand_in_server(lambda start: result_page_html(max(0, min(page_size, args.results - start)), start),
+                                   latency_seconds=args.latency_ms / 1000)
+    web_scraper.LINKEDIN_SEARCH_URL = f"http://127.0.0.1:{server.server_address[1]}/jobs/search"
+    web_scraper.rate_limiter = HostRateLimiter(rate=1e6, capacity=1000)  # measure fetching, not politeness
+    http_cache.HTTP_CACHE_DIR = ""
+    http_cache.HTTP_CACHE_MODE = ""
+
+    print(f"🌐 stand-in server with {args.results} results, {page_size}/page, {args.latency_ms:.0f} ms latency; "
+          f"budget {args.jobs} jobs")
+    print(f"   {'prefetch':>8} {'first job':>10} {'total':>9} {'jobs':>6} {'requests':>9}")
+    for prefetch in (1, 2, 4, 8):
+        first, total, jobs, requests = walk(args.jobs, prefetch)
+        print(f"   {prefetch:>8} {first * 1000:>8.0f}ms {total:>8.2f}s {jobs:>6} {requests:>9}")
+
+    stop_after = page_size + 5
+    first, total, jobs, requests = walk(args.jobs, 2, stop_after=stop_after)
+    print(f"\n   Early stop after {stop_after} jobs (prefetch 2): {total:.2f}s, {requests} requests")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
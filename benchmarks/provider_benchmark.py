@@ -0,0 +1,69 @@
+"""
+AutoHire AI - Job Provider Benchmark
+Fans a set of searches out to local stub providers (a fast one, an
+overlapping one, one slower than the deadline and one that always fails)
+and reports time to the first job, total time, unique jobs after
+cross-source dedup and the per-provider metrics.
+
+Usage:
+    python benchmarks/provider_benchmark.py [--queries 6] [--deadline 2] [--slow-seconds 10]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.job_providers import ProviderMetrics, StubProvider, search_providers
+from src.search_executor import build_queries
+
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli"]
+
+
+def stub_jobs(count: int, source: str, link_prefix: str):
+    return [{"title": f"Python Developer {i}", "company": COMPANIES[i % len(COMPANIES)], "location": "Pune, India",
+             "link": f"{link_prefix}/{i}", "source": source} for i in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark concurrent job providers")
+    parser.add_argument("--queries", type=int, default=6, help="Searches (default: 6)")
+    parser.add_argument("--deadline", type=float, default=2.0, help="Search deadline in seconds (default: 2)")
+    parser.add_argument("--slow-seconds", type=float, default=10.0, help="Latency of the slow provider (default: 10)")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    providers = [
+        StubProvider("fast", stub_jobs(40, "Fast", "https://fast.example/jobs"), latency_seconds=0.05),
+        # Lists half of the fast provider's postings under its own links (and Indeed-style field names)
+        StubProvider("overlap", [{"jobtitle": job["title"], "company": job["company"], "formattedLocation": job["location"],
+                                  "url": f"https://overlap.example/view?id={i}"}
+                                 for i, job in enumerate(stub_jobs(20, "Overlap", ""))], latency_seconds=0.3),
+        StubProvider("slow", stub_jobs(40, "Slow", "https://slow.example/jobs"), latency_seconds=args.slow_seconds),
+        StubProvider("failing", error=ConnectionError("service unavailable"), latency_seconds=0.1),
+    ]
+    queries = build_queries([f"python {i}" for i in range(args.queries)], "India", "", "intern")
+    provider_metrics = ProviderMetrics()
+
+    print(f"🔌 {len(providers)} providers x {len(queries)} queries, deadline {args.deadline:.1f}s, "
+          f"slow provider {args.slow_seconds:.1f}s")
+    started = time.perf_counter()
+    first = None
+    jobs = []
+    for job in search_providers(providers, queries, deadline_seconds=args.deadline, provider_metrics=provider_metrics):
+        if first is None:
+            first = time.perf_counter() - started
+        jobs.append(job)
+    total = time.perf_counter() - started
+
+    print(f"   first job after {first * 1000:.0f} ms, done after {total:.2f}s")
+    print(f"   {len(jobs)} unique jobs (sources: {sorted({job['source'] for job in jobs})})")
+    print(json.dumps(provider_metrics.snapshot(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+AutoHire AI - Resume Chunking Benchmark
+Compares the old truncating resume embedding with section-aware chunked
+embeddings (mean and max pooling): encode latency, how much of each resume
+the model actually sees, how much the job ranking changes, and how many jobs
+clear the match threshold. For the chunked poolings it also prints the
+threshold that would pass as many jobs as truncation does at --min-score,
+and finally the median over all resumes as the MIN_MATCH_SCORE_MEAN/_MAX
+settings to use before switching RESUME_POOLING.
+
+Usage:
+    python benchmarks/resume_chunking_benchmark.py [--data-dir data] [--jobs 200] [--top-k 10] [--min-score 30]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.job_matcher_benchmark import synthetic_jobs
+from src.job_matcher import MIN_MATCH_SCORE, JobMatcher
+from src.parser import extract_text_from_pdf
+from src.resume_chunker import chunk_resume
+
+POOLINGS = ["truncate", "mean", "max"]
+
+
+def spearman(a: np.ndarray, b: np.ndarray) -> float:
+    """Spearman rank correlation (no tie correction; scores are continuous)."""
+    rank_a = np.argsort(np.argsort(a))
+    rank_b = np.argsort(np.argsort(b))
+    return float(np.corrcoef(rank_a, rank_b)[0, 1])
+
+
+def top_k_overlap(a: np.ndarray, b: np.ndarray, k: int) -> float:
+    return len(set(np.argsort(-a)[:k]) & set(np.argsort(-b)[:k])) / k
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark chunked vs truncated resume embeddings")
+    parser.add_argument("--data-dir", default="data", help="Folder of PDF resumes (default: data)")
+    parser.add_argument("--jobs", type=int, default=200, help="Synthetic jobs to rank (default: 200)")
+    parser.add_argument("--top-k", type=int, default=10, help="Top-k used for overlap (default: 10)")
+    parser.add_argument("--min-score", type=float, default=MIN_MATCH_SCORE,
+                        help=f"Match threshold used with truncation (default: MIN_MATCH_SCORE, {MIN_MATCH_SCORE:g})")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    matchers = {pooling: JobMatcher(pooling=pooling) for pooling in POOLINGS}
+    model = matchers["truncate"].model
+    if not model:
+        raise SystemExit("❌ SentenceTransformer model could not be loaded")
+    jobs = synthetic_jobs(args.jobs)
+    job_vectors = matchers["truncate"].encode_jobs(jobs)
+    job_vectors = job_vectors / np.linalg.norm(job_vectors, axis=1, keepdims=True)
+    equivalents = {pooling: [] for pooling in POOLINGS if pooling != "truncate"}
+
+    for filename in sorted(os.listdir(args.data_dir)):
+        if not filename.lower().endswith(".pdf"):
+            continue
+        text = extract_text_from_pdf(os.path.join(args.data_dir, filename))
+        word_pieces = len(model.tokenizer(text, add_special_tokens=True)["input_ids"])
+        seen = min(1.0, model.max_seq_length / word_pieces)
+        print(f"\n📄 {filename}: {word_pieces} word pieces, truncation sees {seen:.0%}, "
+              f"{len(chunk_resume(text, matchers['mean'].chunk_words))} chunks")
+
+        scores = {}
+        for pooling, matcher in matchers.items():
+            started = time.perf_counter()
+            vector = matcher.encode_resume(text)
+            cold = time.perf_counter() - started
+            started = time.perf_counter()
+            matcher.encode_resume(text)
+            warm = time.perf_counter() - started
+            # match_score scale (0-100), as in JobMatcher.match_many
+            scores[pooling] = (job_vectors @ (vector / np.linalg.norm(vector))) * 100
+            passing = float(np.mean(scores[pooling] >= args.min_score))
+            line = (f"   {pooling:<9} encode {cold * 1000:7.1f} ms (cached {warm * 1000:.2f} ms)"
+                    f" | >= {args.min_score:g}: {passing:4.0%}")
+            if pooling != "truncate":
+                baseline = float(np.mean(scores["truncate"] >= args.min_score))
+                equivalent = np.quantile(scores[pooling], 1 - baseline) if baseline else float("nan")
+                if baseline:
+                    equivalents[pooling].append(equivalent)
+                line += (f" | spearman vs truncate {spearman(scores['truncate'], scores[pooling]):.3f}"
+                         f" | top-{args.top_k} overlap {top_k_overlap(scores['truncate'], scores[pooling], args.top_k):.0%}"
+                         f" | equivalent threshold {equivalent:.1f}")
+            print(line)
+
+    print(f"\n🎯 Thresholds matching truncation at {args.min_score:g} (median over resumes):")
+    for pooling, values in equivalents.items():
+        print(f"   MIN_MATCH_SCORE_{pooling.upper()}={np.median(values):.1f}" if values else
+              f"   MIN_MATCH_SCORE_{pooling.upper()}: no resume had jobs clearing {args.min_score:g} with truncation")
+
+
+if __name__ == "__main__":
+    main()
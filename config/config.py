@@ -30,6 +30,37 @@ class Config:
     SQLALCHEMY_DATABASE_URI = DATABASE_URL or 'sqlite:///autohire.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
+    # Scraped job store (SQLite, WAL mode)
+    JOB_STORE_PATH = os.environ.get('JOB_STORE_PATH', 'data/jobs.db')
+    JOB_STORE_MAX_AGE_HOURS = float(os.environ.get('JOB_STORE_MAX_AGE_HOURS', 12))
+    
+    # Job Search Configuration
+    SEARCH_MAX_WORKERS = int(os.environ.get('SEARCH_MAX_WORKERS', 8))
+    SEARCH_DEADLINE_SECONDS = float(os.environ.get('SEARCH_DEADLINE_SECONDS', 30))
+    SCRAPE_RATE_PER_HOST = float(os.environ.get('SCRAPE_RATE_PER_HOST', 1.0))
+    SCRAPE_BURST = int(os.environ.get('SCRAPE_BURST', 3))
+    SCRAPE_MAX_JOBS = int(os.environ.get('SCRAPE_MAX_JOBS', 50))
+    SCRAPE_PAGE_SIZE = int(os.environ.get('SCRAPE_PAGE_SIZE', 25))
+    SCRAPE_PREFETCH_PAGES = int(os.environ.get('SCRAPE_PREFETCH_PAGES', 2))
+    ENRICH_MAX_JOBS = int(os.environ.get('ENRICH_MAX_JOBS', 40))
+    ENRICH_WORKERS = int(os.environ.get('ENRICH_WORKERS', 6))
+    ENRICH_BUDGET_SECONDS = float(os.environ.get('ENRICH_BUDGET_SECONDS', 8))
+    ENRICH_RATE_PER_HOST = float(os.environ.get('ENRICH_RATE_PER_HOST', 2.0))
+    ENRICH_BURST = int(os.environ.get('ENRICH_BURST', 3))
+    ENRICH_CACHE_TTL_HOURS = float(os.environ.get('ENRICH_CACHE_TTL_HOURS', 24))
+    ENRICH_DESCRIPTION_CHARS = int(os.environ.get('ENRICH_DESCRIPTION_CHARS', 5000))
+    CARD_PARSER = os.environ.get('CARD_PARSER', '')  # "lxml", "strainer" or "soup"; empty picks lxml, or strainer without it
+    HTTP_POOL_MAXSIZE = int(os.environ.get('HTTP_POOL_MAXSIZE', 16))
+    HTTP_POOL_CONNECTIONS = int(os.environ.get('HTTP_POOL_CONNECTIONS', 8))
+    HTTP_MAX_RETRIES = int(os.environ.get('HTTP_MAX_RETRIES', 3))
+    HTTP_BACKOFF_BASE = float(os.environ.get('HTTP_BACKOFF_BASE', 0.5))
+    HTTP_BACKOFF_MAX = float(os.environ.get('HTTP_BACKOFF_MAX', 30))
+    HTTP_CACHE_DIR = os.environ.get('HTTP_CACHE_DIR', 'data/cache/http')
+    HTTP_CACHE_TTL_SECONDS = float(os.environ.get('HTTP_CACHE_TTL_SECONDS', 15 * 60))
+    HTTP_CACHE_MAX_BYTES = int(os.environ.get('HTTP_CACHE_MAX_BYTES', 100 * 1024 * 1024))
+    HTTP_CACHE_MODE = os.environ.get('HTTP_CACHE_MODE', '')  # "", "record" or "replay"
+    HTTP_FIXTURES_DIR = os.environ.get('HTTP_FIXTURES_DIR', 'data/fixtures/http')
+    
     # Security Configuration
     SESSION_COOKIE_SECURE = os.environ.get('SESSION_COOKIE_SECURE', 'False').lower() == 'true'
     SESSION_COOKIE_HTTPONLY = True
@@ -45,23 +76,49 @@ class Config:
     # AI Model Configuration
     AI_MODEL_PATH = os.environ.get('AI_MODEL_PATH', 'models/')
     AI_CONFIDENCE_THRESHOLD = float(os.environ.get('AI_CONFIDENCE_THRESHOLD', 0.7))
+    CLASSIFY_BATCH_SIZE = int(os.environ.get('CLASSIFY_BATCH_SIZE', 64))
+    CLASSIFY_N_PROCESS = int(os.environ.get('CLASSIFY_N_PROCESS', 1))
     
     # Job Matching Configuration
     MAX_JOB_MATCHES = int(os.environ.get('MAX_JOB_MATCHES', 10))
     JOB_MATCH_THRESHOLD = float(os.environ.get('JOB_MATCH_THRESHOLD', 0.6))
+    JOB_MATCH_BATCH_SIZE = int(os.environ.get('JOB_MATCH_BATCH_SIZE', 64))
+    JOB_EMBEDDING_CACHE_DIR = os.environ.get('JOB_EMBEDDING_CACHE_DIR', 'data/cache/job_embeddings')
+    EMBEDDING_CACHE_MAX_ROWS = int(os.environ.get('EMBEDDING_CACHE_MAX_ROWS', 500000))
+    EMBEDDING_CACHE_MAX_AGE_DAYS = float(os.environ.get('EMBEDDING_CACHE_MAX_AGE_DAYS', 30))
+    RESUME_POOLING = os.environ.get('RESUME_POOLING', 'truncate')
+    RESUME_CHUNK_WORDS = int(os.environ.get('RESUME_CHUNK_WORDS', 150))
+    MIN_MATCH_SCORE = float(os.environ.get('MIN_MATCH_SCORE', 30))
+    MIN_MATCH_SCORE_MEAN = float(os.environ.get('MIN_MATCH_SCORE_MEAN', MIN_MATCH_SCORE))
+    MIN_MATCH_SCORE_MAX = float(os.environ.get('MIN_MATCH_SCORE_MAX', MIN_MATCH_SCORE))
+    EMBEDDING_BACKEND = os.environ.get('EMBEDDING_BACKEND', 'fp32')  # fp32, int8 or onnx
+    ONNX_MODEL_FILE = os.environ.get('ONNX_MODEL_FILE', '')
+    JOB_MATCH_SHORTLIST = int(os.environ.get('JOB_MATCH_SHORTLIST', 0))
+    JOB_INDEX_DIR = os.environ.get('JOB_INDEX_DIR', 'data/cache/job_index')
+    JOB_INDEX_BACKEND = os.environ.get('JOB_INDEX_BACKEND', '')
+    JOB_TEXT_DESCRIPTION_WORDS = int(os.environ.get('JOB_TEXT_DESCRIPTION_WORDS', 120))
     
     # Resume Analysis Configuration
     MAX_RESUMES_PER_USER = int(os.environ.get('MAX_RESUMES_PER_USER', 3))
     RESUME_ANALYSIS_TIMEOUT = int(os.environ.get('RESUME_ANALYSIS_TIMEOUT', 30))
     
+    # PDF Extraction Configuration
+    PDF_EXTRACTOR = os.environ.get('PDF_EXTRACTOR', 'pdfplumber')
+    PDF_PARALLEL = os.environ.get('PDF_PARALLEL', 'False').lower() == 'true'
+    PDF_PARALLEL_WORKERS = int(os.environ.get('PDF_PARALLEL_WORKERS', os.cpu_count() or 1))
+    PDF_PARALLEL_PAGE_THRESHOLD = int(os.environ.get('PDF_PARALLEL_PAGE_THRESHOLD', 16))
+    
     # Performance Configuration
     CACHE_TYPE = os.environ.get('CACHE_TYPE', 'simple')
     CACHE_DEFAULT_TIMEOUT = int(os.environ.get('CACHE_DEFAULT_TIMEOUT', 300))
     
-    # External API Configuration (for future use)
+    # External API Configuration (job search APIs are used by src/job_providers.py)
     OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY')
     LINKEDIN_API_KEY = os.environ.get('LINKEDIN_API_KEY')
     INDEED_API_KEY = os.environ.get('INDEED_API_KEY')
+    LINKEDIN_API_URL = os.environ.get('LINKEDIN_API_URL', '')
+    INDEED_API_URL = os.environ.get('INDEED_API_URL', '')
+    PROVIDER_TIMEOUT_SECONDS = float(os.environ.get('PROVIDER_TIMEOUT_SECONDS', 10))
 
 class DevelopmentConfig(Config):
     """Development configuration."""
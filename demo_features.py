@@ -144,10 +144,9 @@ def demo_integration():
         
         # Match to jobs
         print("\n💼 Job Matching:")
-        matches = matcher.match_resume_to_jobs(resume_text, top_n=2)
-        for i, match in enumerate(matches, 1):
-            job = match["job"]
-            score = match["match_score"]
+        matches = matcher.search_jobs(resume_text, top_k=2)
+        for i, job in enumerate(matches, 1):
+            score = job["match_score"]
             print(f"   {i}. {job['title']} - {score:.1f}% match")
         
         print("\n✅ Integration demo completed successfully!")
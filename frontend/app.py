@@ -9,6 +9,7 @@ from flask_cors import CORS
 import os
 import sys
 import logging
+import threading
 from datetime import datetime
 
 # Add parent directory to path for backend imports
@@ -16,9 +17,11 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import backend modules
 from src.resume_manager import ResumeManager
-from src.job_matcher import JobMatcher
+from src.job_matcher import EMBEDDING_BACKEND, JobMatcher, model_key
 from src.resume_optimizer import ResumeOptimizer
 from src.parser import extract_text_from_pdf
+from src.model_registry import registry
+from src.job_store import get_job_store
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -141,8 +144,9 @@ def analyze_resume(resume_id):
         # Analyze resume
         analysis = resume_optimizer.analyze_resume(resume_text)
         
-        # Get job matches
-        job_matches = job_matcher.match_resume_to_jobs(resume_text, top_n=5)
+        # Nearest jobs in the vector index of every job seen so far
+        job_matches = [{"match_score": job.pop("match_score"), "job": job}
+                       for job in job_matcher.search_jobs(resume_text, top_k=5)]
         
         return jsonify({
             'success': True,
@@ -166,14 +170,17 @@ def get_jobs():
         if request.args.get('location'):
             filters['location'] = request.args.get('location')
         if request.args.get('type'):
-            filters['type'] = request.args.get('type')
+            filters['work_model'] = request.args.get('type')
         if request.args.get('experience'):
             filters['experience_level'] = request.args.get('experience')
         
+        # Both paths match location as a case-insensitive prefix and the other
+        # filters exactly, against the job store's normalized values
         if query:
             jobs = job_matcher.search_jobs(query, filters)
         else:
-            jobs = job_matcher.get_all_jobs()
+            # Everything scraped so far, newest first
+            jobs = get_job_store().find_jobs(**filters)
         
         return jsonify({
             'success': True,
@@ -185,6 +192,11 @@ def get_jobs():
         logger.error(f"Jobs error: {e}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/models')
+def get_model_metrics():
+    """API endpoint for model load state, load/warm-up times and memory."""
+    return jsonify({'success': True, 'models': registry.metrics()})
+
 @app.route('/api/resumes')
 def get_resumes():
     """API endpoint for user's resume list."""
@@ -229,6 +241,9 @@ if __name__ == '__main__':
     logger.info("🚀 Starting AutoHire AI 3D Interactive Web Application...")
     logger.info("✨ 3D Cyberpunk Career Hub is launching...")
     
+    # Models load lazily on first request; warm them up in the background instead
+    threading.Thread(target=registry.warmup, args=([model_key(EMBEDDING_BACKEND)],), daemon=True).start()
+    
     # Development server
     app.run(
         host='0.0.0.0',
@@ -1,18 +1,32 @@
+import argparse
+import json
 import logging
 import os
+import sys
+import threading
 import time
 import textwrap
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from src.parser import extract_text_from_pdf
-from src.job_matcher import JobMatcher
+from src.job_matcher import EMBEDDING_BACKEND, JobMatcher, model_key
+from src.model_registry import registry
 from src.web_scraper import scrape_linkedin_jobs
+from src.job_store import get_job_store
+from src.search_executor import build_queries
+from src.job_providers import default_providers, search_providers
+from src.job_enricher import JobEnricher
+from src.keyword_classifier import categorize_resumes
 from src.ai_analyzer import *
 from src.report_generator import generate_pdf_report
 from src.email_sender import send_email_with_attachment
 
+# A search stops once this many jobs clear the matcher's min_match_score
+MATCH_TARGET = 25
 
 
-def run_single_resume_analysis(resume_path: str):
-    job_matcher = JobMatcher()
+
+def run_single_resume_analysis(resume_path: str, job_matcher: JobMatcher = None):
+    job_matcher = job_matcher or JobMatcher()
     print(f"📄 Processing: {os.path.basename(resume_path)}")
 
     # --- Extract Resume Text ---
@@ -110,19 +124,34 @@ def print_ats_chart(ats_data: dict):
         print(f"   - {category:<25} [{cat_bar}] {score}/100")
         print(f"     └─ {feedback}")
 
-def perform_job_search(job_matcher, resume_text, search_terms, work_model, experience_level, location):
-    all_jobs = []; seen_jobs = set()
-    print(f"\n🧠 Using your AI-generated profile for a targeted search...")
-    for term in search_terms:
-        print(f"   - Searching LinkedIn for '{term}' in {location}...")
-        scraped_jobs = scrape_linkedin_jobs(term, location, work_model, experience_level)
-        for job in scraped_jobs:
-            job_key = (job['title'], job['company'])
-            if job_key not in seen_jobs:
-                all_jobs.append(job); seen_jobs.add(job_key)
-    matches = job_matcher.match_resume_to_jobs(resume_text, all_jobs)
-    matches.sort(key=lambda x: x['match_score'], reverse=True)
-    return [m for m in matches if m["match_score"] >= 30.0]
+def perform_job_search(job_matcher, resume_text, search_terms, work_model, experience_level, location, verbose=True, job_store=None, providers=None):
+    """
+    experience_level and location may also be lists; every combination with each term is
+    searched concurrently on every provider (default: LinkedIn plus the configured job APIs).
+    """
+    job_store = job_store or get_job_store()
+    queries = build_queries(search_terms, location, work_model, experience_level)
+
+    # Fresh results of an earlier identical LinkedIn search come from the job store
+    def fetch_linkedin(term, query_location, query_work_model, level):
+        return job_store.get_or_fetch(term, query_location, query_work_model, level, scrape_linkedin_jobs)
+
+    providers = providers or default_providers(linkedin_fetch=fetch_linkedin)
+    if verbose:
+        print(f"\n🧠 Using your AI-generated profile for a targeted search...")
+        print(f"   - Searching {', '.join(provider.name for provider in providers)} for "
+              f"{', '.join(repr(term) for term in search_terms)} in {location}...")
+
+    # Jobs are scored on their card text as their searches finish; once MATCH_TARGET
+    # of them clear min_match_score (set per resume pooling) the searches still waiting are cancelled
+    matches = job_matcher.match_stream(resume_text, search_providers(providers, queries),
+                                       min_score=job_matcher.min_match_score, enough=MATCH_TARGET)
+    # Only the best MATCH_TARGET of those get their description and skills fetched
+    # from the detail page (cached for a day); enriched matches are rescored on the fuller text
+    jobs = [match["job"] for match in matches]
+    if JobEnricher(job_store=job_store).enrich(jobs, limit=MATCH_TARGET):
+        matches = job_matcher.match_many([resume_text], jobs, min_score=job_matcher.min_match_score, shortlist=0)[0]
+    return matches
 
 def display_job_results(matches, resume_text):
     if not matches:
@@ -163,9 +192,154 @@ def select_resume_from_list(pdf_files: list) -> str or None:
     except ValueError:
         print("❌ Invalid input. Please enter a number."); return None
 
+BATCH_DEFAULTS = {
+    "input_dir": "data",
+    "output_dir": "reports",
+    "results_file": None,
+    "location": "India",
+    "work_model": "hybrid",
+    "workers": 4,
+    "email": None,
+}
+
+def analyze_resume_headless(resume_path: str, job_matcher, options: dict) -> dict:
+    """Run the full analysis for one resume without prompting and return a JSON-serializable record."""
+    started = time.time()
+    student_name = os.path.basename(resume_path).replace(".pdf", "")
+    record = {"resume": resume_path, "student_name": student_name, "status": "ok"}
+    try:
+        resume_text = extract_text_from_pdf(resume_path)
+        record.update(categorize_resumes([resume_text])[0])
+
+        summary, search_keywords = create_knowledge_set(resume_text); time.sleep(1)
+        suggestions = generate_resume_suggestions(resume_text); time.sleep(1)
+        ats_data = get_ats_score_and_feedback(resume_text); time.sleep(1)
+        ai_experience_level = analyze_experience_level(resume_text)
+
+        location, work_model = options["location"], options["work_model"]
+        internship_matches = []
+        if ai_experience_level == "Fresher":
+            internship_matches = perform_job_search(job_matcher, resume_text, search_keywords, work_model, "intern", location, verbose=False)
+        entry_level_matches = perform_job_search(job_matcher, resume_text, search_keywords, work_model, "entry-level", location, verbose=False)
+
+        all_matches = internship_matches + entry_level_matches
+        rationales = generate_all_rationales_in_batch(resume_text, [match["job"] for match in all_matches])
+        for i, match in enumerate(all_matches, 1):
+            match["rationale"] = rationales.get(str(i), "N/A")
+
+        pdf_path = generate_pdf_report(
+            student_name=student_name,
+            summary=summary,
+            skills=search_keywords,
+            target_roles=search_keywords,
+            ats_data=ats_data,
+            job_matches=all_matches,
+            suggestions=suggestions,
+            filename=os.path.join(options["output_dir"], f"{student_name}_AI_Report.pdf")
+        )
+
+        record.update({
+            "summary": summary,
+            "search_keywords": search_keywords,
+            "experience_level": ai_experience_level,
+            "ats_score": ats_data.get("overall_score"),
+            "internship_matches": internship_matches,
+            "entry_level_matches": entry_level_matches,
+            "report_path": pdf_path,
+        })
+
+        if options.get("email"):
+            subject = f"AI Resume Analysis Report - {student_name}"
+            body = f"Hello,\n\nPlease find attached the AI-powered resume analysis and job matching report for {student_name}.\n\nBest regards,\nAutoHire AI"
+            record["email_sent"] = send_email_with_attachment(options["email"], subject, body, pdf_path)
+
+    except Exception as e:
+        logging.error(f"Batch analysis failed for {resume_path}: {e}", exc_info=True)
+        record.update({"status": "error", "error": str(e)})
+
+    record["elapsed_seconds"] = round(time.time() - started, 2)
+    return record
+
+def run_batch(options: dict) -> int:
+    """
+    Analyze every PDF in options["input_dir"] concurrently.
+
+    Writes one JSON-lines record per resume to options["results_file"] as
+    soon as it finishes (the file is overwritten, so a rerun doesn't
+    duplicate rows), plus a PDF report per resume in options["output_dir"].
+
+    Returns:
+        int: Number of resumes that failed
+    """
+    pdf_files = sorted(find_all_pdfs(options["input_dir"]))
+    if not pdf_files:
+        logging.error(f"No PDF resumes found in '{options['input_dir']}'")
+        return 0
+
+    os.makedirs(options["output_dir"], exist_ok=True)
+    results_file = options["results_file"] or os.path.join(options["output_dir"], "results.jsonl")
+    workers = max(1, int(options["workers"]))
+    logging.info(f"Batch analyzing {len(pdf_files)} resumes with {workers} workers -> {results_file}")
+
+    # Load and warm up the embedding model once, before the workers start
+    job_matcher = JobMatcher()
+    for name, metrics in registry.warmup([model_key(EMBEDDING_BACKEND)]).items():
+        logging.info(f"Model '{name}': loaded in {metrics['load_seconds']}s, warm-up {metrics['warmup_seconds']}s")
+    write_lock = threading.Lock()
+    failures = 0
+
+    with open(results_file, "w", encoding="utf-8") as out, ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(analyze_resume_headless, path, job_matcher, options): path for path in pdf_files}
+        for done, future in enumerate(as_completed(futures), 1):
+            record = future.result()
+            if record["status"] != "ok":
+                failures += 1
+            with write_lock:
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                out.flush()
+            logging.info(f"[{done}/{len(pdf_files)}] {record['status']}: {os.path.basename(record['resume'])} ({record['elapsed_seconds']}s)")
+
+    logging.info(f"Batch complete: {len(pdf_files) - failures} succeeded, {failures} failed")
+    return failures
+
+def load_batch_options(args) -> dict:
+    """Merge batch defaults, an optional JSON config file and command-line flags (highest priority)."""
+    options = dict(BATCH_DEFAULTS)
+    if args.config:
+        with open(args.config, "r", encoding="utf-8") as f:
+            options.update(json.load(f))
+    for key in BATCH_DEFAULTS:
+        value = getattr(args, key, None)
+        if value is not None:
+            options[key] = value
+    return options
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="AutoHire AI resume analysis")
+    parser.add_argument("--batch", action="store_true", help="Analyze every resume in --input-dir without prompting")
+    parser.add_argument("--config", help="JSON file with batch options (flags override it)")
+    parser.add_argument("--input-dir", dest="input_dir", help="Directory of PDF resumes (default: data)")
+    parser.add_argument("--output-dir", dest="output_dir", help="Directory for PDF reports (default: reports)")
+    parser.add_argument("--results-file", dest="results_file", help="JSON-lines output (default: <output-dir>/results.jsonl)")
+    parser.add_argument("--location", help="Job search location (default: India)")
+    parser.add_argument("--work-model", dest="work_model", help="Work model, e.g. remote or hybrid (default: hybrid)")
+    parser.add_argument("--workers", type=int, help="Resumes processed concurrently (default: 4)")
+    parser.add_argument("--email", help="Email every report to this address")
+    return parser.parse_args(argv)
+
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    args = parse_args()
+    if args.batch:
+        # Unattended runs report failure through the exit status
+        try:
+            failures = run_batch(load_batch_options(args))
+        except Exception as e:
+            logging.error(f"Batch run failed: {e}", exc_info=True)
+            sys.exit(1)
+        sys.exit(1 if failures else 0)
+
     try:
-        logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
         data_directory = "data"
         pdf_files = find_all_pdfs(data_directory)
 
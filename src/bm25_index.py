@@ -0,0 +1,94 @@
+# src/bm25_index.py
+
+import math
+from collections import Counter
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from .keyword_index import tokenize
+
+# Common English words that carry no signal for job matching
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our that the their this to was "
+    "were will with we you your".split()
+)
+
+
+def lexical_tokens(text: str) -> List[str]:
+    """Tokens used for BM25: keyword_index tokens minus stopwords."""
+    return [token for token in tokenize(text) if token not in STOPWORDS]
+
+
+class BM25Index:
+    """
+    Inverted index over short documents (job postings) with Okapi BM25 scoring.
+
+    Postings are kept per term as NumPy arrays of (document, term frequency),
+    so scoring a long query such as a whole resume is a handful of vectorized
+    scatter-adds rather than a loop over documents.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Tuple[List[int], List[int]]] = {}
+        self._arrays: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._lengths: List[int] = []
+
+    @classmethod
+    def from_texts(cls, texts: Sequence[str], **kwargs) -> "BM25Index":
+        index = cls(**kwargs)
+        index.add(texts)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def add(self, texts: Sequence[str]) -> List[int]:
+        """Index documents; returns their document numbers."""
+        numbers = []
+        for text in texts:
+            number = len(self._lengths)
+            tokens = lexical_tokens(text)
+            self._lengths.append(len(tokens))
+            for term, frequency in Counter(tokens).items():
+                docs, frequencies = self._postings.setdefault(term, ([], []))
+                docs.append(number)
+                frequencies.append(frequency)
+                self._arrays.pop(term, None)
+            numbers.append(number)
+        return numbers
+
+    def _term_arrays(self, term: str) -> Tuple[np.ndarray, np.ndarray]:
+        arrays = self._arrays.get(term)
+        if arrays is None:
+            docs, frequencies = self._postings[term]
+            arrays = (np.array(docs, dtype=np.int64), np.array(frequencies, dtype=np.float32))
+            self._arrays[term] = arrays
+        return arrays
+
+    def scores(self, query: str) -> np.ndarray:
+        """BM25 score of every document for the query (distinct query terms count once)."""
+        count = len(self._lengths)
+        scores = np.zeros(count, dtype=np.float32)
+        if not count:
+            return scores
+        lengths = np.array(self._lengths, dtype=np.float32)
+        norms = self.k1 * (1 - self.b + self.b * lengths / max(lengths.mean(), 1e-6))
+        for term in set(lexical_tokens(query)):
+            if term not in self._postings:
+                continue
+            docs, frequencies = self._term_arrays(term)
+            idf = math.log(1 + (count - len(docs) + 0.5) / (len(docs) + 0.5))
+            scores[docs] += idf * frequencies * (self.k1 + 1) / (frequencies + norms[docs])
+        return scores
+
+    def top_k(self, query: str, k: int) -> np.ndarray:
+        """Document numbers of the k best BM25 matches, best first."""
+        scores = self.scores(query)
+        if k < len(scores):
+            candidates = np.argpartition(-scores, k - 1)[:k]
+        else:
+            candidates = np.arange(len(scores))
+        return candidates[np.argsort(-scores[candidates], kind="stable")]
@@ -0,0 +1,112 @@
+# src/card_parser.py
+
+import os
+import logging
+from typing import Dict, List
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Job card parser: "lxml" (XPath over an lxml tree, the fast path; lxml is in
+# requirements.txt), "strainer" (BeautifulSoup building only the base-card
+# subtrees, a fallback only modestly faster than soup) or "soup" (the full
+# html.parser tree); empty picks lxml when installed, otherwise strainer
+CARD_PARSERS = ("lxml", "strainer", "soup")
+CARD_PARSER = os.environ.get('CARD_PARSER', '')
+
+# (job field, tag, class) of the parts of a base-card
+CARD_FIELDS = (
+    ("title", "h3", "base-search-card__title"),
+    ("company", "h4", "base-search-card__subtitle"),
+    ("location", "span", "job-search-card__location"),
+    ("link", "a", "base-card__full-link"),
+)
+
+
+def has_class(name: str):
+    """Attribute matcher for one class among several (SoupStrainer sees the raw attribute)."""
+    def match(value) -> bool:
+        if not value:
+            return False
+        return name in (value.split() if isinstance(value, str) else value)
+    return match
+
+
+_CARD_STRAINER = SoupStrainer('div', attrs={'class': has_class('base-card')})
+
+
+def _class_xpath(tag: str, name: str) -> str:
+    return f"{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {name} ')]"
+
+
+_CARD_XPATH = f"//{_class_xpath('div', 'base-card')}"
+_FIELD_XPATHS = [(field, f".//{_class_xpath(tag, name)}") for field, tag, name in CARD_FIELDS]
+
+
+def _job(values: Dict) -> Dict:
+    return {
+        "title": values["title"],
+        "company": values["company"],
+        "location": values["location"],
+        "link": values["link"],
+        "source": "LinkedIn"
+    }
+
+
+def _parse_soup(soup: BeautifulSoup) -> List[Dict]:
+    jobs_list = []
+    for card in soup.find_all('div', class_='base-card'):
+        tags = {field: card.find(tag, class_=name) for field, tag, name in CARD_FIELDS}
+        if all(tags.values()):
+            values = {field: tag.get_text(strip=True) for field, tag in tags.items()}
+            values["link"] = tags["link"]['href']
+            jobs_list.append(_job(values))
+    return jobs_list
+
+
+def _parse_lxml(html: str) -> List[Dict]:
+    jobs_list = []
+    for card in lxml.html.fromstring(html).xpath(_CARD_XPATH):
+        values = {}
+        for field, xpath in _FIELD_XPATHS:
+            found = card.xpath(xpath)
+            if not found:
+                break
+            if field == "link":
+                values[field] = found[0].get('href')
+            else:
+                # Same text as BeautifulSoup's get_text(strip=True)
+                values[field] = "".join(text.strip() for text in found[0].itertext())
+        if len(values) == len(_FIELD_XPATHS) and values["link"] is not None:
+            jobs_list.append(_job(values))
+    return jobs_list
+
+
+def default_parser() -> str:
+    return CARD_PARSER or ("lxml" if LXML_AVAILABLE else "strainer")
+
+
+def parse_job_cards(html: str, parser: str = None) -> List[Dict]:
+    """
+    Jobs from the base-card elements of a LinkedIn search results page.
+
+    Every parser returns the same jobs. "lxml" parses the page in C and is
+    several times faster than BeautifulSoup; "strainer" only saves building
+    the soup tree outside the cards (see benchmarks/card_parser_benchmark.py).
+    """
+    parser = parser or default_parser()
+    if parser == "lxml":
+        if LXML_AVAILABLE:
+            return _parse_lxml(html)
+        logging.warning("lxml is not installed; parsing job cards with BeautifulSoup")
+        parser = "strainer"
+    if parser == "strainer":
+        return _parse_soup(BeautifulSoup(html, 'html.parser', parse_only=_CARD_STRAINER))
+    if parser == "soup":
+        return _parse_soup(BeautifulSoup(html, 'html.parser'))
+    raise ValueError(f"Unknown card parser '{parser}', expected one of {', '.join(CARD_PARSERS)}")
@@ -0,0 +1,140 @@
+# src/category_scorer.py
+
+import json
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+    logging.warning("scipy not available, batch category scoring will use dense matrices")
+
+from .keyword_engine import KeywordMatcher, normalize_tokens
+
+UNKNOWN_CATEGORY = "Unknown"
+
+
+def load_taxonomy(path: str) -> Dict[str, Dict]:
+    """
+    Load a category taxonomy from a JSON file.
+
+    Each category maps to {"weight": float, "keywords": ...} where keywords is
+    either a list (every keyword weighs 1.0) or an object of keyword -> weight:
+
+        {"SDE": {"weight": 1.0, "keywords": {"python": 2.0, "git": 0.5}}}
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        taxonomy = json.load(f)
+    for category, config in taxonomy.items():
+        if "keywords" not in config:
+            raise ValueError(f"Category '{category}' in {path} has no keywords")
+    return taxonomy
+
+
+class CategoryScorer:
+    """
+    Scores many resumes against a category taxonomy with two matrix products.
+
+    Every document is scanned once with a compiled keyword automaton to build
+    a sparse document x keyword hit matrix H; multiplying it by the keyword x
+    category weight matrix W gives all category scores at once. Keyword
+    matching follows ResumeIndex (whole tokens, presence counted once), so
+    with unit keyword weights the scores equal classify_resume's.
+    """
+
+    def __init__(self, taxonomy: Optional[Dict[str, Dict]] = None):
+        if taxonomy is None:
+            from .keyword_classifier import categories
+            taxonomy = categories
+        self.categories: List[str] = list(taxonomy)
+
+        # keyword -> {category index: weight}
+        keyword_weights: Dict[str, Dict[int, float]] = {}
+        for col, category in enumerate(self.categories):
+            config = taxonomy[category]
+            category_weight = float(config.get("weight", 1.0))
+            keywords = config["keywords"]
+            if not isinstance(keywords, dict):
+                keywords = {keyword: 1.0 for keyword in keywords}
+            for keyword, weight in keywords.items():
+                normalized = normalize_tokens(keyword)
+                if not normalized:
+                    continue
+                cell = keyword_weights.setdefault(normalized, {})
+                cell[col] = cell.get(col, 0.0) + category_weight * float(weight)
+
+        self.matcher = KeywordMatcher(keyword_weights, tokenized=True)
+        self.keywords = self.matcher.keywords
+
+        rows, cols, values = [], [], []
+        for row, keyword in enumerate(self.keywords):
+            for col, weight in keyword_weights[keyword].items():
+                rows.append(row)
+                cols.append(col)
+                values.append(weight)
+        shape = (len(self.keywords), len(self.categories))
+        if sparse is not None:
+            self.weights = sparse.csr_matrix((values, (rows, cols)), shape=shape, dtype=np.float64)
+        else:
+            self.weights = np.zeros(shape, dtype=np.float64)
+            np.add.at(self.weights, (rows, cols), values)
+
+    @classmethod
+    def from_file(cls, path: str) -> "CategoryScorer":
+        """Build a scorer from a JSON taxonomy file (see load_taxonomy)."""
+        return cls(load_taxonomy(path))
+
+    def hit_matrix(self, texts: Sequence[str]):
+        """Binary document x keyword matrix (sparse CSR when scipy is installed)."""
+        indptr, indices = [0], []
+        for text in texts:
+            indices.extend(sorted(self.matcher.find_ids(text)))
+            indptr.append(len(indices))
+        data = np.ones(len(indices), dtype=np.float64)
+        shape = (len(texts), len(self.keywords))
+        if sparse is not None:
+            return sparse.csr_matrix((data, np.array(indices, dtype=np.int64), np.array(indptr, dtype=np.int64)),
+                                     shape=shape)
+        hits = np.zeros(shape, dtype=np.float64)
+        for row in range(len(texts)):
+            hits[row, indices[indptr[row]:indptr[row + 1]]] = 1.0
+        return hits
+
+    def score(self, texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score a batch of resumes.
+
+        Returns:
+            tuple: (scores, top) where scores is an (n_docs, n_categories)
+            array in self.categories order and top is the argmax column per
+            document, or -1 when a document matched no keyword
+        """
+        scores = self.hit_matrix(texts) @ self.weights
+        scores = scores.toarray() if sparse is not None and sparse.issparse(scores) else np.asarray(scores)
+        top = np.argmax(scores, axis=1) if len(self.categories) else np.zeros(len(texts), dtype=np.int64)
+        top = np.where(scores.max(axis=1, initial=0.0) > 0, top, -1)
+        return scores, top
+
+    def classify(self, texts: Sequence[str]) -> List[Tuple[str, Dict[str, float]]]:
+        """classify_resume-compatible (top_category, scores_dict) tuples for a batch."""
+        scores, top = self.score(texts)
+        results = []
+        for row, col in zip(scores, top):
+            label = self.categories[col] if col >= 0 else UNKNOWN_CATEGORY
+            results.append((label, dict(zip(self.categories, row.tolist()))))
+        return results
+
+
+def classification_confidences(scores: np.ndarray) -> np.ndarray:
+    """Vectorized get_classification_confidence: max / sum per row, 0 for rows without hits."""
+    scores = np.asarray(scores, dtype=np.float64)
+    if scores.size == 0:
+        return np.zeros(scores.shape[0] if scores.ndim else 0)
+    totals = scores.sum(axis=1)
+    maxima = scores.max(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        confidence = np.where(totals > 0, maxima / totals, 0.0)
+    return np.minimum(confidence, 1.0)
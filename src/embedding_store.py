@@ -0,0 +1,334 @@
+# src/embedding_store.py
+
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .file_lock import file_lock
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_job_text(text: str) -> str:
+    """Collapse whitespace so trivially different copies of a posting share an embedding."""
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+class EmbeddingStore:
+    """
+    Disk-backed, memory-mapped store of text embeddings.
+
+    Vectors live in one append-only float32 file that is read through
+    np.memmap, so lookups don't load the whole store into RAM. The index
+    maps key -> (row, last_used); it is a JSON snapshot plus an append-only
+    journal of [key, row, last_used] lines, so a put only writes its new
+    entries. Access times from lookups are journaled in batches and on
+    flush(). Keys are the SHA-256 of the model name plus the normalized
+    text, so switching models never returns stale vectors. Rows that are no
+    longer referenced, or haven't been used for a while, are dropped by
+    compact().
+
+    Several processes (the web app and a batch run) may share a directory:
+    every read and write takes an advisory lock on it and first replays
+    whatever the others journaled, and new rows are numbered from the end
+    of the vector file rather than from this instance's view of it.
+    """
+
+    VECTORS_FILE = "vectors.f32"
+    INDEX_FILE = "index.json"
+    JOURNAL_FILE = "index.log"
+    LOCK_FILE = "lock"
+    # Access times are journaled once this many entries have been read
+    TOUCH_FLUSH_EVERY = 256
+
+    def __init__(self, directory: str, model_name: str, dim: int):
+        self.directory = directory
+        self.model_name = model_name
+        self.dim = dim
+        self._lock = threading.Lock()
+        self._vectors_path = os.path.join(directory, self.VECTORS_FILE)
+        self._index_path = os.path.join(directory, self.INDEX_FILE)
+        self._journal_path = os.path.join(directory, self.JOURNAL_FILE)
+        self._lock_path = os.path.join(directory, self.LOCK_FILE)
+        self._rows: Dict[str, List] = {}  # key -> [row, last_used]
+        self._touched = set()  # keys read since their access time was last written
+        self._generation = 0  # ties the journal to the snapshot it extends
+        self._snapshot_stat = None  # identity of the snapshot the index was loaded from
+        self._journal_offset = 0  # bytes of the journal already applied
+        self._journal_lines = 0
+        self._memmap: Optional[np.memmap] = None
+        self._row_count = 0
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+        with self._lock, self._file_lock():
+            self._sync()
+
+    def _file_lock(self):
+        return file_lock(self._lock_path)
+
+    def _stat(self, path: str):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_size, st.st_mtime_ns
+
+    def _sync(self):
+        """
+        Bring the in-memory index up to date with the files; caller holds both locks.
+        A new snapshot (another process saved or compacted) is reloaded in full,
+        otherwise only journal lines appended since the last sync are read.
+        """
+        bytes_on_disk = os.path.getsize(self._vectors_path) if os.path.exists(self._vectors_path) else 0
+        self._row_count = bytes_on_disk // (4 * self.dim)
+        intact = True
+        if self._stat(self._index_path) != self._snapshot_stat:
+            self._load_snapshot()
+            self._snapshot_stat = self._stat(self._index_path)
+            # Drop entries pointing past the end of the file (e.g. after a crash mid-append)
+            rows = {k: v for k, v in self._rows.items() if v[0] < self._row_count}
+            intact = len(rows) == len(self._rows)
+            self._rows = rows
+        if not self._replay_journal() or not intact:
+            self._save_index()
+
+    def _load_snapshot(self):
+        """Load the snapshot, discarding the store if it belongs to another model or dimension."""
+        self._rows = {}
+        self._generation = 0
+        self._journal_offset = 0
+        self._journal_lines = 0
+        self._memmap = None  # the vector file may have been rewritten by compact()
+        if not os.path.exists(self._index_path):
+            return
+        try:
+            with open(self._index_path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            if saved.get("model_name") == self.model_name and saved.get("dim") == self.dim:
+                self._rows = saved.get("rows", {})
+                self._generation = saved.get("generation", 0)
+            else:
+                logging.info(f"Embedding store at {self.directory} was built for another model; starting fresh")
+                self._reset_files()
+        except (json.JSONDecodeError, OSError) as e:
+            logging.warning(f"Could not read embedding index, starting fresh: {e}")
+            self._reset_files()
+
+    def _replay_journal(self) -> bool:
+        """
+        Apply journal lines written since the last sync; caller has set
+        _row_count. Returns False if a line was unreadable, torn by a crash
+        mid-write or points past the vector file, so the caller can start a
+        fresh snapshot rather than append after it.
+        """
+        if not os.path.exists(self._journal_path):
+            return True
+        with open(self._journal_path, 'rb') as f:
+            f.seek(self._journal_offset)
+            data = f.read()
+        lines = data.split(b"\n")
+        tail = lines.pop()  # empty unless the last line was torn
+        intact = not tail
+        consumed = 0
+        if self._journal_offset == 0 and lines:
+            try:
+                header = json.loads(lines[0])
+            except json.JSONDecodeError:
+                header = {}
+            if not isinstance(header, dict) or header.get("generation") != self._generation:
+                return True  # left over from before the last snapshot; replaced on the next write
+            consumed += len(lines[0]) + 1
+            lines = lines[1:]
+        for line in lines:
+            consumed += len(line) + 1
+            try:
+                key, row, last_used = json.loads(line)
+            except (json.JSONDecodeError, ValueError, TypeError):
+                intact = False
+                continue
+            if row >= self._row_count:
+                intact = False  # vector lost in a crash mid-append
+                continue
+            self._rows[key] = [row, last_used]
+            self._journal_lines += 1
+        self._journal_offset += consumed
+        return intact
+
+    def _reset_files(self):
+        self._rows = {}
+        for path in (self._vectors_path, self._index_path, self._journal_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def key_for(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model_name}\0{normalize_job_text(text)}".encode("utf-8")).hexdigest()
+
+    def _vectors(self) -> Optional[np.memmap]:
+        """Memory-map the vector file, remapping after it has grown."""
+        if not self._row_count:
+            return None
+        if self._memmap is None or self._memmap.shape[0] != self._row_count:
+            self._memmap = np.memmap(self._vectors_path, dtype=np.float32, mode='r', shape=(self._row_count, self.dim))
+        return self._memmap
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get_many(self, keys: Sequence[str]) -> Tuple[np.ndarray, List[int]]:
+        """
+        Look up vectors for keys.
+
+        Returns:
+            tuple: (vectors, missing) where vectors is a (len(keys), dim)
+            float32 array with zeros for misses and missing lists the positions
+            of keys that are not stored
+        """
+        result = np.zeros((len(keys), self.dim), dtype=np.float32)
+        missing = []
+        now = time.time()
+        with self._lock, self._file_lock():
+            self._sync()
+            vectors = self._vectors()
+            positions, rows = [], []
+            for position, key in enumerate(keys):
+                entry = self._rows.get(key)
+                if entry is None:
+                    missing.append(position)
+                else:
+                    entry[1] = now
+                    self._touched.add(key)
+                    positions.append(position)
+                    rows.append(entry[0])
+            if rows:
+                result[positions] = vectors[rows]
+            self.hits += len(rows)
+            self.misses += len(missing)
+            if len(self._touched) >= self.TOUCH_FLUSH_EVERY:
+                self._append_journal(())
+        return result, missing
+
+    def put_many(self, keys: Sequence[str], vectors: np.ndarray):
+        """Append vectors for new keys and journal their index entries."""
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        now = time.time()
+        row_bytes = 4 * self.dim
+        with self._lock, self._file_lock():
+            self._sync()  # another process may have stored some of these already
+            fresh = {}
+            for key, vector in zip(keys, vectors):
+                if key not in self._rows:
+                    fresh[key] = vector
+            if not fresh:
+                return
+            with open(self._vectors_path, 'ab') as f:
+                f.seek(0, os.SEEK_END)
+                size = f.tell()
+                if size % row_bytes:
+                    f.truncate(size - size % row_bytes)  # partial row from a crash mid-append
+                    f.seek(0, os.SEEK_END)
+                row = f.tell() // row_bytes
+                for key, vector in fresh.items():
+                    f.write(vector.tobytes())
+                    self._rows[key] = [row, now]
+                    row += 1
+            self._row_count = row
+            self._append_journal(list(fresh))
+
+    def flush(self):
+        """Persist pending access times (call before exit so compact() sees them next run)."""
+        with self._lock, self._file_lock():
+            if self._touched:
+                self._sync()
+                self._append_journal(())
+
+    def _append_journal(self, keys: Sequence[str]):
+        """Journal the entries for keys plus every pending access time; caller holds both locks after _sync()."""
+        written = set(keys)
+        keys = list(keys) + [key for key in self._touched if key in self._rows and key not in written]
+        self._touched.clear()
+        if not keys:
+            return
+        # Rewriting the snapshot once the journal outgrows the index keeps both O(entries) on disk
+        if self._journal_lines + len(keys) > max(1024, len(self._rows)) or not os.path.exists(self._index_path):
+            self._save_index()
+            return
+        if self._journal_offset == 0:
+            # No journal for this snapshot yet (or a stale one from before it)
+            with open(self._journal_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({"generation": self._generation}) + "\n")
+        with open(self._journal_path, 'a', encoding='utf-8') as f:
+            f.write("".join(json.dumps([key, *self._rows[key]]) + "\n" for key in keys))
+        self._journal_offset = os.path.getsize(self._journal_path)
+        self._journal_lines += len(keys)
+
+    def _save_index(self):
+        """Write a full snapshot and start an empty journal for it; caller holds both locks."""
+        self._generation += 1
+        tmp_path = f"{self._index_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"model_name": self.model_name, "dim": self.dim, "generation": self._generation,
+                       "rows": self._rows}, f)
+        os.replace(tmp_path, self._index_path)
+        # A journal left behind by a crash here has the old generation and is ignored on load
+        if os.path.exists(self._journal_path):
+            os.remove(self._journal_path)
+        self._snapshot_stat = self._stat(self._index_path)
+        self._journal_offset = 0
+        self._journal_lines = 0
+        self._touched.clear()
+
+    def compact(self, max_age_seconds: Optional[float] = None, max_rows: Optional[int] = None) -> int:
+        """
+        Rewrite the vector file without unreferenced or stale rows. Nothing
+        is rewritten when every row is referenced and none is evicted.
+
+        Args:
+            max_age_seconds: Drop entries not used within this many seconds
+            max_rows: Keep at most this many most recently used entries
+
+        Returns:
+            int: Number of entries evicted
+        """
+        with self._lock, self._file_lock():
+            self._sync()
+            entries = sorted(self._rows.items(), key=lambda item: item[1][1], reverse=True)
+            if max_age_seconds is not None:
+                cutoff = time.time() - max_age_seconds
+                entries = [item for item in entries if item[1][1] >= cutoff]
+            if max_rows is not None:
+                entries = entries[:max_rows]
+            evicted = len(self._rows) - len(entries)
+            if not evicted and len(entries) == self._row_count:
+                return 0
+
+            vectors = self._vectors()
+            tmp_path = f"{self._vectors_path}.tmp"
+            new_rows = {}
+            with open(tmp_path, 'wb') as f:
+                for new_row, (key, (old_row, last_used)) in enumerate(entries):
+                    f.write(np.asarray(vectors[old_row], dtype=np.float32).tobytes())
+                    new_rows[key] = [new_row, last_used]
+            self._memmap = None  # release the old mapping before replacing the file
+            os.replace(tmp_path, self._vectors_path)
+            self._rows = new_rows
+            self._row_count = len(new_rows)
+            self._save_index()
+
+        logging.info(f"Compacted embedding store: kept {len(new_rows)}, evicted {evicted}")
+        return evicted
+
+    def stats(self) -> Dict:
+        return {
+            "entries": len(self._rows),
+            "rows_on_disk": self._row_count,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
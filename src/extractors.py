@@ -0,0 +1,208 @@
+# src/extractors.py
+
+import io
+import os
+import logging
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, List, Optional
+
+# Default backend, overridable per call (see get_extractor)
+DEFAULT_EXTRACTOR = os.environ.get('PDF_EXTRACTOR', 'pdfplumber')
+
+
+class TextExtractor(ABC):
+    """
+    Interface for PDF text-extraction backends.
+
+    Backends import their engine lazily so that a missing optional dependency
+    only disables that backend instead of breaking the parser.
+    """
+
+    name = "base"
+    # Bump whenever a backend's output changes so cached text is invalidated
+    version = "1"
+
+    @classmethod
+    @abstractmethod
+    def is_available(cls) -> bool:
+        """Return True if the backend's engine can be imported."""
+
+    @abstractmethod
+    def page_count(self, file_path: str) -> int:
+        """Return the number of pages in the PDF."""
+
+    @abstractmethod
+    def iter_pages(self, file_path: str, start: int = 0, stop: Optional[int] = None) -> Iterator[Optional[str]]:
+        """Yield the text of pages [start, stop) in order; None for pages without text."""
+
+
+class PdfplumberExtractor(TextExtractor):
+    """pdfplumber with full character layout analysis (the historical default)."""
+
+    name = "pdfplumber"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        try:
+            import pdfplumber  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def page_count(self, file_path: str) -> int:
+        import pdfplumber
+        with pdfplumber.open(file_path) as pdf:
+            return len(pdf.pages)
+
+    def iter_pages(self, file_path: str, start: int = 0, stop: Optional[int] = None) -> Iterator[Optional[str]]:
+        import pdfplumber
+        with pdfplumber.open(file_path) as pdf:
+            stop = len(pdf.pages) if stop is None else min(stop, len(pdf.pages))
+            for index in range(start, stop):
+                page = pdf.pages[index]
+                try:
+                    page_text = page.extract_text()
+                finally:
+                    # Drop the page's cached chars and layout objects right away
+                    if hasattr(page, "close"):
+                        page.close()
+                    else:
+                        page.flush_cache()
+                yield page_text
+
+
+class PdfminerExtractor(TextExtractor):
+    """pdfminer.six in raw mode: content-stream order text, no layout analysis."""
+
+    name = "pdfminer"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        try:
+            import pdfminer  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def page_count(self, file_path: str) -> int:
+        from pdfminer.pdfpage import PDFPage
+        with open(file_path, 'rb') as f:
+            return sum(1 for _ in PDFPage.get_pages(f))
+
+    def iter_pages(self, file_path: str, start: int = 0, stop: Optional[int] = None) -> Iterator[Optional[str]]:
+        from pdfminer.converter import TextConverter
+        from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+        from pdfminer.pdfpage import PDFPage
+
+        resources = PDFResourceManager(caching=True)
+        with open(file_path, 'rb') as f:
+            for index, page in enumerate(PDFPage.get_pages(f)):
+                if index < start:
+                    continue
+                if stop is not None and index >= stop:
+                    break
+                buffer = io.StringIO()
+                device = TextConverter(resources, buffer, laparams=None)
+                try:
+                    PDFPageInterpreter(resources, device).process_page(page)
+                finally:
+                    device.close()
+                yield buffer.getvalue().replace("\x0c", "") or None
+
+
+class PymupdfExtractor(TextExtractor):
+    """PyMuPDF (MuPDF C library); much faster when installed."""
+
+    name = "pymupdf"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        try:
+            import fitz  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def page_count(self, file_path: str) -> int:
+        import fitz
+        with fitz.open(file_path) as doc:
+            return doc.page_count
+
+    def iter_pages(self, file_path: str, start: int = 0, stop: Optional[int] = None) -> Iterator[Optional[str]]:
+        import fitz
+        with fitz.open(file_path) as doc:
+            stop = doc.page_count if stop is None else min(stop, doc.page_count)
+            for index in range(start, stop):
+                yield doc.load_page(index).get_text() or None
+
+
+class PypdfiumExtractor(TextExtractor):
+    """pypdfium2 (PDFium C library); fast and permissively licensed when installed."""
+
+    name = "pypdfium2"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        try:
+            import pypdfium2  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def page_count(self, file_path: str) -> int:
+        import pypdfium2
+        doc = pypdfium2.PdfDocument(file_path)
+        try:
+            return len(doc)
+        finally:
+            doc.close()
+
+    def iter_pages(self, file_path: str, start: int = 0, stop: Optional[int] = None) -> Iterator[Optional[str]]:
+        import pypdfium2
+        doc = pypdfium2.PdfDocument(file_path)
+        try:
+            stop = len(doc) if stop is None else min(stop, len(doc))
+            for index in range(start, stop):
+                page = doc[index]
+                textpage = page.get_textpage()
+                try:
+                    yield textpage.get_text_range() or None
+                finally:
+                    textpage.close()
+                    page.close()
+        finally:
+            doc.close()
+
+
+EXTRACTORS: Dict[str, type] = {
+    PdfplumberExtractor.name: PdfplumberExtractor,
+    PdfminerExtractor.name: PdfminerExtractor,
+    PymupdfExtractor.name: PymupdfExtractor,
+    PypdfiumExtractor.name: PypdfiumExtractor,
+}
+
+
+def available_extractors() -> List[str]:
+    """Names of backends whose engines are installed."""
+    return [name for name, cls in EXTRACTORS.items() if cls.is_available()]
+
+
+def get_extractor(name: Optional[str] = None) -> TextExtractor:
+    """
+    Return an extractor instance by name.
+
+    Falls back to pdfplumber (with a warning) when the requested backend is
+    unknown or its engine isn't installed.
+
+    Args:
+        name: Backend name (default: PDF_EXTRACTOR environment variable)
+    """
+    name = (name or DEFAULT_EXTRACTOR).lower()
+    cls = EXTRACTORS.get(name)
+    if cls is None:
+        logging.warning(f"Unknown PDF extractor '{name}', falling back to pdfplumber")
+        cls = PdfplumberExtractor
+    elif not cls.is_available():
+        logging.warning(f"PDF extractor '{name}' is not installed, falling back to pdfplumber")
+        cls = PdfplumberExtractor
+    return cls()
@@ -0,0 +1,25 @@
+# src/file_lock.py
+
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking, one process per cache directory
+    fcntl = None
+
+
+@contextmanager
+def file_lock(path: str):
+    """
+    Exclusive advisory lock on a lock file, held for the duration of the
+    block; it serializes processes sharing an on-disk cache (no-op without fcntl).
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(path, 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
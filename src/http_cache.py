@@ -0,0 +1,234 @@
+# src/http_cache.py
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from . import http_client
+
+# Response cache; set HTTP_CACHE_DIR="" to disable
+HTTP_CACHE_DIR = os.environ.get('HTTP_CACHE_DIR', 'data/cache/http')
+HTTP_CACHE_TTL_SECONDS = float(os.environ.get('HTTP_CACHE_TTL_SECONDS', 15 * 60))
+HTTP_CACHE_MAX_BYTES = int(os.environ.get('HTTP_CACHE_MAX_BYTES', 100 * 1024 * 1024))
+
+# "record" saves every fetched page as a fixture, "replay" serves only fixtures
+# (no network at all); anything else fetches normally
+HTTP_CACHE_MODE = os.environ.get('HTTP_CACHE_MODE', '')
+HTTP_FIXTURES_DIR = os.environ.get('HTTP_FIXTURES_DIR', 'data/fixtures/http')
+
+# Response headers kept with a cached body
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+def url_key(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def build_response(url: str, body: bytes, headers: Dict, status_code: int = 200) -> requests.Response:
+    """A requests.Response for a stored body, so callers can't tell it from a live one."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = body
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers) or "utf-8"
+    return response
+
+
+class ResponseCache:
+    """
+    On-disk cache of successful GET responses, keyed by the SHA-256 of the URL.
+
+    Each entry is one file: a JSON header line (url, stored_at, validators)
+    followed by the raw body. Entries younger than the TTL are served as is;
+    older ones are revalidated with If-None-Match/If-Modified-Since when the
+    server sent an ETag or Last-Modified, and a 304 renews them without a
+    download. The directory evicts least recently used files once it grows
+    past max_bytes.
+    """
+
+    def __init__(self, directory: str = None, ttl_seconds: float = None, max_bytes: int = None):
+        self.directory = directory or HTTP_CACHE_DIR
+        self.ttl_seconds = HTTP_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self.max_bytes = max_bytes or HTTP_CACHE_MAX_BYTES
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "revalidated": 0, "misses": 0, "evictions": 0}
+        os.makedirs(self.directory, exist_ok=True)
+        self._bytes = sum(e.stat().st_size for e in os.scandir(self.directory) if e.name.endswith(".http"))
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.directory, f"{url_key(url)}.http")
+
+    def load(self, url: str) -> Optional[Tuple[Dict, bytes]]:
+        """Return (meta, body) for a URL, or None."""
+        path = self._path(url)
+        try:
+            with open(path, 'rb') as f:
+                meta = json.loads(f.readline())
+                body = f.read()
+            os.utime(path)  # mark as recently used for eviction
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not read HTTP cache entry for {url}: {e}")
+            return None
+        return meta, body
+
+    def store(self, url: str, body: bytes, headers: Dict, stored_at: float = None):
+        meta = {
+            "url": url,
+            "stored_at": stored_at or time.time(),
+            "headers": {name: headers[name] for name in _KEPT_HEADERS if name in headers},
+        }
+        path = self._path(url)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with self._lock:
+            try:
+                previous_size = os.path.getsize(path) if os.path.exists(path) else 0
+                with open(tmp_path, 'wb') as f:
+                    f.write(json.dumps(meta).encode("utf-8") + b"\n")
+                    f.write(body)
+                os.replace(tmp_path, path)
+                self._bytes += os.path.getsize(path) - previous_size
+            except OSError as e:
+                logging.warning(f"Could not write HTTP cache entry for {url}: {e}")
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                return
+            self._evict()
+
+    def _evict(self):
+        """Remove least recently used entries until the cache fits its budget."""
+        if self._bytes <= self.max_bytes:
+            return
+        entries = sorted((e for e in os.scandir(self.directory) if e.name.endswith(".http")),
+                         key=lambda e: e.stat().st_mtime)
+        for entry in entries:
+            if self._bytes <= self.max_bytes:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+                self._bytes -= size
+                self._counters["evictions"] += 1
+            except OSError as e:
+                logging.warning(f"Could not evict HTTP cache entry {entry.name}: {e}")
+
+    def get(self, url: str, headers: Dict = None, **kwargs) -> requests.Response:
+        """
+        GET a URL through the cache (see http_client.get for kwargs).
+
+        Non-200 responses are returned but never cached.
+        """
+        cached = self.load(url)
+        if cached is not None:
+            meta, body = cached
+            if time.time() - meta["stored_at"] <= self.ttl_seconds:
+                self._count("hits")
+                return build_response(url, body, meta["headers"])
+
+        request_headers = dict(headers or {})
+        validators = cached[0]["headers"] if cached is not None else {}
+        if "ETag" in validators:
+            request_headers["If-None-Match"] = validators["ETag"]
+        if "Last-Modified" in validators:
+            request_headers["If-Modified-Since"] = validators["Last-Modified"]
+
+        response = http_client.get(url, headers=request_headers, **kwargs)
+        if response.status_code == 304 and cached is not None:
+            self._count("revalidated")
+            self.store(url, cached[1], cached[0]["headers"])
+            return build_response(url, cached[1], cached[0]["headers"])
+        self._count("misses")
+        if response.status_code == 200:
+            self.store(url, response.content, response.headers)
+        return response
+
+    def _count(self, name: str):
+        with self._lock:
+            self._counters[name] += 1
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._counters)
+            stats["bytes"] = self._bytes
+        return stats
+
+
+class FixtureStore:
+    """
+    Saved responses for offline runs: record writes each fetched page to
+    <directory>/<sha256 of url>.html plus an index.json of url -> file, and
+    replay serves them back without touching the network.
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, directory: str = None):
+        self.directory = directory or HTTP_FIXTURES_DIR
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.directory, f"{url_key(url)[:24]}.html")
+
+    def record(self, url: str, response: requests.Response):
+        if response.status_code != 200:
+            return
+        path = self._path(url)
+        with self._lock:
+            with open(path, 'wb') as f:
+                f.write(response.content)
+            index_path = os.path.join(self.directory, self.INDEX_FILE)
+            index = {}
+            if os.path.exists(index_path):
+                with open(index_path, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+            index[url] = os.path.basename(path)
+            with open(index_path, 'w', encoding='utf-8') as f:
+                json.dump(index, f, indent=2, sort_keys=True)
+
+    def replay(self, url: str) -> requests.Response:
+        """The recorded response for a URL; raises ConnectionError if none was recorded."""
+        try:
+            with open(self._path(url), 'rb') as f:
+                body = f.read()
+        except FileNotFoundError:
+            raise requests.ConnectionError(f"No recorded fixture for {url}")
+        return build_response(url, body, {"Content-Type": "text/html; charset=utf-8"})
+
+
+_cache: Optional[ResponseCache] = None
+_fixtures: Optional[FixtureStore] = None
+_init_lock = threading.Lock()
+
+
+def cached_get(url: str, **kwargs) -> requests.Response:
+    """
+    GET for scrapers: replays fixtures in "replay" mode, otherwise goes
+    through the response cache (when enabled) and records fixtures in
+    "record" mode.
+    """
+    global _cache, _fixtures
+    with _init_lock:
+        if HTTP_CACHE_MODE in ("record", "replay") and _fixtures is None:
+            _fixtures = FixtureStore()
+        if HTTP_CACHE_DIR and _cache is None:
+            _cache = ResponseCache()
+    if HTTP_CACHE_MODE == "replay":
+        return _fixtures.replay(url)
+    response = _cache.get(url, **kwargs) if _cache is not None else http_client.get(url, **kwargs)
+    if HTTP_CACHE_MODE == "record":
+        _fixtures.record(url, response)
+    return response
+
+
+def cache_stats() -> Dict:
+    return _cache.stats() if _cache is not None else {}
@@ -0,0 +1,146 @@
+# src/http_client.py
+
+import os
+import time
+import random
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# Connection pool per host, and how many hosts keep a pool
+HTTP_POOL_MAXSIZE = int(os.environ.get('HTTP_POOL_MAXSIZE', 16))
+HTTP_POOL_CONNECTIONS = int(os.environ.get('HTTP_POOL_CONNECTIONS', 8))
+
+# Retries of transient failures (429, 5xx, connection errors, timeouts)
+HTTP_MAX_RETRIES = int(os.environ.get('HTTP_MAX_RETRIES', 3))
+HTTP_BACKOFF_BASE = float(os.environ.get('HTTP_BACKOFF_BASE', 0.5))
+HTTP_BACKOFF_MAX = float(os.environ.get('HTTP_BACKOFF_MAX', 30))
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class HttpMetrics:
+    """Thread-safe request counters for the shared session."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._counts = {"requests": 0, "retries": 0, "failures": 0, "connections_opened": 0}
+
+    def increment(self, name: str, amount: int = 1):
+        with self._lock:
+            self._counts[name] += amount
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            counts = dict(self._counts)
+        counts["connections_reused"] = max(0, counts["requests"] - counts["connections_opened"])
+        return counts
+
+
+metrics = HttpMetrics()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        metrics.increment("connections_opened")
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        metrics.increment("connections_opened")
+        return super()._new_conn()
+
+
+class _PooledAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools count the connections they open."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+
+def create_session() -> requests.Session:
+    """A keep-alive Session with tuned pools; retries are handled by get()."""
+    session = requests.Session()
+    adapter = _PooledAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared by every thread; requests' pooled connections are safe to use concurrently
+session = create_session()
+
+
+def retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """Delay requested by a Retry-After header (seconds or HTTP date), or None."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_seconds(attempt: int) -> float:
+    """Exponential backoff with full jitter for the given retry (0-based)."""
+    return random.uniform(0, min(HTTP_BACKOFF_MAX, HTTP_BACKOFF_BASE * 2 ** attempt))
+
+
+def get(url: str, headers: Dict = None, timeout: float = 10, max_retries: int = None,
+        rate_limiter=None, **kwargs) -> requests.Response:
+    """
+    GET through the shared session, retrying transient failures.
+
+    429/5xx responses, connection errors and timeouts are retried up to
+    max_retries times, waiting for Retry-After when the server sends one and
+    for exponential backoff with jitter otherwise. Every attempt first takes
+    a slot from rate_limiter (a HostRateLimiter), if given.
+
+    Returns:
+        requests.Response: The last response (callers still check its status)
+
+    Raises:
+        requests.RequestException: If the last attempt failed without a response
+    """
+    max_retries = HTTP_MAX_RETRIES if max_retries is None else max_retries
+    for attempt in range(max_retries + 1):
+        if rate_limiter is not None:
+            rate_limiter.acquire(url)
+        metrics.increment("requests")
+        try:
+            response = session.get(url, headers=headers, timeout=timeout, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt == max_retries:
+                metrics.increment("failures")
+                raise
+            delay = backoff_seconds(attempt)
+            logging.warning(f"GET {url} failed ({e}); retrying in {delay:.1f}s")
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt == max_retries:
+                if response.status_code in RETRY_STATUSES:
+                    metrics.increment("failures")
+                return response
+            retry_after = retry_after_seconds(response)
+            delay = min(HTTP_BACKOFF_MAX, retry_after) if retry_after is not None else backoff_seconds(attempt)
+            logging.warning(f"GET {url} returned {response.status_code}; retrying in {delay:.1f}s")
+            response.close()
+        metrics.increment("retries")
+        time.sleep(delay)
@@ -0,0 +1,207 @@
+# src/job_enricher.py
+
+import os
+import json
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from . import http_client
+from .card_parser import has_class
+from .job_store import JobStore, get_job_store
+from .keyword_engine import get_matcher
+from .rate_limit import HostRateLimiter
+from .web_scraper import HEADERS
+
+# Detail pages fetched per search, parallel fetches, and the wall-clock budget
+# for all of them; postings over the cap or the budget keep their card text
+ENRICH_MAX_JOBS = int(os.environ.get('ENRICH_MAX_JOBS', 40))
+ENRICH_WORKERS = int(os.environ.get('ENRICH_WORKERS', 6))
+ENRICH_BUDGET_SECONDS = float(os.environ.get('ENRICH_BUDGET_SECONDS', 8))
+
+# Politeness for detail page fetches per host: sustained requests/second and
+# burst size. The scraper's own limiter (SCRAPE_RATE_PER_HOST) is separate, so
+# enrichment doesn't stall searches still paging through results.
+ENRICH_RATE_PER_HOST = float(os.environ.get('ENRICH_RATE_PER_HOST', 2.0))
+ENRICH_BURST = int(os.environ.get('ENRICH_BURST', 3))
+
+# Details are kept in the job store and fetched again after this long
+ENRICH_CACHE_TTL_HOURS = float(os.environ.get('ENRICH_CACHE_TTL_HOURS', 24))
+ENRICH_DESCRIPTION_CHARS = int(os.environ.get('ENRICH_DESCRIPTION_CHARS', 5000))
+
+# Skills looked for in job descriptions
+SKILL_KEYWORDS = (
+    "python", "java", "c++", "c#", "javascript", "typescript", "golang", "rust", "kotlin", "swift", "scala",
+    "sql", "nosql", "postgresql", "mysql", "mongodb", "redis", "elasticsearch", "kafka", "spark", "hadoop",
+    "react", "angular", "vue", "node.js", "django", "flask", "fastapi", "spring boot", ".net", "graphql",
+    "rest api", "microservices", "html", "css", "git", "linux", "docker", "kubernetes", "terraform", "ci/cd",
+    "aws", "azure", "gcp", "machine learning", "deep learning", "nlp", "computer vision", "data analysis",
+    "statistics", "pandas", "numpy", "scikit-learn", "tensorflow", "pytorch", "tableau", "power bi", "excel",
+    "agile", "scrum", "jira", "figma", "product management", "user research", "a/b testing",
+    "penetration testing", "siem", "incident response", "network security", "encryption",
+)
+
+detail_rate_limiter = HostRateLimiter(rate=ENRICH_RATE_PER_HOST, capacity=ENRICH_BURST)
+
+# Elements holding the posting text on LinkedIn detail pages
+_DESCRIPTION_CLASSES = ("show-more-less-html__markup", "description__text")
+_DESCRIPTION_STRAINER = SoupStrainer(['div', 'section'], attrs={'class': lambda value: any(
+    has_class(name)(value) for name in _DESCRIPTION_CLASSES)})
+
+
+def _description_from_json_ld(soup: BeautifulSoup) -> str:
+    """The description of a schema.org JobPosting (used by most other job boards)."""
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            data = json.loads(script.string or "")
+        except ValueError:
+            continue
+        for item in data if isinstance(data, list) else [data]:
+            if isinstance(item, dict) and item.get("@type") == "JobPosting" and item.get("description"):
+                return BeautifulSoup(item["description"], 'html.parser').get_text(" ", strip=True)
+    return ""
+
+
+def extract_details(html: str, skills: Sequence[str] = SKILL_KEYWORDS) -> Dict:
+    """
+    Description and skills of a job posting page.
+
+    Only the description subtree is parsed on LinkedIn pages; other pages
+    fall back to a JobPosting JSON-LD block, then to the meta description.
+    """
+    soup = BeautifulSoup(html, 'html.parser', parse_only=_DESCRIPTION_STRAINER)
+    description = soup.get_text(" ", strip=True)
+    if not description:
+        soup = BeautifulSoup(html, 'html.parser')
+        description = _description_from_json_ld(soup)
+        if not description:
+            meta = soup.find('meta', attrs={'name': 'description'}) or soup.find('meta', attrs={'property': 'og:description'})
+            description = (meta.get('content') or "").strip() if meta else ""
+    description = " ".join(description.split())[:ENRICH_DESCRIPTION_CHARS]
+    return {"description": description, "skills": sorted(get_matcher(skills).find_keywords(description))}
+
+
+class JobEnricher:
+    """
+    Adds "description" and "skills" to jobs from their detail pages.
+
+    Details come from the job store when fetched within the TTL; the rest
+    are fetched with bounded concurrency, at most max_jobs per search and
+    within budget_seconds of wall-clock time. Fetches still running when the
+    budget runs out are left to finish in the background and only warm the
+    store for the next search.
+    """
+
+    def __init__(self, job_store: Optional[JobStore] = None, max_jobs: int = None, workers: int = None,
+                 budget_seconds: float = None, ttl_hours: float = None, rate_limiter: HostRateLimiter = None,
+                 skills: Sequence[str] = SKILL_KEYWORDS):
+        self.job_store = job_store or get_job_store()
+        self.max_jobs = ENRICH_MAX_JOBS if max_jobs is None else max_jobs
+        self.workers = workers or ENRICH_WORKERS
+        self.budget_seconds = ENRICH_BUDGET_SECONDS if budget_seconds is None else budget_seconds
+        self.ttl_seconds = (ENRICH_CACHE_TTL_HOURS if ttl_hours is None else ttl_hours) * 3600
+        self.rate_limiter = rate_limiter or detail_rate_limiter
+        self.skills = skills
+        self._lock = threading.Lock()
+        self._counters = {"cached": 0, "fetched": 0, "failed": 0, "over_budget": 0}
+
+    def _count(self, name: str, amount: int = 1):
+        with self._lock:
+            self._counters[name] += amount
+
+    def fetch_details(self, link: str) -> Dict:
+        """Fetch, extract and store one posting's details; raises on HTTP errors."""
+        response = http_client.get(link, headers=HEADERS, timeout=10, max_retries=1, rate_limiter=self.rate_limiter)
+        response.raise_for_status()
+        details = extract_details(response.text, self.skills)
+        self.job_store.put_details(link, details["description"], details["skills"])
+        return details
+
+    def enrich(self, jobs: List[Dict], deadline: float = None, limit: int = None) -> int:
+        """
+        Add details to the jobs (in place) that have a link and haven't been
+        enriched yet. Pages are fetched in list order, so pass jobs best first.
+
+        Args:
+            jobs: Job dicts
+            deadline: time.monotonic() by which fetching stops (default: budget_seconds from now)
+            limit: Maximum detail pages to fetch (default: max_jobs)
+
+        Returns:
+            int: Number of jobs that got a description
+        """
+        return self._enrich(jobs, deadline, limit)[0]
+
+    def _enrich(self, jobs: List[Dict], deadline: Optional[float], limit: Optional[int]):
+        """enrich(), also returning how many detail pages it tried to fetch."""
+        pending = [job for job in jobs if job.get("link") and "skills" not in job]
+        if not pending:
+            return 0, 0
+        cached = self.job_store.get_details([job["link"] for job in pending], self.ttl_seconds)
+        enriched = 0
+        to_fetch = []
+        for job in pending:
+            details = cached.get(job["link"])
+            if details is None:
+                to_fetch.append(job)
+            elif details["description"]:
+                job.update(details)
+                enriched += 1
+        self._count("cached", len(pending) - len(to_fetch))
+
+        limit = self.max_jobs if limit is None else limit
+        deadline = deadline or time.monotonic() + self.budget_seconds
+        to_fetch = to_fetch[:max(0, limit)]
+        if not to_fetch or time.monotonic() >= deadline:
+            return enriched, 0
+
+        executor = ThreadPoolExecutor(max_workers=min(len(to_fetch), self.workers))
+        futures = {executor.submit(self.fetch_details, job["link"]): job for job in to_fetch}
+        try:
+            done, not_done = wait(futures, timeout=max(0.0, deadline - time.monotonic()))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        for future in done:
+            try:
+                details = future.result()
+            except Exception as e:
+                self._count("failed")
+                logging.warning(f"Could not fetch job details from {futures[future]['link']}: {e}")
+                continue
+            self._count("fetched")
+            if details["description"]:
+                futures[future].update(details)
+                enriched += 1
+        if not_done:
+            self._count("over_budget", len(not_done))
+            logging.info(f"Job enrichment budget reached; {len(not_done)} postings keep their card text")
+        return enriched, len(to_fetch)
+
+    def iter_enriched(self, jobs: Iterable[Dict], batch_size: int = 25) -> Iterator[Dict]:
+        """
+        Enrich a job stream a batch at a time, under one budget and one
+        max_jobs cap for the whole stream; afterwards jobs still get cached
+        details but nothing more is fetched.
+        """
+        stream = iter(jobs)
+        deadline = time.monotonic() + self.budget_seconds
+        remaining = self.max_jobs
+        try:
+            while True:
+                batch = list(islice(stream, batch_size))
+                if not batch:
+                    return
+                remaining -= self._enrich(batch, deadline, remaining)[1]
+                yield from batch
+        finally:
+            if hasattr(stream, "close"):
+                stream.close()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return dict(self._counters)
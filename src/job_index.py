@@ -0,0 +1,476 @@
+# src/job_index.py
+
+import os
+import json
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import hnswlib
+except ImportError:
+    hnswlib = None
+
+from .file_lock import file_lock
+from .job_store import normalize_field
+
+# Metadata fields kept in an inverted index so filters don't scan every row
+FILTER_FIELDS = ("location", "company", "source", "experience_level", "work_model")
+# Filters on these match as prefixes, like JobStore.find_jobs ("pune" matches "Pune, Maharashtra, India")
+PREFIX_FIELDS = ("location",)
+
+_INITIAL_CAPACITY = 1024
+
+# save() first rebuilds the index without deleted rows once they are this share of all rows
+TOMBSTONE_COMPACT_RATIO = 0.25
+_SCAN_BLOCK_ROWS = 65536
+
+# The flat backend switches from exhaustive scans to an IVF partition at this size
+IVF_MIN_ROWS = 20000
+_KMEANS_SAMPLE = 50000
+_KMEANS_ITERATIONS = 10
+
+
+class JobVectorIndex:
+    """
+    Persistent top-k vector index over job postings.
+
+    Uses an HNSW graph (hnswlib) when it is installed, and otherwise an
+    int8-quantized index in pure NumPy. The NumPy index is scanned
+    exhaustively while small; from IVF_MIN_ROWS entries on it is split into
+    k-means cells (IVF) and a query only scans the nprobe closest cells.
+    Vectors are L2-normalized, so scores are cosine similarities. Every
+    entry carries a metadata dict; search() can filter on metadata, using
+    an inverted index for the fields in FILTER_FIELDS. Keep metadata
+    small (ids and filter fields): it is held in memory and rewritten on
+    every save. Entries can be inserted, replaced and deleted at any
+    time, and the whole index saves to and loads from a directory. Saving
+    to a directory another process saved to in the meantime merges its
+    new entries in first, so concurrent savers don't lose each other's work.
+    """
+
+    META_FILE = "meta.json"
+    FLAT_FILE = "vectors.npz"
+    HNSW_FILE = "hnsw.bin"
+    LOCK_FILE = "lock"
+
+    def __init__(self, dim: int, backend: Optional[str] = None, ef_search: int = 128, nprobe: int = 24,
+                 model_name: Optional[str] = None):
+        if backend is None:
+            backend = "hnsw" if hnswlib is not None else "flat"
+        if backend == "hnsw" and hnswlib is None:
+            raise ValueError("hnswlib is not installed; use backend='flat'")
+        if backend not in ("hnsw", "flat"):
+            raise ValueError(f"Unknown index backend '{backend}'")
+        self.dim = dim
+        self.backend = backend
+        # Model that produced the vectors; load() refuses an index built by another one
+        self.model_name = model_name
+        self.ef_search = ef_search
+        self.nprobe = nprobe
+        # Where the index was loaded from or last saved to (None: in memory only)
+        self.directory: Optional[str] = None
+        self._lock = threading.RLock()
+        # meta.json as last loaded or saved by us, and ids deleted since then
+        self._saved_stat = None
+        self._removed: set = set()
+
+        # Row bookkeeping shared by both backends; rows are never reused except on replace
+        self._ids: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._metadata: List[Optional[Dict]] = []
+        self._postings: Dict[str, Dict[str, set]] = {field: {} for field in FILTER_FIELDS}
+        self._alive = np.zeros(0, dtype=bool)
+
+        if backend == "hnsw":
+            self._hnsw = hnswlib.Index(space="ip", dim=dim)
+            self._hnsw.init_index(max_elements=_INITIAL_CAPACITY, ef_construction=200, M=16)
+            self._hnsw.set_ef(ef_search)
+        else:
+            self._codes = np.zeros((0, dim), dtype=np.int8)
+            self._scales = np.zeros(0, dtype=np.float32)
+            self._centroids: Optional[np.ndarray] = None
+            self._cells = np.zeros(0, dtype=np.int32)  # row -> IVF cell
+            self._trained_rows = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._rows
+
+    # ------------------------------------------------------------------ writes
+
+    def add(self, ids: Sequence[str], vectors: np.ndarray, metadata: Optional[Sequence[Dict]] = None):
+        """Insert or replace entries; an id repeated within the call keeps its last occurrence."""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        metadata = metadata or [{} for _ in ids]
+        last = {job_id: i for i, job_id in enumerate(ids)}
+        if len(last) < len(ids):
+            keep = sorted(last.values())
+            ids = [ids[i] for i in keep]
+            vectors = vectors[keep]
+            metadata = [metadata[i] for i in keep]
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.where(norms == 0, 1.0, norms)
+
+        with self._lock:
+            self.remove([job_id for job_id in ids if job_id in self._rows])
+            start = len(self._ids)
+            rows = np.arange(start, start + len(ids))
+            self._ensure_capacity(start + len(ids))
+            self._alive[rows] = True
+            for row, job_id, meta in zip(rows, ids, metadata):
+                self._ids.append(job_id)
+                self._metadata.append(dict(meta))
+                self._rows[job_id] = int(row)
+                self._post(int(row), meta)
+
+            if self.backend == "hnsw":
+                self._hnsw.add_items(vectors, rows)
+            else:
+                scales = np.abs(vectors).max(axis=1) / 127.0
+                scales[scales == 0] = 1.0
+                self._codes[rows] = np.round(vectors / scales[:, None]).astype(np.int8)
+                self._scales[rows] = scales
+                if self._centroids is not None:
+                    self._cells[rows] = np.argmax(vectors @ self._centroids.T, axis=1)
+                if len(self._rows) >= IVF_MIN_ROWS and len(self._rows) >= 4 * self._trained_rows:
+                    self._train_ivf()
+
+    def remove(self, ids: Iterable[str]) -> int:
+        """Delete entries by id; unknown ids are ignored. Returns the number removed."""
+        removed = 0
+        with self._lock:
+            for job_id in ids:
+                row = self._rows.pop(job_id, None)
+                if row is None:
+                    continue
+                self._alive[row] = False
+                self._unpost(row, self._metadata[row])
+                self._ids[row] = None
+                self._metadata[row] = None
+                self._removed.add(job_id)
+                if self.backend == "hnsw":
+                    self._hnsw.mark_deleted(row)
+                removed += 1
+        return removed
+
+    def _ensure_capacity(self, rows: int):
+        if rows <= len(self._alive):
+            return
+        capacity = max(_INITIAL_CAPACITY, len(self._alive))
+        while capacity < rows:
+            capacity *= 2
+        self._alive = np.concatenate([self._alive, np.zeros(capacity - len(self._alive), dtype=bool)])
+        if self.backend == "hnsw":
+            if capacity > self._hnsw.get_max_elements():
+                self._hnsw.resize_index(capacity)
+        else:
+            grow = capacity - len(self._codes)
+            self._codes = np.concatenate([self._codes, np.zeros((grow, self.dim), dtype=np.int8)])
+            self._scales = np.concatenate([self._scales, np.zeros(grow, dtype=np.float32)])
+            self._cells = np.concatenate([self._cells, np.zeros(grow, dtype=np.int32)])
+
+    def _dequantize(self, rows: np.ndarray) -> np.ndarray:
+        return self._codes[rows].astype(np.float32) * self._scales[rows, None]
+
+    def _row_vectors(self, rows: np.ndarray) -> np.ndarray:
+        """Stored (normalized) vectors of rows, for either backend."""
+        if self.backend == "hnsw":
+            return np.asarray(self._hnsw.get_items(list(map(int, rows))), dtype=np.float32).reshape(-1, self.dim)
+        return self._dequantize(rows)
+
+    def tombstone_ratio(self) -> float:
+        """Share of rows that belong to deleted or replaced entries."""
+        return 1 - len(self._rows) / len(self._ids) if self._ids else 0.0
+
+    def compact(self) -> int:
+        """Rebuild the rows without deleted or replaced entries; returns how many rows were dropped."""
+        with self._lock:
+            size = len(self._ids)
+            live = np.flatnonzero(self._alive[:size])
+            dropped = size - len(live)
+            if not dropped:
+                return 0
+            if self.backend == "hnsw":
+                vectors = self._row_vectors(live)
+                self._hnsw = hnswlib.Index(space="ip", dim=self.dim)
+                self._hnsw.init_index(max_elements=max(_INITIAL_CAPACITY, len(live)), ef_construction=200, M=16)
+                self._hnsw.set_ef(self.ef_search)
+                if len(live):
+                    self._hnsw.add_items(vectors, np.arange(len(live)))
+            else:
+                self._codes = self._codes[live]
+                self._scales = self._scales[live]
+                self._cells = self._cells[live]
+            self._ids = [self._ids[row] for row in live]
+            self._metadata = [self._metadata[row] for row in live]
+            self._rows = {job_id: row for row, job_id in enumerate(self._ids)}
+            self._alive = np.ones(len(self._ids), dtype=bool)
+            self._postings = {field: {} for field in FILTER_FIELDS}
+            for row, meta in enumerate(self._metadata):
+                self._post(row, meta)
+        logging.info(f"Compacted job index: dropped {dropped} deleted rows, kept {len(live)}")
+        return dropped
+
+    def _train_ivf(self):
+        """(Re)build the IVF partition with spherical k-means on a sample of live rows."""
+        live = np.flatnonzero(self._alive[:len(self._ids)])
+        rng = np.random.default_rng(0)
+        sample = self._dequantize(rng.choice(live, min(len(live), _KMEANS_SAMPLE), replace=False))
+        cells = max(1, int(4 * np.sqrt(len(live))))
+        centroids = sample[rng.choice(len(sample), cells, replace=False)]
+        for _ in range(_KMEANS_ITERATIONS):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            order = np.argsort(assignment, kind="stable")
+            used, starts = np.unique(assignment[order], return_index=True)
+            sums = np.zeros_like(centroids)
+            sums[used] = np.add.reduceat(sample[order], starts, axis=0)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # Empty cells keep their previous centroid
+            centroids = np.where(norms > 0, sums / np.where(norms == 0, 1.0, norms), centroids)
+        self._centroids = centroids.astype(np.float32)
+        size = len(self._ids)
+        for start in range(0, size, _SCAN_BLOCK_ROWS):
+            block = np.arange(start, min(size, start + _SCAN_BLOCK_ROWS))
+            self._cells[block] = np.argmax(self._dequantize(block) @ self._centroids.T, axis=1)
+        self._trained_rows = len(live)
+        logging.info(f"Trained IVF partition with {cells} cells over {len(live)} jobs")
+
+    def _post(self, row: int, meta: Dict):
+        for field, postings in self._postings.items():
+            if meta.get(field) is not None:
+                postings.setdefault(normalize_field(str(meta[field])), set()).add(row)
+
+    def _unpost(self, row: int, meta: Dict):
+        for field, postings in self._postings.items():
+            if meta.get(field) is not None:
+                key = normalize_field(str(meta[field]))
+                rows = postings.get(key)
+                if rows is not None:
+                    rows.discard(row)
+                    if not rows:
+                        del postings[key]
+
+    # ------------------------------------------------------------------ reads
+
+    def _filter_mask(self, filters: Optional[Dict]) -> np.ndarray:
+        """
+        Boolean mask of live rows that satisfy every filter.
+
+        A filter value may be a scalar, a list/tuple/set (any of) or a
+        callable taking the field value. Scalars compare case- and
+        whitespace-insensitively, as a prefix for PREFIX_FIELDS and as
+        equality otherwise.
+        """
+        mask = self._alive[:len(self._ids)].copy()
+        for field, expected in (filters or {}).items():
+            if callable(expected):
+                allowed = np.zeros_like(mask)
+                for row in np.flatnonzero(mask):
+                    allowed[row] = bool(expected(self._metadata[row].get(field)))
+            else:
+                values = expected if isinstance(expected, (list, tuple, set)) else [expected]
+                allowed = np.zeros_like(mask)
+                wanted = [normalize_field(str(value)) for value in values]
+                if field in self._postings and field in PREFIX_FIELDS:
+                    # Distinct values are few (cities, not postings), so scanning the keys is cheap
+                    for key, rows in self._postings[field].items():
+                        if any(key.startswith(prefix) for prefix in wanted):
+                            allowed[list(rows)] = True
+                elif field in self._postings:
+                    for key in wanted:
+                        rows = self._postings[field].get(key)
+                        if rows:
+                            allowed[list(rows)] = True
+                else:
+                    wanted = set(wanted)
+                    for row in np.flatnonzero(mask):
+                        allowed[row] = normalize_field(str(self._metadata[row].get(field))) in wanted
+            mask &= allowed
+        return mask
+
+    def search(self, query: np.ndarray, k: int = 50, filters: Optional[Dict] = None) -> List[Tuple[str, float, Dict]]:
+        """
+        Return up to k (id, score, metadata) tuples, best first.
+
+        Args:
+            query: Query vector (normalized internally)
+            k: Number of results
+            filters: Metadata filters, see _filter_mask
+        """
+        query = np.asarray(query, dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(query)
+        query = query / norm if norm else query
+
+        with self._lock:
+            if not self._rows:
+                return []
+            mask = self._filter_mask(filters) if filters else None
+            candidates = len(self._rows) if mask is None else int(mask.sum())
+            k = min(k, candidates)
+            if k <= 0:
+                return []
+
+            if self.backend == "hnsw":
+                rows, scores = self._search_hnsw(query, k, mask)
+            else:
+                rows, scores = self._search_flat(query, k, mask)
+            return [(self._ids[row], float(score), self._metadata[row]) for row, score in zip(rows, scores)]
+
+    def _search_hnsw(self, query: np.ndarray, k: int, mask: Optional[np.ndarray]):
+        allowed = None if mask is None else (lambda label: bool(mask[label]))
+        self._hnsw.set_ef(max(self.ef_search, k))
+        labels, distances = self._hnsw.knn_query(query, k=k, filter=allowed)
+        # hnswlib's "ip" space returns 1 - dot product
+        return labels[0].tolist(), (1.0 - distances[0]).tolist()
+
+    def _search_flat(self, query: np.ndarray, k: int, mask: Optional[np.ndarray]):
+        live = self._alive[:len(self._ids)] if mask is None else mask
+        rows = None
+        if self._centroids is not None:
+            # Probe proportionally more cells when a filter leaves only a fraction of the rows
+            nprobe = self.nprobe if mask is None else int(self.nprobe * len(self._rows) / max(1, mask.sum()))
+            probe = np.zeros(len(self._centroids), dtype=bool)
+            probe[np.argsort(-(self._centroids @ query))[:nprobe]] = True
+            rows = np.flatnonzero(probe[self._cells[:len(self._ids)]] & live)
+            if len(rows) < k:
+                # Too few candidates in the probed cells (e.g. a narrow filter): scan everything
+                rows = None
+        if rows is None:
+            rows = np.flatnonzero(live)
+        scores = np.empty(len(rows), dtype=np.float32)
+        for start in range(0, len(rows), _SCAN_BLOCK_ROWS):
+            block = rows[start:start + _SCAN_BLOCK_ROWS]
+            scores[start:start + len(block)] = (self._codes[block].astype(np.float32) @ query) * self._scales[block]
+        top = np.argpartition(-scores, k - 1)[:k] if k < len(scores) else np.arange(len(scores))
+        top = top[np.argsort(-scores[top])]
+        return rows[top].tolist(), scores[top].tolist()
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Metadata for an id, or None."""
+        row = self._rows.get(job_id)
+        return None if row is None else self._metadata[row]
+
+    def all_metadata(self) -> List[Dict]:
+        """Metadata of every live entry, in insertion order."""
+        with self._lock:
+            return [meta for meta in self._metadata if meta is not None]
+
+    def all_ids(self) -> List[str]:
+        """Id of every live entry, in insertion order."""
+        with self._lock:
+            return [job_id for job_id in self._ids if job_id is not None]
+
+    # ------------------------------------------------------------ persistence
+
+    def save(self, directory: Optional[str] = None):
+        """Write the index to a directory (default: self.directory)."""
+        directory = directory or self.directory
+        if not directory:
+            raise ValueError("No directory to save the job index to")
+        os.makedirs(directory, exist_ok=True)
+        meta_path = os.path.join(directory, self.META_FILE)
+        with self._lock, file_lock(os.path.join(directory, self.LOCK_FILE)):
+            if os.path.exists(meta_path) and _stat(meta_path) != self._saved_stat:
+                self._merge_saved(directory)
+            if self.tombstone_ratio() > TOMBSTONE_COMPACT_RATIO:
+                self.compact()
+            meta = {
+                "dim": self.dim,
+                "backend": self.backend,
+                "model_name": self.model_name,
+                "ids": self._ids,
+                "metadata": self._metadata,
+            }
+            if self.backend == "hnsw":
+                self._hnsw.save_index(os.path.join(directory, self.HNSW_FILE))
+            else:
+                size = len(self._ids)
+                tmp_path = os.path.join(directory, f"{self.FLAT_FILE}.tmp.npz")
+                arrays = {"codes": self._codes[:size], "scales": self._scales[:size], "cells": self._cells[:size]}
+                if self._centroids is not None:
+                    arrays["centroids"] = self._centroids
+                np.savez(tmp_path, **arrays)
+                os.replace(tmp_path, os.path.join(directory, self.FLAT_FILE))
+            tmp_path = os.path.join(directory, f"{self.META_FILE}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+            os.replace(tmp_path, meta_path)
+            self.directory = directory
+            self._saved_stat = _stat(meta_path)
+            self._removed.clear()
+
+    def _merge_saved(self, directory: str):
+        """Add the entries another process saved to directory that we neither have nor deleted."""
+        try:
+            saved = type(self)._read(directory, self.ef_search, self.nprobe, self.model_name)
+        except (OSError, ValueError, KeyError) as e:
+            logging.warning(f"Could not merge the job index saved in {directory}, overwriting it: {e}")
+            return
+        if saved.dim != self.dim:
+            return
+        new = [(job_id, row) for job_id, row in saved._rows.items()
+               if job_id not in self._rows and job_id not in self._removed]
+        if new:
+            rows = np.array([row for _, row in new])
+            self.add([job_id for job_id, _ in new], saved._row_vectors(rows), [saved._metadata[row] for row in rows])
+            logging.info(f"Merged {len(new)} jobs saved to {directory} by another process")
+
+    @classmethod
+    def load(cls, directory: str, ef_search: int = 128, nprobe: int = 24,
+             model_name: Optional[str] = None) -> "JobVectorIndex":
+        """
+        Load an index written by save().
+
+        Raises:
+            ValueError: If model_name is given and the index was built by another model
+        """
+        with file_lock(os.path.join(directory, cls.LOCK_FILE)):
+            return cls._read(directory, ef_search, nprobe, model_name)
+
+    @classmethod
+    def _read(cls, directory: str, ef_search: int, nprobe: int, model_name: Optional[str]) -> "JobVectorIndex":
+        """load() without taking the directory lock (the caller holds it)."""
+        with open(os.path.join(directory, cls.META_FILE), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if model_name is not None and meta.get("model_name") != model_name:
+            raise ValueError(f"Job index in {directory} was built with model '{meta.get('model_name')}', not '{model_name}'")
+        index = cls(meta["dim"], backend=meta["backend"], ef_search=ef_search, nprobe=nprobe, model_name=model_name)
+        size = len(meta["ids"])
+        index._ensure_capacity(size)
+        index._ids = meta["ids"]
+        index._metadata = meta["metadata"]
+        for row, job_id in enumerate(index._ids):
+            if job_id is not None:
+                index._rows[job_id] = row
+                index._alive[row] = True
+                index._post(row, index._metadata[row])
+
+        if index.backend == "hnsw":
+            index._hnsw.load_index(os.path.join(directory, cls.HNSW_FILE), max_elements=len(index._alive))
+            index._hnsw.set_ef(ef_search)
+        else:
+            with np.load(os.path.join(directory, cls.FLAT_FILE)) as arrays:
+                index._codes[:size] = arrays["codes"]
+                index._scales[:size] = arrays["scales"]
+                index._cells[:size] = arrays["cells"]
+                if "centroids" in arrays:
+                    index._centroids = arrays["centroids"]
+                    index._trained_rows = len(index)
+        index.directory = directory
+        index._saved_stat = _stat(os.path.join(directory, cls.META_FILE))
+        logging.info(f"Loaded {index.backend} job index with {len(index)} entries from {directory}")
+        return index
+
+
+def _stat(path: str):
+    """Identity of a file's current version (None if missing)."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
@@ -1,24 +1,326 @@
 # src/job_matcher.py
 
+import os
+import atexit
+import hashlib
 import logging
-from typing import List, Dict
+import threading
+from collections import OrderedDict
+from itertools import islice
+from typing import Iterable, List, Dict, Optional
+import numpy as np
 from sentence_transformers import SentenceTransformer, util
+from .embedding_store import EmbeddingStore, normalize_job_text
+from .job_index import FILTER_FIELDS, JobVectorIndex
+from .job_store import JobStore, get_job_store, job_key
+from .bm25_index import BM25Index
+from .model_registry import registry
+from .resume_chunker import chunk_resume
+
+MODEL_NAME = 'all-MiniLM-L6-v2'
+
+# Jobs encoded per forward pass (see JobMatcher.match_resume_to_jobs)
+ENCODE_BATCH_SIZE = int(os.environ.get('JOB_MATCH_BATCH_SIZE', 64))
+
+# Persistent job embedding cache; set JOB_EMBEDDING_CACHE_DIR="" to disable.
+# When a process first opens it, entries unused for EMBEDDING_CACHE_MAX_AGE_DAYS
+# and all but the EMBEDDING_CACHE_MAX_ROWS most recently used are compacted away
+# (0 turns either limit off).
+EMBEDDING_CACHE_DIR = os.environ.get('JOB_EMBEDDING_CACHE_DIR', 'data/cache/job_embeddings')
+EMBEDDING_CACHE_MAX_ROWS = int(os.environ.get('EMBEDDING_CACHE_MAX_ROWS', 500000))
+EMBEDDING_CACHE_MAX_AGE_DAYS = float(os.environ.get('EMBEDDING_CACHE_MAX_AGE_DAYS', 30))
+
+# Resume embedding: "mean" or "max" pooling over section-aware chunks, or
+# "truncate" for the old single-input behavior (MiniLM stops at ~256 word pieces).
+# Pooled scores run on a different scale, so each pooling has its own match
+# threshold; truncate stays the default until MIN_MATCH_SCORE_MEAN/_MAX are set
+# from the thresholds printed by benchmarks/resume_chunking_benchmark.py
+RESUME_POOLING = os.environ.get('RESUME_POOLING', 'truncate')
+RESUME_CHUNK_WORDS = int(os.environ.get('RESUME_CHUNK_WORDS', 150))
+MIN_MATCH_SCORE = float(os.environ.get('MIN_MATCH_SCORE', 30))
+MIN_MATCH_SCORES = {
+    "truncate": MIN_MATCH_SCORE,
+    "mean": float(os.environ.get('MIN_MATCH_SCORE_MEAN', MIN_MATCH_SCORE)),
+    "max": float(os.environ.get('MIN_MATCH_SCORE_MAX', MIN_MATCH_SCORE)),
+}
+RESUME_CACHE_SIZE = 128
+
+# Inference backend: "fp32" (default), "int8" (PyTorch dynamic quantization of the
+# linear layers) or "onnx" (ONNX Runtime; needs sentence-transformers[onnx]).
+# ONNX_MODEL_FILE picks a file from the model repo, e.g. onnx/model_qint8_avx2.onnx.
+EMBEDDING_BACKENDS = ("fp32", "int8", "onnx")
+EMBEDDING_BACKEND = os.environ.get('EMBEDDING_BACKEND', 'fp32')
+ONNX_MODEL_FILE = os.environ.get('ONNX_MODEL_FILE', '')
+
+def model_key(backend: str) -> str:
+    """Registry and embedding-cache name of the model running on a backend."""
+    return MODEL_NAME if backend == "fp32" else f"{MODEL_NAME}+{backend}"
+
+def _load_sentence_model(backend: str) -> SentenceTransformer:
+    if backend == "onnx":
+        model_kwargs = {"file_name": ONNX_MODEL_FILE} if ONNX_MODEL_FILE else None
+        model = SentenceTransformer(MODEL_NAME, device="cpu", backend="onnx", model_kwargs=model_kwargs)
+    elif backend == "int8":
+        import torch
+        model = SentenceTransformer(MODEL_NAME, device="cpu")
+        torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+    else:
+        model = SentenceTransformer(MODEL_NAME)
+    logging.info(f"SentenceTransformer model loaded successfully ({backend}).")
+    return model
+
+def register_backend(backend: str) -> str:
+    """
+    Register the model for a backend (once) and return its registry name.
+    Only backends actually used are registered, so warm-up never loads the
+    other copies or needs their optional dependencies.
+    """
+    name = model_key(backend)
+    if not registry.is_registered(name):
+        registry.register(name, lambda: _load_sentence_model(backend), warmup=lambda model: model.encode(["warm up"]))
+    return name
+
+# One embedding store per cache directory and process, shared by every JobMatcher
+_embedding_stores: Dict[str, EmbeddingStore] = {}
+_embedding_stores_lock = threading.Lock()
+
+def get_embedding_store(directory: str, model_name: str, dim: int) -> EmbeddingStore:
+    """
+    The process-wide store for a cache directory, opened (and compacted to
+    the configured limits) on first use.
+    """
+    key = os.path.abspath(directory)
+    with _embedding_stores_lock:
+        store = _embedding_stores.get(key)
+        if store is None:
+            store = EmbeddingStore(directory, model_name, dim)
+            store.compact(max_age_seconds=EMBEDDING_CACHE_MAX_AGE_DAYS * 86400 or None,
+                          max_rows=EMBEDDING_CACHE_MAX_ROWS or None)
+            atexit.register(store.flush)
+            _embedding_stores[key] = store
+        return store
+
+# One copy of the model per process and backend, shared by every JobMatcher (see model_registry)
+register_backend(EMBEDDING_BACKEND)
+
+# Description words embedded with an enriched job (MiniLM reads ~256 word pieces)
+JOB_TEXT_DESCRIPTION_WORDS = int(os.environ.get('JOB_TEXT_DESCRIPTION_WORDS', 120))
+
+# Hybrid matching: when match_many gets more jobs than this, BM25 shortlists this
+# many per resume for semantic reranking; 0 (the default) always scores every job
+# semantically. Card-only jobs (title/company/location) give BM25 too little text
+# to rank on, so the shortlist is also skipped unless most jobs have a description.
+JOB_MATCH_SHORTLIST = int(os.environ.get('JOB_MATCH_SHORTLIST', 0))
+
+# Persistent vector index over every job ever scored; set JOB_INDEX_DIR="" to disable.
+# JOB_INDEX_BACKEND is "hnsw" (needs hnswlib) or "flat"; empty picks the best available.
+JOB_INDEX_DIR = os.environ.get('JOB_INDEX_DIR', 'data/cache/job_index')
+JOB_INDEX_BACKEND = os.environ.get('JOB_INDEX_BACKEND') or None
+
+# Version of what JobMatcher keeps in the index; an index written under another
+# version is rebuilt. 2: ids are JobStore keys and the metadata is only the
+# filter fields plus a hash of the embedded text (postings live in the JobStore).
+JOB_INDEX_VERSION = 2
 
 class JobMatcher:
     """Receives a list of jobs and scores them against a resume using semantic search."""
     
-    def __init__(self):
-        try:
-            self.model = SentenceTransformer('all-MiniLM-L6-v2')
-            logging.info("SentenceTransformer model loaded successfully.")
-        except Exception as e:
-            logging.error(f"Failed to load SentenceTransformer model: {e}")
-            self.model = None
-
-    def match_resume_to_jobs(self, resume_text: str, jobs_to_score: List[Dict]) -> List[Dict]:
+    def __init__(self, batch_size: int = None, embedding_store: Optional[EmbeddingStore] = None,
+                 pooling: str = None, chunk_words: int = None, job_index: Optional[JobVectorIndex] = None,
+                 backend: str = None, shortlist: int = None, job_store: Optional[JobStore] = None):
+        self.batch_size = batch_size or ENCODE_BATCH_SIZE
+        self.shortlist = JOB_MATCH_SHORTLIST if shortlist is None else shortlist
+        self.backend = backend or EMBEDDING_BACKEND
+        if self.backend not in EMBEDDING_BACKENDS:
+            raise ValueError(f"Unknown embedding backend '{self.backend}', expected one of {', '.join(EMBEDDING_BACKENDS)}")
+        register_backend(self.backend)
+        self.embedding_store = embedding_store
+        self.job_index = job_index
+        self._job_index_dirty = False
+        self.job_store = job_store
+        self.pooling = pooling or RESUME_POOLING
+        self.chunk_words = chunk_words or RESUME_CHUNK_WORDS
+        if self.pooling not in ("mean", "max", "truncate"):
+            raise ValueError(f"Unknown resume pooling '{self.pooling}', expected mean, max or truncate")
+        # Jobs scoring below this match_score are not shown
+        self.min_match_score = MIN_MATCH_SCORES[self.pooling]
+        self._resume_cache = OrderedDict()
+        self._resume_cache_lock = threading.Lock()
+        self._init_lock = threading.Lock()
+        self._model = None
+        self._model_failed = False
+    
+    @property
+    def model(self) -> Optional[SentenceTransformer]:
+        """
+        The shared SentenceTransformer, fetched from the model registry on
+        first use (None if it could not be loaded). The embedding cache and
+        job index are opened at the same time, since they need its dimension.
+        """
+        if self._model is None and not self._model_failed:
+            with self._init_lock:
+                if self._model is None and not self._model_failed:
+                    try:
+                        model = registry.get(model_key(self.backend))
+                    except Exception as e:
+                        logging.error(f"Failed to load SentenceTransformer model: {e}")
+                        self._model_failed = True
+                        return None
+                    self._open_stores(model.get_sentence_embedding_dimension())
+                    self._model = model
+        return self._model
+    
+    def _open_stores(self, dim: int):
+        if self.embedding_store is None and EMBEDDING_CACHE_DIR:
+            try:
+                # Backends produce slightly different vectors, so each keeps its own cache
+                directory = EMBEDDING_CACHE_DIR if self.backend == "fp32" else f"{EMBEDDING_CACHE_DIR}-{self.backend}"
+                self.embedding_store = get_embedding_store(directory, model_key(self.backend), dim)
+            except Exception as e:
+                logging.warning(f"Job embedding cache disabled: {e}")
+        
+        if self.job_index is None and JOB_INDEX_DIR:
+            try:
+                # Like the embedding cache, each backend's vectors get their own index
+                directory = JOB_INDEX_DIR if self.backend == "fp32" else f"{JOB_INDEX_DIR}-{self.backend}"
+                name = f"{model_key(self.backend)}/v{JOB_INDEX_VERSION}"
+                if os.path.exists(os.path.join(directory, JobVectorIndex.META_FILE)):
+                    try:
+                        self.job_index = JobVectorIndex.load(directory, model_name=name)
+                    except ValueError as e:
+                        logging.warning(f"{e}; starting a new job index there")
+                if self.job_index is None:
+                    self.job_index = JobVectorIndex(dim, backend=JOB_INDEX_BACKEND, model_name=name)
+                    self.job_index.directory = directory
+                atexit.register(self.save_index)
+            except Exception as e:
+                logging.warning(f"Job vector index disabled: {e}")
+    
+    def _job_store(self) -> JobStore:
+        """Where indexed postings are kept (default: the process-wide JobStore)."""
+        if self.job_store is None:
+            self.job_store = get_job_store()
+        return self.job_store
+    
+    @staticmethod
+    def job_id(job: Dict) -> str:
+        """Stable identifier of a job posting in the vector index: its JobStore key."""
+        return job_key(job)
+    
+    @classmethod
+    def index_metadata(cls, job: Dict) -> Dict:
+        """What the vector index keeps per job: the filter fields and a hash of the embedded text."""
+        metadata = {field: job[field] for field in FILTER_FIELDS if job.get(field)}
+        metadata["text_hash"] = hashlib.sha256(cls.job_text(job).encode("utf-8")).hexdigest()[:16]
+        return metadata
+    
+    @staticmethod
+    def job_text(job: Dict) -> str:
+        """
+        Text that represents a job posting for embedding: title, company and
+        location, plus skills and the start of the description once the
+        posting is enriched (see job_enricher).
+        """
+        text = f"{job['title']}. {job['company']} in {job['location']}"
+        if job.get('skills'):
+            text += f". Skills: {', '.join(job['skills'])}"
+        if job.get('description'):
+            text += ". " + " ".join(job['description'].split()[:JOB_TEXT_DESCRIPTION_WORDS])
+        return normalize_job_text(text)
+    
+    @staticmethod
+    def lexical_text(job: Dict) -> str:
+        """Text that represents a job posting for BM25 (includes skills and the description when known)."""
+        return f"{job['title']} {job['company']} {job['location']} {' '.join(job.get('skills') or ())} {job.get('description') or ''}"
+    
+    def encode_jobs(self, jobs: List[Dict]) -> np.ndarray:
+        """
+        Embed job postings, reusing cached vectors and encoding only cache misses.
+        
+        Returns:
+            np.ndarray: (len(jobs), dim) float32 matrix in input order
+        """
+        texts = [self.job_text(job) for job in jobs]
+        if self.embedding_store is None:
+            return self.model.encode(texts, batch_size=self.batch_size, convert_to_numpy=True)
+        
+        keys = [self.embedding_store.key_for(text) for text in texts]
+        vectors, missing = self.embedding_store.get_many(keys)
+        if missing:
+            encoded = self.model.encode([texts[i] for i in missing], batch_size=self.batch_size, convert_to_numpy=True)
+            vectors[missing] = encoded
+            self.embedding_store.put_many([keys[i] for i in missing], encoded)
+        logging.info(f"Job embeddings: {len(jobs) - len(missing)} cached, {len(missing)} encoded")
+        return vectors
+    
+    def _resume_key(self, resume_text: str) -> str:
+        return hashlib.sha256(f"{self.pooling}:{self.chunk_words}:{resume_text}".encode("utf-8")).hexdigest()
+    
+    def encode_resume(self, resume_text: str) -> np.ndarray:
+        """
+        Embed a whole resume, cached by the hash of its text.
+        
+        The resume is split into section-aware chunks that each fit the
+        model's input window, the chunks are encoded in one batch, and the
+        normalized chunk vectors are mean- or max-pooled.
+        """
+        return self.encode_resumes([resume_text])[0]
+    
+    def encode_resumes(self, resume_texts: List[str]) -> np.ndarray:
+        """
+        Embed many resumes (see encode_resume), encoding the chunks of every
+        uncached resume in a single batched call.
+        
+        Returns:
+            np.ndarray: (len(resume_texts), dim) float32 matrix in input order
+        """
+        keys = [self._resume_key(text) for text in resume_texts]
+        embeddings: List[Optional[np.ndarray]] = [None] * len(resume_texts)
+        with self._resume_cache_lock:
+            for position, key in enumerate(keys):
+                if key in self._resume_cache:
+                    self._resume_cache.move_to_end(key)
+                    embeddings[position] = self._resume_cache[key]
+        missing = [position for position, embedding in enumerate(embeddings) if embedding is None]
+        
+        if missing:
+            if self.pooling == "truncate":
+                encoded = self.model.encode([resume_texts[i] for i in missing], batch_size=self.batch_size,
+                                            convert_to_numpy=True)
+            else:
+                chunks, owners = [], []
+                for position in missing:
+                    resume_chunks = chunk_resume(resume_texts[position], self.chunk_words)
+                    chunks.extend(resume_chunks)
+                    owners.extend([position] * len(resume_chunks))
+                vectors = self.model.encode(chunks, batch_size=self.batch_size, convert_to_numpy=True,
+                                            normalize_embeddings=True)
+                owners = np.array(owners)
+                pool = np.max if self.pooling == "max" else np.mean
+                encoded = [pool(vectors[owners == position], axis=0) for position in missing]
+            
+            with self._resume_cache_lock:
+                for position, embedding in zip(missing, encoded):
+                    embeddings[position] = embedding
+                    self._resume_cache[keys[position]] = embedding
+                while len(self._resume_cache) > RESUME_CACHE_SIZE:
+                    self._resume_cache.popitem(last=False)
+        return np.stack(embeddings).astype(np.float32, copy=False)
+    
+    def match_resume_to_jobs(self, resume_text: str, jobs_to_score: List[Dict], top_n: int = None,
+                             min_score: float = None) -> List[Dict]:
         """
         Scores a pre-fetched list of jobs against the resume using semantic similarity.
+        
+        Job vectors come from the embedding cache where possible; the rest are
+        encoded in one batched call, and all jobs are scored with a single
+        cosine-similarity matrix operation.
+        
+        Without top_n and min_score every job is returned in input order;
+        with either one the result is match_many()'s best-first selection.
         """
+        if top_n is not None or min_score is not None:
+            return self.match_many([resume_text], jobs_to_score, top_k=top_n, min_score=min_score)[0]
         if not self.model:
             logging.error("Semantic model not available. Cannot perform matching.")
             return []
@@ -26,23 +328,192 @@ class JobMatcher:
             return []
         
         try:
-            resume_embedding = self.model.encode(resume_text, convert_to_tensor=True)
-            job_matches = []
-            
-            for job in jobs_to_score:
-                job_text = f"{job['title']}. {job['company']} in {job['location']}"
-                job_embedding = self.model.encode(job_text, convert_to_tensor=True)
-                
-                semantic_score = util.pytorch_cos_sim(resume_embedding, job_embedding)[0][0].item()
-                
-                job_match = {
-                    "job": job,
-                    "match_score": semantic_score * 100
-                }
-                job_matches.append(job_match)
-            
-            return job_matches
+            resume_embedding = self.encode_resume(resume_text)
+            job_embeddings = self.encode_jobs(jobs_to_score)
+            self.index_jobs(jobs_to_score, job_embeddings)
             
+            semantic_scores = util.cos_sim(resume_embedding, job_embeddings)[0].tolist()
+            
+            return [
+                {"job": job, "match_score": score * 100}
+                for job, score in zip(jobs_to_score, semantic_scores)
+            ]
+        
+        except Exception as e:
+            logging.error(f"Error during semantic matching process: {e}", exc_info=True)
+            return []
+    
+    def match_many(self, resumes: List[str], jobs: List[Dict], top_k: int = None,
+                   min_score: float = None, shortlist: int = None) -> List[List[Dict]]:
+        """
+        Match many resumes against many jobs at once.
+        
+        All resume/job cosine similarities are computed as one N x M matrix.
+        Per resume, jobs below min_score are dropped and the best top_k are
+        picked with argpartition, so only the survivors are sorted and turned
+        into match dicts.
+        
+        When there are more jobs than the shortlist size and most of them
+        have a description, a BM25 index over the job text first picks that
+        many candidates per resume, and only those are embedded and
+        semantically reranked.
+        
+        Args:
+            resumes: Resume texts
+            jobs: Job postings
+            top_k: Maximum matches per resume (default: all)
+            min_score: Minimum match_score on the 0-100 scale (default: none)
+            shortlist: BM25 candidates per resume; 0 scores every job (default: self.shortlist)
+            
+        Returns:
+            list: One best-first list of {"job", "match_score"} dicts per resume
+        """
+        if not self.model:
+            logging.error("Semantic model not available. Cannot perform matching.")
+            return [[] for _ in resumes]
+        if not resumes or not jobs:
+            return [[] for _ in resumes]
+        
+        shortlist = self.shortlist if shortlist is None else shortlist
+        try:
+            # Columns of the score matrix are jobs[scored[i]]; per resume only its
+            # shortlisted columns are eligible
+            described = sum(1 for job in jobs if job.get('description'))
+            if shortlist and len(jobs) > shortlist and described * 2 > len(jobs):
+                lexical = BM25Index.from_texts([self.lexical_text(job) for job in jobs])
+                shortlists = [lexical.top_k(text, shortlist) for text in resumes]
+                scored = np.unique(np.concatenate(shortlists))
+                eligible = [np.searchsorted(scored, candidates) for candidates in shortlists]
+                logging.info(f"BM25 shortlisted {len(scored)} of {len(jobs)} jobs for semantic reranking")
+            else:
+                scored = np.arange(len(jobs))
+                eligible = [scored] * len(resumes)
+            scored_jobs = [jobs[i] for i in scored]
+            
+            resume_embeddings = self.encode_resumes(resumes)
+            job_embeddings = self.encode_jobs(scored_jobs)
+            self.index_jobs(scored_jobs, job_embeddings)
+            
+            resume_embeddings /= np.maximum(np.linalg.norm(resume_embeddings, axis=1, keepdims=True), 1e-12)
+            job_embeddings = job_embeddings / np.maximum(np.linalg.norm(job_embeddings, axis=1, keepdims=True), 1e-12)
+            scores = (resume_embeddings @ job_embeddings.T) * 100
+            
+            results = []
+            for row, candidates in zip(scores, eligible):
+                if min_score is not None:
+                    candidates = candidates[row[candidates] >= min_score]
+                if top_k is not None and top_k < len(candidates):
+                    candidates = candidates[np.argpartition(-row[candidates], top_k - 1)[:top_k]]
+                candidates = candidates[np.argsort(-row[candidates], kind="stable")]
+                results.append([{"job": scored_jobs[j], "match_score": float(row[j])} for j in candidates])
+            return results
+        
         except Exception as e:
             logging.error(f"Error during semantic matching process: {e}", exc_info=True)
-            return []
\ No newline at end of file
+            return [[] for _ in resumes]
+    
+    def match_stream(self, resume_text: str, jobs: Iterable[Dict], min_score: float,
+                     enough: int, batch_size: int = None) -> List[Dict]:
+        """
+        Match a resume against a stream of jobs, stopping once `enough` jobs
+        score at least min_score.
+        
+        Jobs are pulled from the iterable (e.g. iter_linkedin_jobs or
+        iter_unique_jobs) a batch at a time and scored with match_many; once
+        the target is met the iterable is closed, which cancels any pending
+        fetches behind it.
+        
+        Returns:
+            list: Best-first {"job", "match_score"} dicts scoring at least min_score
+        """
+        batch_size = batch_size or self.batch_size
+        stream = iter(jobs)
+        matches = []
+        try:
+            while len(matches) < enough:
+                batch = list(islice(stream, batch_size))
+                if not batch:
+                    break
+                matches.extend(self.match_many([resume_text], batch, min_score=min_score, shortlist=0)[0])
+        finally:
+            if hasattr(stream, "close"):
+                stream.close()
+        matches.sort(key=lambda match: match["match_score"], reverse=True)
+        return matches
+    
+    def index_jobs(self, jobs: List[Dict], vectors: Optional[np.ndarray] = None) -> int:
+        """
+        Add jobs to the persistent vector index, replacing indexed jobs whose
+        embedded text changed (e.g. after enrichment added a description).
+        The postings themselves are upserted into the job store.
+        
+        Returns:
+            int: Number of jobs added or replaced
+        """
+        if self.job_index is None or not jobs:
+            return 0
+        # A job listed twice in one call is indexed once, from its last occurrence
+        last = {self.job_id(job): i for i, job in enumerate(jobs)}
+        positions = []
+        metadata = {}
+        for job_id, i in last.items():
+            indexed = self.job_index.get(job_id)
+            metadata[i] = self.index_metadata(jobs[i])
+            if indexed is None or indexed.get("text_hash") != metadata[i]["text_hash"]:
+                positions.append(i)
+        positions.sort()
+        if not positions:
+            return 0
+        new_jobs = [jobs[i] for i in positions]
+        new_vectors = self.encode_jobs(new_jobs) if vectors is None else np.asarray(vectors)[positions]
+        self._job_store().upsert_jobs(new_jobs)
+        self.job_index.add([self.job_id(job) for job in new_jobs], new_vectors, [metadata[i] for i in positions])
+        self._job_index_dirty = True
+        return len(new_jobs)
+    
+    def remove_jobs(self, job_ids: List[str]) -> int:
+        """Delete jobs (e.g. expired postings) from the vector index."""
+        if not self.model or self.job_index is None:
+            return 0
+        removed = self.job_index.remove(job_ids)
+        self._job_index_dirty = self._job_index_dirty or removed > 0
+        return removed
+    
+    def save_index(self):
+        """Persist the vector index to its own directory if it changed since the last save."""
+        if self.job_index is None or not self._job_index_dirty or not self.job_index.directory:
+            return
+        try:
+            self.job_index.save()
+            self._job_index_dirty = False
+        except Exception as e:
+            logging.error(f"Failed to save job vector index: {e}")
+    
+    def search_jobs(self, query: str, filters: Optional[Dict] = None, top_k: int = 50) -> List[Dict]:
+        """
+        Find the indexed jobs closest to a query or resume text.
+        
+        Args:
+            query: Free-text query or full resume text
+            filters: Metadata filters, e.g. {"location": "Pune", "source": ["LinkedIn", "Indeed"]};
+                location matches as a case-insensitive prefix ("Pune" matches "Pune, Maharashtra, India"),
+                other fields exactly (see JobVectorIndex._filter_mask)
+            top_k: Maximum number of jobs to return
+            
+        Returns:
+            list: Job dicts, best first, each with an added "match_score" (0-100)
+        """
+        if not self.model or self.job_index is None:
+            return []
+        query_embedding = self.encode_resume(query)
+        results = self.job_index.search(query_embedding, k=top_k, filters=filters)
+        jobs = self._job_store().get_jobs([job_id for job_id, _, _ in results])
+        return [{**jobs[job_id], "match_score": score * 100} for job_id, score, _ in results if job_id in jobs]
+    
+    def get_all_jobs(self) -> List[Dict]:
+        """All jobs in the vector index, as stored in the job store."""
+        if not self.model or self.job_index is None:
+            return []
+        ids = self.job_index.all_ids()
+        jobs = self._job_store().get_jobs(ids)
+        return [jobs[job_id] for job_id in ids if job_id in jobs]
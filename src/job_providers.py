@@ -0,0 +1,229 @@
+# src/job_providers.py
+
+import os
+import time
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+from . import http_client
+from .job_store import normalize_field
+from .rate_limit import HostRateLimiter
+from .search_executor import SEARCH_MAX_WORKERS, SearchQuery, iter_search_results
+from .web_scraper import scrape_linkedin_jobs
+
+# JSON job search APIs; a provider is enabled when both its key and URL are set
+LINKEDIN_API_KEY = os.environ.get('LINKEDIN_API_KEY')
+LINKEDIN_API_URL = os.environ.get('LINKEDIN_API_URL', '')
+INDEED_API_KEY = os.environ.get('INDEED_API_KEY')
+INDEED_API_URL = os.environ.get('INDEED_API_URL', '')
+PROVIDER_TIMEOUT_SECONDS = float(os.environ.get('PROVIDER_TIMEOUT_SECONDS', 10))
+
+# Shared by every API provider (per host), so recreating the providers keeps the request budget
+api_rate_limiter = HostRateLimiter()
+
+# Source field names mapped onto the job schema (title, company, location, link,
+# source, description); the first one present wins
+FIELD_ALIASES = {
+    "title": ("title", "jobtitle", "job_title", "jobTitle"),
+    "company": ("company", "company_name", "companyName", "employer"),
+    "location": ("location", "formattedLocation", "job_location", "city"),
+    "link": ("link", "url", "job_url", "jobUrl", "apply_url"),
+    "description": ("description", "snippet", "summary"),
+}
+
+
+def normalize_job(raw: Dict, source: str) -> Optional[Dict]:
+    """
+    A provider's job record in the common schema, or None without a title
+    and company. The schema fields are stripped and have their whitespace
+    collapsed; every other field of the record (experience_level,
+    work_model, skills, ...) is kept, with a comma-separated skills string
+    split into a list.
+    """
+    job = dict(raw)
+    for field, aliases in FIELD_ALIASES.items():
+        value = next((raw[alias] for alias in aliases if raw.get(alias)), "")
+        job[field] = " ".join(str(value).split())
+    if not job["title"] or not job["company"]:
+        return None
+    job["source"] = raw.get("source") or source
+    if not job["description"]:
+        del job["description"]
+    if isinstance(job.get("skills"), str):
+        job["skills"] = [skill.strip() for skill in job["skills"].split(",") if skill.strip()]
+    return job
+
+
+def dedup_key(job: Dict):
+    """The same posting listed by several sources has different links, so match on text."""
+    return tuple(normalize_field(job.get(field)) for field in ("title", "company", "location"))
+
+
+class ProviderMetrics:
+    """Thread-safe per-provider counters: calls, errors, timeouts, results and latency."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._stats: Dict[str, Dict] = {}
+
+    def _entry(self, name: str) -> Dict:
+        return self._stats.setdefault(name, {"calls": 0, "errors": 0, "timeouts": 0, "results": 0,
+                                             "latency_seconds": 0.0, "max_latency_seconds": 0.0})
+
+    def record(self, name: str, seconds: float, results: int = 0, error: bool = False):
+        with self._lock:
+            entry = self._entry(name)
+            entry["calls"] += 1
+            entry["errors"] += int(error)
+            entry["results"] += results
+            entry["latency_seconds"] += seconds
+            entry["max_latency_seconds"] = max(entry["max_latency_seconds"], seconds)
+
+    def record_timeout(self, name: str):
+        with self._lock:
+            self._entry(name)["timeouts"] += 1
+
+    def snapshot(self) -> Dict[str, Dict]:
+        with self._lock:
+            stats = {name: dict(entry) for name, entry in self._stats.items()}
+        for entry in stats.values():
+            entry["avg_latency_ms"] = round(entry["latency_seconds"] / entry["calls"] * 1000, 1) if entry["calls"] else None
+            entry["max_latency_ms"] = round(entry.pop("max_latency_seconds") * 1000, 1)
+            del entry["latency_seconds"]
+        return stats
+
+
+metrics = ProviderMetrics()
+
+
+class JobProvider(ABC):
+    """A job source. Subclasses implement search() and return raw job dicts."""
+
+    name = "provider"
+
+    @abstractmethod
+    def search(self, term: str, location: str, work_model: str = "", experience_level: str = "") -> List[Dict]:
+        """Raw job dicts for one query; normalize_job maps them onto the common schema."""
+
+
+class FunctionProvider(JobProvider):
+    """A provider backed by a fetch(term, location, work_model, experience_level) callable."""
+
+    def __init__(self, name: str, fetch: Callable[..., List[Dict]]):
+        self.name = name
+        self.fetch = fetch
+
+    def search(self, term: str, location: str, work_model: str = "", experience_level: str = "") -> List[Dict]:
+        return self.fetch(term, location, work_model, experience_level)
+
+
+class JsonApiProvider(JobProvider):
+    """
+    A JSON job search API called as GET url?keywords=&location=[&work_model=][&experience_level=]
+    with the key as a bearer token. Jobs are read from the first list found
+    under results_fields (or the top level) and mapped through FIELD_ALIASES.
+    """
+
+    results_fields = ("jobs", "results", "data", "elements")
+
+    def __init__(self, name: str, url: str, api_key: str, timeout: float = None, rate_limiter: HostRateLimiter = None):
+        self.name = name
+        self.url = url
+        self.api_key = api_key
+        self.timeout = timeout or PROVIDER_TIMEOUT_SECONDS
+        self.rate_limiter = rate_limiter or api_rate_limiter
+
+    def search(self, term: str, location: str, work_model: str = "", experience_level: str = "") -> List[Dict]:
+        params = {"keywords": term, "location": location}
+        if work_model:
+            params["work_model"] = work_model
+        if experience_level:
+            params["experience_level"] = experience_level
+        response = http_client.get(self.url, headers={"Authorization": f"Bearer {self.api_key}", "Accept": "application/json"},
+                                   timeout=self.timeout, rate_limiter=self.rate_limiter, params=params)
+        response.raise_for_status()
+        payload = response.json()
+        if isinstance(payload, dict):
+            payload = next((payload[field] for field in self.results_fields if isinstance(payload.get(field), list)), [])
+        return [job for job in payload if isinstance(job, dict)]
+
+
+class StubProvider(JobProvider):
+    """Local provider for tests and benchmarks: fixed jobs after an optional delay, or an error."""
+
+    def __init__(self, name: str, jobs: Sequence[Dict] = (), latency_seconds: float = 0.0, error: Exception = None):
+        self.name = name
+        self.jobs = list(jobs)
+        self.latency_seconds = latency_seconds
+        self.error = error
+
+    def search(self, term: str, location: str, work_model: str = "", experience_level: str = "") -> List[Dict]:
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        if self.error is not None:
+            raise self.error
+        return [dict(job) for job in self.jobs]
+
+
+def default_providers(linkedin_fetch: Callable[..., List[Dict]] = None) -> List[JobProvider]:
+    """
+    The LinkedIn scraper (through linkedin_fetch, e.g. a job store lookup,
+    when given) plus every API provider whose key and URL are configured.
+    """
+    providers: List[JobProvider] = [FunctionProvider("linkedin", linkedin_fetch or scrape_linkedin_jobs)]
+    if LINKEDIN_API_KEY and LINKEDIN_API_URL:
+        providers.append(JsonApiProvider("linkedin_api", LINKEDIN_API_URL, LINKEDIN_API_KEY))
+    if INDEED_API_KEY and INDEED_API_URL:
+        providers.append(JsonApiProvider("indeed", INDEED_API_URL, INDEED_API_KEY))
+    return providers
+
+
+def search_providers(providers: Sequence[JobProvider], queries: Sequence[SearchQuery],
+                     max_workers: int = None, deadline_seconds: float = None,
+                     provider_metrics: ProviderMetrics = None) -> Iterator[Dict]:
+    """
+    Run every query against every provider concurrently and yield normalized,
+    deduplicated jobs as each (provider, query) call finishes.
+
+    All calls share one deadline (see iter_search_results), and each provider
+    runs in its own pool of max_workers threads (default SEARCH_MAX_WORKERS),
+    so a slow or failing source only loses its own results. Calls still
+    running at the deadline are counted as timeouts in the provider metrics.
+    """
+    provider_metrics = provider_metrics or metrics
+    by_name = {provider.name: provider for provider in providers}
+    tasks = [(provider.name, *query) for query in queries for provider in providers]
+    finished = set()
+
+    def call(name, *query):
+        started = time.perf_counter()
+        try:
+            jobs = by_name[name].search(*query)
+        except Exception:
+            provider_metrics.record(name, time.perf_counter() - started, error=True)
+            raise
+        finally:
+            finished.add((name, *query))
+        provider_metrics.record(name, time.perf_counter() - started, results=len(jobs))
+        return jobs
+
+    seen = set()
+    for (name, *_), results in iter_search_results(tasks, call, max_workers or SEARCH_MAX_WORKERS, deadline_seconds,
+                                                   group=lambda task: task[0]):
+        for raw in results:
+            job = normalize_job(raw, name)
+            if job is None:
+                continue
+            key = dedup_key(job)
+            if key not in seen:
+                seen.add(key)
+                yield job
+    for name, *_ in (task for task in tasks if task not in finished):
+        provider_metrics.record_timeout(name)
+    logging.info(f"Job providers: {provider_metrics.snapshot()}")
@@ -0,0 +1,369 @@
+# src/job_store.py
+
+import os
+import re
+import json
+import time
+import sqlite3
+import logging
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+JOB_STORE_PATH = os.environ.get('JOB_STORE_PATH', 'data/jobs.db')
+
+# Searches scraped more recently than this are answered from the store
+JOB_STORE_MAX_AGE_HOURS = float(os.environ.get('JOB_STORE_MAX_AGE_HOURS', 12))
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_LINKEDIN_JOB_ID_RE = re.compile(r"linkedin\.com/jobs/view/(?:[^/?#]*-)?(\d+)")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_key TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    company TEXT NOT NULL,
+    location TEXT NOT NULL,
+    link TEXT,
+    source TEXT,
+    description TEXT,
+    work_model TEXT,
+    experience_level TEXT,
+    title_key TEXT NOT NULL,
+    company_key TEXT NOT NULL,
+    location_key TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_location ON jobs (location_key);
+CREATE INDEX IF NOT EXISTS jobs_experience_level ON jobs (experience_level);
+CREATE INDEX IF NOT EXISTS jobs_title_company ON jobs (title_key, company_key);
+CREATE INDEX IF NOT EXISTS jobs_last_seen ON jobs (last_seen);
+
+CREATE TABLE IF NOT EXISTS searches (
+    search_id INTEGER PRIMARY KEY,
+    term TEXT NOT NULL,
+    location TEXT NOT NULL,
+    work_model TEXT NOT NULL,
+    experience_level TEXT NOT NULL,
+    scraped_at REAL NOT NULL,
+    UNIQUE (term, location, work_model, experience_level)
+);
+
+CREATE TABLE IF NOT EXISTS search_results (
+    search_id INTEGER NOT NULL REFERENCES searches (search_id),
+    job_key TEXT NOT NULL REFERENCES jobs (job_key),
+    PRIMARY KEY (search_id, job_key)
+);
+
+CREATE TABLE IF NOT EXISTS job_details (
+    link_key TEXT PRIMARY KEY,
+    description TEXT NOT NULL,
+    skills TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+"""
+
+_UPSERT_JOB = """
+INSERT INTO jobs (job_key, title, company, location, link, source, description, work_model, experience_level,
+                  title_key, company_key, location_key, first_seen, last_seen)
+VALUES (:job_key, :title, :company, :location, :link, :source, :description, :work_model, :experience_level,
+        :title_key, :company_key, :location_key, :now, :now)
+ON CONFLICT (job_key) DO UPDATE SET
+    title = excluded.title,
+    company = excluded.company,
+    location = excluded.location,
+    link = COALESCE(excluded.link, jobs.link),
+    source = COALESCE(excluded.source, jobs.source),
+    description = COALESCE(excluded.description, jobs.description),
+    work_model = COALESCE(excluded.work_model, jobs.work_model),
+    experience_level = COALESCE(excluded.experience_level, jobs.experience_level),
+    last_seen = excluded.last_seen
+"""
+
+_JOB_COLUMNS = ("title", "company", "location", "link", "source", "description", "work_model",
+                "experience_level", "first_seen", "last_seen")
+
+
+def normalize_field(value: Optional[str]) -> str:
+    """Lowercase and collapse whitespace, for keys and filters."""
+    return _WHITESPACE_RE.sub(" ", value or "").strip().lower()
+
+
+def normalize_link(link: Optional[str]) -> str:
+    """
+    Canonical form of a posting URL: LinkedIn links reduce to their job id,
+    other links lose their query string, fragment, "www." and trailing slash.
+    """
+    if not link:
+        return ""
+    match = _LINKEDIN_JOB_ID_RE.search(link)
+    if match:
+        return f"linkedin:{match.group(1)}"
+    parts = urlsplit(link.strip())
+    host = parts.netloc.lower()
+    host = host[4:] if host.startswith("www.") else host
+    return f"{host}{parts.path.rstrip('/')}"
+
+
+def job_key(job: Dict) -> str:
+    """Dedup key of a posting: its normalized link, or normalized title/company/location without one."""
+    link = normalize_link(job.get("link"))
+    if link:
+        return link
+    return "|".join(normalize_field(job.get(field)) for field in ("title", "company", "location"))
+
+
+class JobStore:
+    """
+    SQLite job store (WAL mode) shared by scraping runs and the web app.
+
+    Jobs are upserted by job_key, keeping first_seen/last_seen. Each scraped
+    search is recorded with its results, so a later run asking for the same
+    search within JOB_STORE_MAX_AGE_HOURS is answered from the store instead
+    of scraping again. Posting details fetched by job_enricher are kept per
+    link in job_details. Connections are per thread.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path or JOB_STORE_PATH
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def upsert_jobs(self, jobs: Iterable[Dict], work_model: str = None, experience_level: str = None) -> List[str]:
+        """
+        Insert or refresh jobs in one transaction.
+
+        Args:
+            jobs: Job dicts with title, company, location and optionally link, source, description
+            work_model: Work model of the search that found them, if the job doesn't say
+            experience_level: Experience level of the search that found them, if the job doesn't say
+
+        Returns:
+            list: job_key of every job, in input order
+        """
+        now = time.time()
+        rows = []
+        for job in jobs:
+            rows.append({
+                "job_key": job_key(job),
+                "title": job["title"],
+                "company": job["company"],
+                "location": job["location"],
+                "link": job.get("link"),
+                "source": job.get("source"),
+                "description": job.get("description"),
+                "work_model": normalize_field(job.get("work_model") or work_model) or None,
+                "experience_level": normalize_field(job.get("experience_level") or experience_level) or None,
+                "title_key": normalize_field(job["title"]),
+                "company_key": normalize_field(job["company"]),
+                "location_key": normalize_field(job["location"]),
+                "now": now,
+            })
+        with self._connection() as conn:
+            conn.executemany(_UPSERT_JOB, rows)
+        return [row["job_key"] for row in rows]
+
+    @staticmethod
+    def _search_params(term: str, location: str, work_model: str, experience_level: str) -> Tuple[str, ...]:
+        return tuple(normalize_field(value) for value in (term, location, work_model, experience_level))
+
+    def record_search(self, term: str, location: str, work_model: str, experience_level: str,
+                      jobs: List[Dict]) -> List[str]:
+        """Upsert a search's results and remember which jobs it returned."""
+        keys = self.upsert_jobs(jobs, work_model=work_model, experience_level=experience_level)
+        params = self._search_params(term, location, work_model, experience_level)
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT INTO searches (term, location, work_model, experience_level, scraped_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (term, location, work_model, experience_level) DO UPDATE SET scraped_at = excluded.scraped_at",
+                params + (time.time(),),
+            )
+            search_id = conn.execute(
+                "SELECT search_id FROM searches WHERE term = ? AND location = ? AND work_model = ? AND experience_level = ?",
+                params,
+            ).fetchone()[0]
+            conn.execute("DELETE FROM search_results WHERE search_id = ?", (search_id,))
+            conn.executemany("INSERT OR IGNORE INTO search_results (search_id, job_key) VALUES (?, ?)",
+                             [(search_id, key) for key in keys])
+        return keys
+
+    def cached_search(self, term: str, location: str, work_model: str, experience_level: str,
+                      max_age_seconds: float) -> Optional[List[Dict]]:
+        """Jobs of a search scraped within max_age_seconds, or None if it must be scraped again."""
+        params = self._search_params(term, location, work_model, experience_level)
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT search_id, scraped_at FROM searches "
+            "WHERE term = ? AND location = ? AND work_model = ? AND experience_level = ?",
+            params,
+        ).fetchone()
+        if row is None or time.time() - row["scraped_at"] > max_age_seconds:
+            return None
+        rows = conn.execute(
+            f"SELECT {', '.join(_JOB_COLUMNS)} FROM jobs JOIN search_results USING (job_key) WHERE search_id = ?",
+            (row["search_id"],),
+        ).fetchall()
+        return [self._to_job(r) for r in rows]
+
+    def get_or_fetch(self, term: str, location: str, work_model: str, experience_level: str,
+                     fetch: Callable[[str, str, str, str], List[Dict]], max_age_seconds: float = None) -> List[Dict]:
+        """
+        Answer a search from the store if it is fresh enough, otherwise call
+        fetch(term, location, work_model, experience_level) and store the result.
+        Either way the jobs are the stored rows, so they carry the search's
+        work_model and experience_level and filter the same on every call.
+        """
+        if max_age_seconds is None:
+            max_age_seconds = JOB_STORE_MAX_AGE_HOURS * 3600
+        jobs = self.cached_search(term, location, work_model, experience_level, max_age_seconds)
+        if jobs is not None:
+            logging.info(f"Job store: reusing {len(jobs)} jobs for '{term}' in {location}")
+            return jobs
+        jobs = fetch(term, location, work_model, experience_level)
+        # An empty result is usually a failed scrape, so it isn't cached as a search
+        if not jobs:
+            return jobs
+        keys = self.record_search(term, location, work_model, experience_level, jobs)
+        stored = self.get_jobs(keys)
+        return [stored[key] for key in dict.fromkeys(keys) if key in stored]
+
+    def find_jobs(self, location: str = None, experience_level: str = None, work_model: str = None,
+                  max_age_seconds: float = None, limit: int = None) -> List[Dict]:
+        """
+        Query stored jobs, most recently seen first.
+
+        Args:
+            location: Location prefix, case-insensitive ("pune" matches "Pune, Maharashtra, India")
+            experience_level: Experience level of the search that found the job
+            work_model: Work model of the search that found the job
+            max_age_seconds: Only jobs seen within this many seconds
+            limit: Maximum number of jobs
+        """
+        clauses, params = [], []
+        if location:
+            prefix = normalize_field(location)
+            # Range instead of LIKE so the location index is used
+            clauses.append("location_key >= ? AND location_key < ?")
+            params += [prefix, prefix + "\uffff"]
+        if experience_level:
+            clauses.append("experience_level = ?")
+            params.append(normalize_field(experience_level))
+        if work_model:
+            clauses.append("work_model = ?")
+            params.append(normalize_field(work_model))
+        if max_age_seconds is not None:
+            clauses.append("last_seen >= ?")
+            params.append(time.time() - max_age_seconds)
+        sql = f"SELECT {', '.join(_JOB_COLUMNS)} FROM jobs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY last_seen DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        return [self._to_job(row) for row in self._connection().execute(sql, params).fetchall()]
+
+    def get_jobs(self, keys: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Stored jobs by job_key (see job_key), with "skills" from job_details
+        once the posting was enriched. Unknown keys are missing from the result.
+        """
+        keys = list(dict.fromkeys(keys))
+        columns = ", ".join(f"jobs.{column}" for column in _JOB_COLUMNS)
+        jobs = {}
+        conn = self._connection()
+        for start in range(0, len(keys), 500):  # stay under SQLite's bound-parameter limit
+            chunk = keys[start:start + 500]
+            rows = conn.execute(
+                f"SELECT jobs.job_key, {columns}, job_details.skills FROM jobs "
+                f"LEFT JOIN job_details ON job_details.link_key = jobs.job_key "
+                f"WHERE jobs.job_key IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            ).fetchall()
+            for row in rows:
+                job = self._to_job(row)
+                if row["skills"]:
+                    job["skills"] = json.loads(row["skills"])
+                jobs[row["job_key"]] = job
+        return jobs
+
+    def get_details(self, links: Iterable[str], max_age_seconds: float) -> Dict[str, Dict]:
+        """
+        Posting details fetched within max_age_seconds, as link -> {"description", "skills"}
+        (see put_details). Links without fresh details are missing from the result.
+        """
+        by_key = {}
+        for link in links:
+            key = normalize_link(link)
+            if key:
+                by_key.setdefault(key, []).append(link)
+        details = {}
+        keys = list(by_key)
+        conn = self._connection()
+        for start in range(0, len(keys), 500):  # stay under SQLite's bound-parameter limit
+            chunk = keys[start:start + 500]
+            rows = conn.execute(
+                f"SELECT link_key, description, skills FROM job_details "
+                f"WHERE link_key IN ({', '.join('?' * len(chunk))}) AND fetched_at >= ?",
+                chunk + [time.time() - max_age_seconds],
+            ).fetchall()
+            for row in rows:
+                for link in by_key[row["link_key"]]:
+                    details[link] = {"description": row["description"], "skills": json.loads(row["skills"])}
+        return details
+
+    def put_details(self, link: str, description: str, skills: List[str]):
+        """Remember a posting's detail page (description may be empty); the job's description is updated too."""
+        key = normalize_link(link)
+        if not key:
+            return
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT INTO job_details (link_key, description, skills, fetched_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (link_key) DO UPDATE SET description = excluded.description, "
+                "skills = excluded.skills, fetched_at = excluded.fetched_at",
+                (key, description, json.dumps(skills), time.time()),
+            )
+            if description:
+                conn.execute("UPDATE jobs SET description = ? WHERE job_key = ?", (description, key))
+
+    def count(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    @staticmethod
+    def _to_job(row: sqlite3.Row) -> Dict:
+        return {column: row[column] for column in _JOB_COLUMNS if row[column] is not None}
+
+
+_default_store: Optional[JobStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_job_store() -> JobStore:
+    """The process-wide JobStore at JOB_STORE_PATH."""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = JobStore()
+        return _default_store
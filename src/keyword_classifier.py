@@ -1,15 +1,38 @@
+import os
 import spacy
 import pandas as pd
 import logging
+from typing import Dict, Iterable, List, Tuple
+from .category_scorer import UNKNOWN_CATEGORY, CategoryScorer, classification_confidences
+from .keyword_engine import get_matcher
+from .keyword_index import normalize_phrase
+from .model_registry import registry
 
-# Load NLP model
-try:
-    nlp = spacy.load("en_core_web_sm")
-    logging.info("Successfully loaded spaCy English model")
-except OSError as e:
-    logging.error(f"Failed to load spaCy model: {e}")
-    logging.error("Please run: python -m spacy download en_core_web_sm")
-    raise
+# Classification only needs the tokenizer plus lexical attributes (is_stop,
+# is_punct), so every trained component is excluded at load time.
+SPACY_MODEL = "en_core_web_sm"
+SPACY_EXCLUDE = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner", "senter"]
+
+# Defaults for bulk classification (see classify_resumes)
+CLASSIFY_BATCH_SIZE = int(os.environ.get('CLASSIFY_BATCH_SIZE', 64))
+CLASSIFY_N_PROCESS = int(os.environ.get('CLASSIFY_N_PROCESS', 1))
+
+def _load_nlp():
+    try:
+        nlp = spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDE)
+        logging.info(f"Successfully loaded spaCy English model (pipeline: {nlp.pipe_names or 'tokenizer only'})")
+        return nlp
+    except OSError as e:
+        logging.error(f"Failed to load spaCy model: {e}")
+        logging.error("Please run: python -m spacy download en_core_web_sm")
+        raise
+
+# The spaCy model is loaded once per process, on first use (see model_registry)
+registry.register(SPACY_MODEL, _load_nlp, warmup=lambda nlp: nlp("warm up"))
+
+def get_nlp():
+    """The shared spaCy pipeline."""
+    return registry.get(SPACY_MODEL)
 
 # Define keyword sets with weights for better classification
 categories = {
@@ -35,6 +58,20 @@ categories = {
     }
 }
 
+def refresh_keyword_matcher():
+    """(Re)compile the category taxonomy; call again after editing `categories`."""
+    global category_matcher, category_scorer, _keyword_categories
+    _keyword_categories = {}
+    for cat, config in categories.items():
+        for keyword in config["keywords"]:
+            _keyword_categories.setdefault(normalize_phrase(keyword), []).append(cat)
+    # Token-aligned, so matches agree with ResumeIndex lookups
+    category_matcher = get_matcher(_keyword_categories, tokenized=True)
+    # Same matching, scoring whole batches with one sparse matrix product
+    category_scorer = CategoryScorer(categories)
+
+refresh_keyword_matcher()
+
 def classify_resume(text):
     """
     Classify resume text into career categories using keyword matching.
@@ -48,14 +85,74 @@ def classify_resume(text):
     Raises:
         ValueError: If input text is empty or invalid
     """
+    _validate_text(text)
+    
+    # Clean and tokenize text
+    doc = get_nlp()(text.lower())
+    return _score_categories(text, doc)
+
+def classify_resumes(texts: Iterable[str], batch_size: int = None, n_process: int = None) -> List[Tuple[str, Dict[str, float]]]:
+    """
+    Classify many resumes, streaming them through spaCy's nlp.pipe and
+    scoring the whole batch at once with category_scorer (the scores equal
+    classify_resume's).
+    
+    Args:
+        texts: Resume texts to classify
+        batch_size (int): Documents per nlp.pipe batch (default: CLASSIFY_BATCH_SIZE)
+        n_process (int): Worker processes for nlp.pipe (default: CLASSIFY_N_PROCESS)
+        
+    Returns:
+        list: (top_category, scores_dict) per input text, in input order
+        
+    Raises:
+        ValueError: If any input text is empty or invalid
+    """
+    texts = list(texts)
+    for text in texts:
+        _validate_text(text)
+    
+    docs = get_nlp().pipe(
+        (text.lower() for text in texts),
+        batch_size=batch_size or CLASSIFY_BATCH_SIZE,
+        n_process=n_process or CLASSIFY_N_PROCESS,
+    )
+    results = category_scorer.classify(texts)
+    for doc, (top_category, scores) in zip(docs, results):
+        tokens = sum(1 for token in doc if not token.is_stop and not token.is_punct)
+        logging.info(f"Classified resume with {tokens} meaningful tokens as: {top_category} "
+                     f"(score: {scores.get(top_category, 0.0)})")
+    return results
+
+def categorize_resumes(texts: Iterable[str]) -> List[Dict]:
+    """
+    Top category and classification confidence of many resumes, computed
+    in one vectorized pass without spaCy.
+    
+    Args:
+        texts: Resume texts
+        
+    Returns:
+        list: {"category", "confidence"} per input text, in input order
+        ("Unknown" with confidence 0.0 when no keyword matched)
+    """
+    texts = list(texts)
+    scores, top = category_scorer.score(texts)
+    confidences = classification_confidences(scores)
+    return [{"category": category_scorer.categories[col] if col >= 0 else UNKNOWN_CATEGORY,
+             "confidence": float(confidence)}
+            for col, confidence in zip(top, confidences)]
+
+def _validate_text(text):
+    """Raise ValueError unless text is a non-blank string."""
     if not text or not isinstance(text, str):
         raise ValueError("Input text must be a non-empty string")
     
     if not text.strip():
         raise ValueError("Input text cannot be empty or whitespace only")
-    
-    # Clean and tokenize text
-    doc = nlp(text.lower())
+
+def _score_categories(text, doc):
+    """Score one resume given its raw text and tokenized doc."""
     tokens = [token.text for token in doc if not token.is_stop and not token.is_punct]
     
     logging.info(f"Processing resume with {len(tokens)} meaningful tokens")
@@ -63,12 +160,11 @@ def classify_resume(text):
     # Calculate scores with weights
     scores = {cat: 0.0 for cat in categories}
     
-    for cat, config in categories.items():
-        for keyword in config["keywords"]:
-            # Check for exact matches and partial matches
-            if keyword.lower() in text.lower():
-                scores[cat] += config["weight"]
-                logging.debug(f"Found keyword '{keyword}' for category '{cat}'")
+    # Single pass over the text finds every taxonomy keyword on whole tokens
+    for keyword in category_matcher.find_keywords(text):
+        for cat in _keyword_categories.get(keyword, ()):
+            scores[cat] += categories[cat]["weight"]
+            logging.debug(f"Found keyword '{keyword}' for category '{cat}'")
     
     # Find top category
     if all(score == 0 for score in scores.values()):
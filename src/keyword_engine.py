@@ -0,0 +1,146 @@
+# src/keyword_engine.py
+
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+from .keyword_index import tokenize
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase and collapse whitespace (PDF text breaks multi-word terms across lines)."""
+    return _WHITESPACE_RE.sub(" ", text.lower())
+
+
+def normalize_tokens(text: str) -> str:
+    """Reduce text to its ResumeIndex tokens joined by single spaces."""
+    return " ".join(tokenize(text))
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class KeywordMatcher:
+    """
+    Aho–Corasick automaton that finds every keyword in a text in one linear pass.
+
+    Matches are case-insensitive and must sit on word boundaries, so "java"
+    does not fire inside "javascript" and "api" does not fire inside "rapid".
+    Keywords that start or end with punctuation ("c++", ".net") only need a
+    boundary on their alphanumeric side.
+
+    With tokenized=True, keywords and texts are normalized with the same
+    tokenizer as ResumeIndex and matches must cover whole tokens, so a scan
+    agrees exactly with ResumeIndex lookups.
+    """
+
+    def __init__(self, keywords: Iterable[str], tokenized: bool = False):
+        self.tokenized = tokenized
+        self._normalize = normalize_tokens if tokenized else normalize_text
+        self.keywords: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        seen = set()
+        for keyword in keywords:
+            normalized = self._normalize(keyword).strip()
+            if normalized and normalized not in seen:
+                seen.add(normalized)
+                self._add(normalized)
+        self._keyword_ids = {keyword: i for i, keyword in enumerate(self.keywords)}
+        self._build_failure_links()
+
+    def _add(self, keyword: str):
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(len(self.keywords))
+        self.keywords.append(keyword)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                # Inherit matches that end at the fallback state (e.g. "learning" inside "deep learning")
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def find_all(self, text: str, normalized: bool = False) -> Iterator[Tuple[int, int, str]]:
+        """
+        Yield (start, end, keyword) for every boundary-respecting occurrence.
+
+        Offsets refer to the normalized text (see normalize_text and
+        normalize_tokens). Pass normalized=True if the caller already
+        normalized it.
+        """
+        if not normalized:
+            text = self._normalize(text)
+        tokenized = self.tokenized
+        goto, fail, output, keywords = self._goto, self._fail, self._output, self.keywords
+        length = len(text)
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if not output[state]:
+                continue
+            end = index + 1
+            for keyword_id in output[state]:
+                keyword = keywords[keyword_id]
+                start = end - len(keyword)
+                if tokenized:
+                    if (start > 0 and text[start - 1] != " ") or (end < length and text[end] != " "):
+                        continue
+                else:
+                    if _is_word_char(keyword[0]) and start > 0 and _is_word_char(text[start - 1]):
+                        continue
+                    if _is_word_char(keyword[-1]) and end < length and _is_word_char(text[end]):
+                        continue
+                yield start, end, keyword
+
+    def find_ids(self, text: str, normalized: bool = False) -> Set[int]:
+        """Return the positions in self.keywords of every keyword present in the text."""
+        return {self._keyword_ids[keyword] for _, _, keyword in self.find_all(text, normalized)}
+
+    def find_keywords(self, text: str, normalized: bool = False) -> Set[str]:
+        """Return the set of (normalized) keywords present in the text."""
+        return {keyword for _, _, keyword in self.find_all(text, normalized)}
+
+    def count(self, text: str, normalized: bool = False) -> Dict[str, int]:
+        """Return occurrence counts for every keyword present in the text."""
+        counts: Dict[str, int] = {}
+        for _, _, keyword in self.find_all(text, normalized):
+            counts[keyword] = counts.get(keyword, 0) + 1
+        return counts
+
+
+@lru_cache(maxsize=32)
+def _compile(keywords: Tuple[str, ...], tokenized: bool) -> KeywordMatcher:
+    return KeywordMatcher(keywords, tokenized=tokenized)
+
+
+def get_matcher(keywords: Iterable[str], tokenized: bool = False) -> KeywordMatcher:
+    """Return a compiled matcher for a keyword list, shared across callers with the same list."""
+    normalize = normalize_tokens if tokenized else normalize_text
+    return _compile(tuple(sorted({normalize(k).strip() for k in keywords})), tokenized)
@@ -0,0 +1,75 @@
+# src/keyword_index.py
+
+import re
+from typing import Dict, Iterable, List, Set
+
+# Words keep trailing "+"/"#" so "c++" and "c#" stay distinct from "c";
+# everything else (spaces, "/", ".", "-") separates tokens, which lets
+# "ci/cd", "ci cd" and "CI-CD" all normalize to the same bigram.
+_TOKEN_RE = re.compile(r"[a-z0-9]+[+#]*")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def normalize_phrase(phrase: str) -> str:
+    """Normalize a keyword to the key format used by ResumeIndex."""
+    return " ".join(tokenize(phrase))
+
+
+class ResumeIndex:
+    """
+    Inverted index of a resume's unigrams, bigrams and trigrams.
+
+    The text is tokenized once; afterwards checking whether a keyword occurs
+    is a dictionary lookup instead of a substring scan, and matches always
+    align to whole tokens ("api" never matches inside "rapid").
+    """
+
+    def __init__(self, text: str, max_n: int = 3):
+        self.tokens = tokenize(text)
+        self.max_n = max_n
+        self.ngrams: Dict[str, List[int]] = {}
+        token_count = len(self.tokens)
+        for position in range(token_count):
+            for n in range(1, max_n + 1):
+                if position + n > token_count:
+                    break
+                key = " ".join(self.tokens[position:position + n])
+                self.ngrams.setdefault(key, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def positions(self, phrase: str) -> List[int]:
+        """Token positions where the phrase starts (empty list if absent)."""
+        key = normalize_phrase(phrase)
+        if not key:
+            return []
+        words = key.split(" ")
+        if len(words) <= self.max_n:
+            return self.ngrams.get(key, [])
+
+        # Longer phrases: anchor on the leading n-gram and verify the rest
+        head = " ".join(words[:self.max_n])
+        return [
+            position for position in self.ngrams.get(head, [])
+            if self.tokens[position:position + len(words)] == words
+        ]
+
+    def contains(self, phrase: str) -> bool:
+        """Return True if the phrase occurs as a whole-token sequence."""
+        return bool(self.positions(phrase))
+
+    def __contains__(self, phrase: str) -> bool:
+        return self.contains(phrase)
+
+    def count(self, phrase: str) -> int:
+        """Number of occurrences of the phrase."""
+        return len(self.positions(phrase))
+
+    def find(self, phrases: Iterable[str]) -> Set[str]:
+        """Return the subset of phrases present in the resume."""
+        return {phrase for phrase in phrases if self.contains(phrase)}
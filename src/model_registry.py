@@ -0,0 +1,129 @@
+# src/model_registry.py
+
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+def _rss_bytes() -> Optional[int]:
+    """Resident memory of this process (peak RSS when psutil is missing), or None if unknown."""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    if resource is not None:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024  # kilobytes on Linux
+    return None
+
+
+class ModelRegistry:
+    """
+    Process-wide registry of heavyweight models.
+
+    Each model is registered once with a loader (and optionally a warm-up
+    function that runs a dummy inference) and is loaded on first get(),
+    exactly once per process even when many threads ask for it at the same
+    time. Load and warm-up times and the RSS growth during loading are
+    recorded for metrics().
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._warmups: Dict[str, Optional[Callable[[Any], Any]]] = {}
+        self._models: Dict[str, Any] = {}
+        self._model_locks: Dict[str, threading.Lock] = {}
+        self._metrics: Dict[str, Dict] = {}
+
+    def register(self, name: str, loader: Callable[[], Any], warmup: Optional[Callable[[Any], Any]] = None):
+        """Register a loader; re-registering a name keeps an already loaded model."""
+        with self._lock:
+            self._loaders[name] = loader
+            self._warmups[name] = warmup
+            self._model_locks.setdefault(name, threading.Lock())
+            self._metrics.setdefault(name, {"loaded": False, "load_seconds": None, "rss_delta_bytes": None,
+                                            "warmup_seconds": None, "requests": 0})
+
+    def get(self, name: str) -> Any:
+        """Return the model, loading it on first use."""
+        if name not in self._loaders:
+            raise KeyError(f"No model registered under '{name}'")
+        self._metrics[name]["requests"] += 1
+        model = self._models.get(name)
+        if model is not None:
+            return model
+        with self._model_locks[name]:
+            # Another thread may have finished loading while we waited
+            if name in self._models:
+                return self._models[name]
+            rss_before = _rss_bytes()
+            started = time.perf_counter()
+            model = self._loaders[name]()
+            elapsed = time.perf_counter() - started
+            rss_after = _rss_bytes()
+            self._metrics[name].update({
+                "loaded": True,
+                "load_seconds": round(elapsed, 3),
+                "rss_delta_bytes": None if rss_before is None else rss_after - rss_before,
+            })
+            self._models[name] = model
+            logging.info(f"Loaded model '{name}' in {elapsed:.2f}s")
+            return model
+
+    def is_registered(self, name: str) -> bool:
+        return name in self._loaders
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._models
+
+    def override(self, name: str, model: Any) -> Optional[Any]:
+        """Swap in an already built model (benchmarks, tests); returns the previous one, if any."""
+        with self._model_locks[name]:
+            previous = self._models.pop(name, None)
+            if model is not None:
+                self._models[name] = model
+            return previous
+
+    def unload(self, name: str):
+        """Drop a loaded model so the next get() loads it again."""
+        with self._model_locks[name]:
+            self._models.pop(name, None)
+            self._metrics[name]["loaded"] = False
+
+    def warmup(self, names: Optional[Iterable[str]] = None) -> Dict[str, Dict]:
+        """
+        Load models and run one dummy inference on each, so the first real
+        request doesn't pay for lazy initialization.
+
+        Args:
+            names: Models to warm up (default: every registered model)
+
+        Returns:
+            dict: metrics() for the warmed-up models
+        """
+        names = list(self._loaders) if names is None else list(names)
+        for name in names:
+            model = self.get(name)
+            warmup = self._warmups.get(name)
+            if warmup is not None:
+                started = time.perf_counter()
+                warmup(model)
+                self._metrics[name]["warmup_seconds"] = round(time.perf_counter() - started, 3)
+        return {name: self._metrics[name] for name in names}
+
+    def metrics(self) -> Dict[str, Dict]:
+        """Per-model load state, load/warm-up seconds, RSS growth while loading and request count."""
+        return {name: dict(values) for name, values in self._metrics.items()}
+
+
+# Shared by every module in the process
+registry = ModelRegistry()
@@ -1,49 +1,186 @@
 import pdfplumber
 import os
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
 
-def extract_text_from_pdf(file_path):
+from .extractors import get_extractor
+
+# Parallel extraction settings (opt-in, see extract_text_from_pdf)
+PARALLEL_ENABLED = os.environ.get('PDF_PARALLEL', 'False').lower() == 'true'
+PARALLEL_WORKERS = int(os.environ.get('PDF_PARALLEL_WORKERS', os.cpu_count() or 1))
+PARALLEL_PAGE_THRESHOLD = int(os.environ.get('PDF_PARALLEL_PAGE_THRESHOLD', 16))
+# Page ranges queued per worker; ranges still queued when the caller stops early are cancelled
+RANGES_PER_WORKER = 4
+
+def get_extractor_version(backend=None) -> str:
+    """Identify the text produced by a backend, for cache keys."""
+    extractor = get_extractor(backend)
+    return f"{extractor.name}-{extractor.version}"
+
+def _extract_page_range(file_path: str, start: int, stop: int, backend: str) -> List[Optional[str]]:
+    """Extract the text of pages [start, stop) in a worker process."""
+    return list(get_extractor(backend).iter_pages(file_path, start, stop))
+
+def _split_page_ranges(page_count: int, workers: int) -> List[tuple]:
+    """Split page indices into contiguous, near-equal ranges."""
+    workers = max(1, min(workers, page_count))
+    size, remainder = divmod(page_count, workers)
+    ranges, start = [], 0
+    for i in range(workers):
+        stop = start + size + (1 if i < remainder else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+def _iter_pages_parallel(file_path: str, page_count: int, workers: int, backend: str):
+    """Yield page texts extracted by a process pool, preserving page order."""
+    ranges = _split_page_ranges(page_count, workers * RANGES_PER_WORKER)
+    # spawn, not fork: forking a threaded server can copy held locks into the workers
+    executor = ProcessPoolExecutor(max_workers=min(workers, len(ranges)),
+                                   mp_context=multiprocessing.get_context("spawn"))
+    try:
+        futures = [executor.submit(_extract_page_range, file_path, start, stop, backend) for start, stop in ranges]
+        for future in futures:
+            yield from future.result()
+    finally:
+        # Callers may stop early: cancel the queued ranges and return without
+        # waiting for the ones already running (the workers exit when they finish)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def _validate_pdf_path(file_path):
+    """Raise if the path is missing or not a PDF."""
+    # Validate file exists
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"PDF file not found: {file_path}")
+    
+    # Validate file extension
+    if not file_path.lower().endswith('.pdf'):
+        raise ValueError(f"File must be a PDF: {file_path}")
+
+def iter_pdf_pages(file_path, max_pages=None, max_chars=None, parallel=None, max_workers=None, page_threshold=None,
+                   backend=None):
+    """
+    Stream the text of a PDF one page at a time.
+    
+    Backends release each page's cached layout objects as soon as its text
+    has been extracted, so memory stays bounded by a single page instead of
+    the whole document.
+    
+    Args:
+        file_path (str): Path to the PDF file
+        max_pages (int): Stop after this many pages (default: no limit)
+        max_chars (int): Stop once this many characters have been yielded; the
+            page that crosses the budget is truncated (default: no limit)
+        parallel (bool): Split page ranges across a process pool for long PDFs
+            (default: PDF_PARALLEL)
+        max_workers (int): Worker processes for parallel mode (default: PDF_PARALLEL_WORKERS)
+        page_threshold (int): Minimum page count before parallel mode kicks in
+            (default: PDF_PARALLEL_PAGE_THRESHOLD)
+        backend (str): Extraction backend name, see src.extractors (default: PDF_EXTRACTOR)
+    
+    Yields:
+        tuple: (page_number, text), 1-based; text is "" for pages without extractable text
+    
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        ValueError: If the file is not a PDF or has no pages
+        PDFSyntaxError: If pdfminer cannot parse the file
+    """
+    _validate_pdf_path(file_path)
+    
+    parallel = PARALLEL_ENABLED if parallel is None else parallel
+    workers = max_workers or PARALLEL_WORKERS
+    threshold = page_threshold if page_threshold is not None else PARALLEL_PAGE_THRESHOLD
+    remaining_chars = max_chars
+    
+    def budgeted(page_num, page_text):
+        nonlocal remaining_chars
+        page_text = page_text or ""
+        if remaining_chars is not None:
+            if len(page_text) >= remaining_chars:
+                logging.info(f"Character budget of {max_chars} reached at page {page_num} of {file_path}")
+                page_text = page_text[:remaining_chars]
+            remaining_chars -= len(page_text)
+        return page_num, page_text
+    
+    extractor = get_extractor(backend)
+    
+    if parallel and workers > 1:
+        page_count = extractor.page_count(file_path)
+        if not page_count:
+            raise ValueError("PDF appears to be empty or corrupted")
+        if max_pages is not None and page_count > max_pages:
+            logging.info(f"Limiting {file_path} to the first {max_pages} of {page_count} pages")
+            page_count = max_pages
+        parallel = page_count >= threshold
+    
+    if not (parallel and workers > 1):
+        page_num = 0
+        for page_num, page_text in enumerate(extractor.iter_pages(file_path, 0, max_pages), 1):
+            yield budgeted(page_num, page_text)
+            if remaining_chars is not None and remaining_chars <= 0:
+                return
+        if page_num == 0:
+            raise ValueError("PDF appears to be empty or corrupted")
+        return
+    
+    logging.info(f"Extracting {page_count} pages from {file_path} with {workers} workers")
+    pages = _iter_pages_parallel(file_path, page_count, workers, extractor.name)
+    try:
+        for index, page_text in enumerate(pages):
+            yield budgeted(index + 1, page_text)
+            if remaining_chars is not None and remaining_chars <= 0:
+                return
+    finally:
+        pages.close()
+
+def extract_text_from_pdf(file_path, parallel=None, max_workers=None, page_threshold=None,
+                          max_pages=None, max_chars=None, backend=None):
     """
     Extract text from a PDF file with error handling and validation.
     
+    Thin wrapper around iter_pdf_pages that joins the page texts.
+    
     Args:
         file_path (str): Path to the PDF file
-        
+        parallel (bool): Split page ranges across a process pool for long PDFs
+            (default: PDF_PARALLEL)
+        max_workers (int): Worker processes for parallel mode (default: PDF_PARALLEL_WORKERS)
+        page_threshold (int): Minimum page count before parallel mode kicks in
+            (default: PDF_PARALLEL_PAGE_THRESHOLD)
+        max_pages (int): Only extract the first N pages (default: no limit)
+        max_chars (int): Stop after roughly this many characters (default: no limit)
+        backend (str): Extraction backend name, see src.extractors (default: PDF_EXTRACTOR)
+    
     Returns:
         str: Extracted text from the PDF
-        
+    
     Raises:
         FileNotFoundError: If the file doesn't exist
         ValueError: If the file is not a valid PDF
         Exception: For other PDF processing errors
     """
-    # Validate file exists
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"PDF file not found: {file_path}")
-    
-    # Validate file extension
-    if not file_path.lower().endswith('.pdf'):
-        raise ValueError(f"File must be a PDF: {file_path}")
+    _validate_pdf_path(file_path)
     
     try:
-        text = ""
-        with pdfplumber.open(file_path) as pdf:
-            if not pdf.pages:
-                raise ValueError("PDF appears to be empty or corrupted")
-                
-            for page_num, page in enumerate(pdf.pages):
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-                else:
-                    logging.warning(f"Page {page_num + 1} had no extractable text")
-        
+        parts = []
+        pages = iter_pdf_pages(file_path, max_pages=max_pages, max_chars=max_chars, parallel=parallel,
+                               max_workers=max_workers, page_threshold=page_threshold, backend=backend)
+        for page_num, page_text in pages:
+            if page_text:
+                parts.append(page_text + "\n")
+            else:
+                logging.warning(f"Page {page_num} had no extractable text")
+        text = "".join(parts)
+    
         if not text.strip():
             raise ValueError("No text could be extracted from the PDF")
-            
+    
         logging.info(f"Successfully extracted {len(text)} characters from {file_path}")
         return text
-        
+    
     except pdfplumber.pdfminer.pdfparser.PDFSyntaxError as e:
         raise ValueError(f"Invalid or corrupted PDF file: {e}")
     except Exception as e:
@@ -0,0 +1,69 @@
+# src/rate_limit.py
+
+import os
+import time
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+# Default politeness per remote host: sustained requests/second and burst size
+SCRAPE_RATE_PER_HOST = float(os.environ.get('SCRAPE_RATE_PER_HOST', 1.0))
+SCRAPE_BURST = int(os.environ.get('SCRAPE_BURST', 3))
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, holding at most `capacity`."""
+
+    def __init__(self, rate: float, capacity: int):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Take one token, sleeping until one is available.
+
+        Returns:
+            bool: False if no token could be had within timeout seconds
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    """One TokenBucket per host, created on first use."""
+
+    def __init__(self, rate: float = None, capacity: int = None):
+        self.rate = rate or SCRAPE_RATE_PER_HOST
+        self.capacity = capacity or SCRAPE_BURST
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.capacity)
+            return self._buckets[host]
+
+    def acquire(self, url_or_host: str, timeout: Optional[float] = None) -> bool:
+        """Wait for a request slot to the host of a URL (or a bare host name)."""
+        host = urlsplit(url_or_host).netloc or url_or_host
+        return self.bucket(host.lower()).acquire(timeout)
@@ -0,0 +1,58 @@
+# src/resume_chunker.py
+
+import re
+from typing import List, Tuple
+
+# Headers commonly used to open a resume section (matched on a line by itself)
+SECTION_HEADERS = [
+    "summary", "professional summary", "profile", "objective", "career objective", "about me",
+    "experience", "work experience", "professional experience", "employment history", "internships",
+    "internship", "education", "academic background", "skills", "technical skills", "core competencies",
+    "projects", "academic projects", "personal projects", "certifications", "certificates",
+    "achievements", "awards", "publications", "leadership", "activities", "extracurricular activities",
+    "languages", "interests", "volunteering", "volunteer experience", "courses", "relevant coursework",
+]
+
+_HEADER_RE = re.compile(
+    r"^\s*(" + "|".join(re.escape(h) for h in sorted(SECTION_HEADERS, key=len, reverse=True)) + r")\s*:?\s*$",
+    re.IGNORECASE,
+)
+
+
+def split_sections(text: str) -> List[Tuple[str, str]]:
+    """
+    Split resume text into (section_name, body) pairs.
+
+    Text before the first recognized header (usually name and contact
+    details) is returned under "header".
+    """
+    sections = []
+    name, lines = "header", []
+    for line in text.splitlines():
+        match = _HEADER_RE.match(line)
+        if match:
+            if any(l.strip() for l in lines):
+                sections.append((name, "\n".join(lines).strip()))
+            name, lines = match.group(1).strip().lower(), []
+        else:
+            lines.append(line)
+    if any(l.strip() for l in lines):
+        sections.append((name, "\n".join(lines).strip()))
+    return sections
+
+
+def chunk_resume(text: str, max_words: int = 150) -> List[str]:
+    """
+    Split a resume into section-aware chunks of at most max_words words.
+
+    Each chunk is prefixed with its section name so the embedding keeps the
+    context ("Skills: python, docker ..."). Long sections are cut into
+    consecutive word windows; chunks never cross a section boundary.
+    """
+    chunks = []
+    for name, body in split_sections(text):
+        words = body.split()
+        prefix = "" if name == "header" else f"{name.title()}: "
+        for start in range(0, len(words), max_words):
+            chunks.append(prefix + " ".join(words[start:start + max_words]))
+    return chunks or [text]
@@ -3,16 +3,17 @@ import json
 import logging
 from datetime import datetime
 from typing import List, Dict, Optional
-from .parser import extract_text_from_pdf
+from .text_cache import TextCache
 
 class ResumeManager:
     """Manages multiple resume uploads with a maximum limit of 3."""
     
-    def __init__(self, storage_dir: str = "data/resumes"):
+    def __init__(self, storage_dir: str = "data/resumes", text_cache: Optional[TextCache] = None):
         self.storage_dir = storage_dir
         self.max_resumes = 3
         self.metadata_file = os.path.join(storage_dir, "resume_metadata.json")
         self._ensure_storage_dir()
+        self.text_cache = text_cache or TextCache(os.path.join(storage_dir, ".text_cache"))
         self._load_metadata()
     
     def _ensure_storage_dir(self):
@@ -71,7 +72,7 @@ class ResumeManager:
         
         # Extract text and analyze
         try:
-            text_content = extract_text_from_pdf(new_path)
+            text_content = self.text_cache.get_or_extract(new_path)
             
             # Create resume entry
             resume_info = {
@@ -147,11 +148,15 @@ class ResumeManager:
             return None
         
         try:
-            return extract_text_from_pdf(resume["file_path"])
+            return self.text_cache.get_or_extract(resume["file_path"])
         except Exception as e:
             logging.error(f"Failed to extract text from resume {resume_id}: {e}")
             return None
     
+    def get_cache_stats(self) -> Dict:
+        """Get hit/miss counters for the extracted-text cache."""
+        return self.text_cache.stats()
+    
     def get_upload_count(self) -> int:
         """Get current number of uploaded resumes."""
         return len(self.metadata)
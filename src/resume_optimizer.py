@@ -2,6 +2,8 @@ import re
 import logging
 from typing import Dict, List, Tuple
 from .keyword_classifier import categories
+from .keyword_engine import get_matcher
+from .keyword_index import ResumeIndex, normalize_phrase
 
 class ResumeOptimizer:
     """Provides resume optimization suggestions for ATS and job matching."""
@@ -9,6 +11,7 @@ class ResumeOptimizer:
     def __init__(self):
         self.ats_keywords = self._load_ats_keywords()
         self.formatting_rules = self._load_formatting_rules()
+        self.keyword_matcher = self._compile_keyword_matcher()
     
     def _load_ats_keywords(self) -> Dict[str, List[str]]:
         """Load ATS-friendly keywords for different industries."""
@@ -39,6 +42,13 @@ class ResumeOptimizer:
             ]
         }
     
+    def _compile_keyword_matcher(self):
+        """Compile category and ATS keywords into one automaton (shared across instances)."""
+        keywords = [kw for config in categories.values() for kw in config["keywords"]]
+        for industry_keywords in self.ats_keywords.values():
+            keywords.extend(industry_keywords)
+        return get_matcher(keywords, tokenized=True)
+    
     def _load_formatting_rules(self) -> Dict[str, List[str]]:
         """Load ATS formatting rules and best practices."""
         return {
@@ -88,18 +98,21 @@ class ResumeOptimizer:
                 "areas_for_improvement": []
             }
             
+            # Tokenize once; every keyword check below is an index lookup
+            index = ResumeIndex(resume_text)
+            
             # Analyze keywords
-            keyword_analysis = self._analyze_keywords(resume_text, target_job)
+            keyword_analysis = self._analyze_keywords(resume_text, target_job, index)
             analysis["keyword_analysis"] = keyword_analysis
             
             # Check formatting
-            formatting_score = self._check_formatting(resume_text)
+            formatting_score = self._check_formatting(resume_text, index)
             analysis["ats_compatibility"]["formatting_score"] = formatting_score
             
             # Generate suggestions
-            analysis["formatting_suggestions"] = self._generate_formatting_suggestions(resume_text)
+            analysis["formatting_suggestions"] = self._generate_formatting_suggestions(resume_text, index)
             analysis["optimization_recommendations"] = self._generate_optimization_recommendations(
-                resume_text, keyword_analysis, target_job
+                resume_text, keyword_analysis, target_job, index
             )
             
             # Calculate overall score
@@ -115,9 +128,11 @@ class ResumeOptimizer:
             logging.error(f"Error analyzing resume: {e}")
             return {"error": str(e)}
     
-    def _analyze_keywords(self, resume_text: str, target_job: str = None) -> Dict:
+    def _analyze_keywords(self, resume_text: str, target_job: str = None, index: ResumeIndex = None) -> Dict:
         """Analyze keyword presence and relevance."""
-        resume_lower = resume_text.lower()
+        index = index or ResumeIndex(resume_text)
+        # One pass over the index's tokens finds every category and ATS keyword
+        found = self.keyword_matcher.find_keywords(" ".join(index.tokens), normalized=True)
         
         # Analyze by career category
         keyword_scores = {}
@@ -130,7 +145,7 @@ class ResumeOptimizer:
             
             for keyword in category_keywords:
                 total_keywords += 1
-                if keyword.lower() in resume_lower:
+                if normalize_phrase(keyword) in found:
                     category_score += 1
                     found_keywords += 1
             
@@ -143,15 +158,22 @@ class ResumeOptimizer:
         # Overall keyword score
         overall_keyword_score = (found_keywords / total_keywords) * 100 if total_keywords > 0 else 0
         
+        ats_found = {
+            industry: [kw for kw in industry_keywords if normalize_phrase(kw) in found]
+            for industry, industry_keywords in self.ats_keywords.items()
+        }
+        
         return {
             "by_category": keyword_scores,
+            "ats_keywords_found": ats_found,
             "overall_score": overall_keyword_score,
             "total_keywords_found": found_keywords,
             "total_keywords_available": total_keywords
         }
     
-    def _check_formatting(self, resume_text: str) -> float:
+    def _check_formatting(self, resume_text: str, index: ResumeIndex = None) -> float:
         """Check resume formatting for ATS compatibility."""
+        index = index or ResumeIndex(resume_text)
         score = 100.0
         
         # Check for common ATS issues
@@ -176,30 +198,31 @@ class ResumeOptimizer:
         
         # Check for proper section headers
         section_headers = ["experience", "education", "skills", "summary", "objective"]
-        found_headers = sum(1 for header in section_headers if header in resume_text.lower())
+        found_headers = sum(1 for header in section_headers if header in index)
         if found_headers < 3:
             score -= 20
             issues.append("Missing important section headers")
         
         return max(score, 0.0)
     
-    def _generate_formatting_suggestions(self, resume_text: str) -> List[str]:
+    def _generate_formatting_suggestions(self, resume_text: str, index: ResumeIndex = None) -> List[str]:
         """Generate formatting improvement suggestions."""
+        index = index or ResumeIndex(resume_text)
         suggestions = []
         
         # Check section headers
-        if "experience" not in resume_text.lower():
+        if "experience" not in index:
             suggestions.append("Add an 'Experience' section to highlight work history")
         
-        if "skills" not in resume_text.lower():
+        if "skills" not in index:
             suggestions.append("Add a 'Skills' section to showcase technical abilities")
         
-        if "education" not in resume_text.lower():
+        if "education" not in index:
             suggestions.append("Add an 'Education' section for academic background")
         
         # Check for action verbs
         action_verbs = ["developed", "implemented", "managed", "created", "designed", "led"]
-        if not any(verb in resume_text.lower() for verb in action_verbs):
+        if not any(verb in index for verb in action_verbs):
             suggestions.append("Use strong action verbs to describe achievements")
         
         # Check for quantifiable results
@@ -208,8 +231,10 @@ class ResumeOptimizer:
         
         return suggestions
     
-    def _generate_optimization_recommendations(self, resume_text: str, keyword_analysis: Dict, target_job: str = None) -> List[str]:
+    def _generate_optimization_recommendations(self, resume_text: str, keyword_analysis: Dict, target_job: str = None,
+                                               index: ResumeIndex = None) -> List[str]:
         """Generate specific optimization recommendations."""
+        index = index or ResumeIndex(resume_text)
         recommendations = []
         
         # Keyword optimization
@@ -224,7 +249,7 @@ class ResumeOptimizer:
         # Target job optimization
         if target_job:
             target_keywords = self._extract_job_keywords(target_job)
-            missing_keywords = [kw for kw in target_keywords if kw.lower() not in resume_text.lower()]
+            missing_keywords = [kw for kw in target_keywords if kw not in index]
             if missing_keywords:
                 recommendations.append(f"Consider adding these keywords for '{target_job}': {', '.join(missing_keywords[:5])}")
         
@@ -0,0 +1,101 @@
+# src/search_executor.py
+
+import os
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from itertools import product
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Sequence, Tuple, Union
+
+# Parallel searches and the overall wall-clock budget of one search round
+SEARCH_MAX_WORKERS = int(os.environ.get('SEARCH_MAX_WORKERS', 8))
+SEARCH_DEADLINE_SECONDS = float(os.environ.get('SEARCH_DEADLINE_SECONDS', 30))
+
+# (term, location, work_model, experience_level), the argument order of scrape_linkedin_jobs
+SearchQuery = Tuple[str, str, str, str]
+
+
+def build_queries(terms: Iterable[str], locations: Union[str, Sequence[str]], work_model: str,
+                  experience_levels: Union[str, Sequence[str]]) -> List[SearchQuery]:
+    """Every term x location x experience level combination."""
+    locations = [locations] if isinstance(locations, str) else list(locations)
+    experience_levels = [experience_levels] if isinstance(experience_levels, str) else list(experience_levels)
+    return [(term, location, work_model, level) for term, location, level in product(terms, locations, experience_levels)]
+
+
+def iter_search_results(queries: Sequence[SearchQuery], fetch: Callable[..., List[Dict]],
+                        max_workers: int = None, deadline_seconds: float = None,
+                        group: Callable[[SearchQuery], Hashable] = None) -> Iterator[Tuple[SearchQuery, List[Dict]]]:
+    """
+    Run fetch(*query) for every query in a thread pool and yield
+    (query, jobs) as each one finishes.
+
+    Queries still running when the deadline passes are abandoned (their
+    results are dropped) and queries not yet started are cancelled, so one
+    slow request can't hold up the whole round. A query that raises yields
+    no results.
+
+    With group, queries are split by group(query) and every group runs in
+    its own pool of max_workers threads, so a slow group can't occupy the
+    threads of the others.
+    """
+    if not queries:
+        return
+    deadline = time.monotonic() + (deadline_seconds or SEARCH_DEADLINE_SECONDS)
+    groups: Dict[Hashable, List[SearchQuery]] = {}
+    for query in queries:
+        groups.setdefault(group(query) if group else None, []).append(query)
+    executors = [ThreadPoolExecutor(max_workers=min(len(members), max_workers or SEARCH_MAX_WORKERS))
+                 for members in groups.values()]
+    futures = {executor.submit(fetch, *query): query
+               for executor, members in zip(executors, groups.values()) for query in members}
+    try:
+        for future in as_completed(futures, timeout=max(0.0, deadline - time.monotonic())):
+            query = futures[future]
+            try:
+                yield query, future.result()
+            except Exception as e:
+                logging.error(f"Search {query} failed: {e}")
+    except FuturesTimeoutError:
+        pending = [query for future, query in futures.items() if not future.done()]
+        logging.warning(f"Search deadline reached; abandoning {len(pending)} of {len(queries)} queries")
+    finally:
+        for executor in executors:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_unique_jobs(queries: Sequence[SearchQuery], fetch: Callable[..., List[Dict]],
+                     key: Callable[[Dict], Hashable] = lambda job: (job['title'], job['company']),
+                     max_workers: int = None, deadline_seconds: float = None) -> Iterator[Dict]:
+    """
+    Run all queries concurrently and yield each job (dropping duplicates by
+    key) as soon as its query finishes. Closing the generator early
+    cancels the queries that haven't started.
+    """
+    seen = set()
+    for _, results in iter_search_results(queries, fetch, max_workers, deadline_seconds):
+        for job in results:
+            job_key = key(job)
+            if job_key not in seen:
+                seen.add(job_key)
+                yield job
+
+
+def search_concurrently(queries: Sequence[SearchQuery], fetch: Callable[..., List[Dict]],
+                        key: Callable[[Dict], Hashable] = lambda job: (job['title'], job['company']),
+                        max_workers: int = None, deadline_seconds: float = None) -> List[Dict]:
+    """
+    Run all queries concurrently and merge their jobs, dropping duplicates
+    (by key) as results arrive.
+
+    Args:
+        queries: (term, location, work_model, experience_level) tuples
+        fetch: Called as fetch(term, location, work_model, experience_level)
+        key: Dedup key of a job (default: title and company)
+        max_workers: Parallel queries (default: SEARCH_MAX_WORKERS)
+        deadline_seconds: Overall time budget (default: SEARCH_DEADLINE_SECONDS)
+
+    Returns:
+        list: Unique jobs in arrival order
+    """
+    return list(iter_unique_jobs(queries, fetch, key, max_workers, deadline_seconds))
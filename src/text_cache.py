@@ -0,0 +1,157 @@
+# src/text_cache.py
+
+import os
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from .parser import extract_text_from_pdf, get_extractor_version
+
+
+def hash_file(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Return the SHA-256 hex digest of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class TextCache:
+    """
+    Content-addressed cache for extracted resume text.
+
+    Entries are keyed by the SHA-256 of the PDF bytes plus the extractor
+    backend and version, so renamed or re-uploaded copies of the same file
+    share one entry and a parser change invalidates everything automatically.
+    Lookups go through an in-memory LRU tier first and an on-disk tier second;
+    the disk tier evicts least recently used files once it grows past
+    ``max_disk_bytes``.
+    """
+
+    def __init__(self, cache_dir: str = "data/cache/text", max_memory_entries: int = 32,
+                 max_disk_bytes: int = 50 * 1024 * 1024, version: Optional[str] = None):
+        self.cache_dir = cache_dir
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.version = version or get_extractor_version()
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._disk_bytes = self._scan_disk_usage()
+
+    def _scan_disk_usage(self) -> int:
+        """Sum the size of all cache files currently on disk."""
+        total = 0
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith(".txt"):
+                total += entry.stat().st_size
+        return total
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.txt")
+
+    def key_for(self, file_path: str) -> str:
+        """Build the cache key for a PDF file."""
+        content_hash = hash_file(file_path)
+        return hashlib.sha256(f"{content_hash}:{self.version}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up cached text by key, promoting disk hits into memory."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self._counters["memory_hits"] += 1
+                return self._memory[key]
+
+            path = self._disk_path(key)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    text = f.read()
+                os.utime(path)  # mark as recently used for disk eviction
+            except FileNotFoundError:
+                self._counters["misses"] += 1
+                return None
+            except OSError as e:
+                logging.warning(f"Could not read text cache entry {key}: {e}")
+                self._counters["misses"] += 1
+                return None
+
+            self._counters["disk_hits"] += 1
+            self._remember(key, text)
+            return text
+
+    def put(self, key: str, text: str):
+        """Store text in both tiers."""
+        with self._lock:
+            self._remember(key, text)
+            path = self._disk_path(key)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            try:
+                previous_size = os.path.getsize(path) if os.path.exists(path) else 0
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                os.replace(tmp_path, path)
+                self._disk_bytes += os.path.getsize(path) - previous_size
+            except OSError as e:
+                logging.warning(f"Could not write text cache entry {key}: {e}")
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                return
+            self._evict_disk()
+
+    def _remember(self, key: str, text: str):
+        """Insert into the memory tier, dropping the least recently used entry."""
+        self._memory[key] = text
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self):
+        """Remove least recently used files until the disk tier fits its budget."""
+        if self._disk_bytes <= self.max_disk_bytes:
+            return
+        entries = [e for e in os.scandir(self.cache_dir) if e.is_file() and e.name.endswith(".txt")]
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        for entry in entries:
+            if self._disk_bytes <= self.max_disk_bytes:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+                self._disk_bytes -= size
+                self._counters["evictions"] += 1
+            except OSError as e:
+                logging.warning(f"Could not evict text cache entry {entry.name}: {e}")
+
+    def get_or_extract(self, file_path: str, extractor: Callable[[str], str] = extract_text_from_pdf) -> str:
+        """Return cached text for a PDF, extracting and caching it on a miss."""
+        key = self.key_for(file_path)
+        text = self.get(key)
+        if text is not None:
+            return text
+        text = extractor(file_path)
+        self.put(key, text)
+        return text
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters and current tier sizes."""
+        with self._lock:
+            stats = dict(self._counters)
+            stats["memory_entries"] = len(self._memory)
+            stats["disk_bytes"] = self._disk_bytes
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        return stats
+
+    def clear(self):
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            for entry in os.scandir(self.cache_dir):
+                if entry.is_file() and entry.name.endswith(".txt"):
+                    os.remove(entry.path)
+            self._disk_bytes = 0
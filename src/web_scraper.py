@@ -1,20 +1,37 @@
 # src/web_scraper.py
 
-import requests
-from bs4 import BeautifulSoup
+import os
+import math
 import logging
-from typing import List, Dict
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Dict
 from urllib.parse import quote
+from . import http_cache
+from .card_parser import parse_job_cards
+from .rate_limit import HostRateLimiter
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36"
 }
 
-def scrape_linkedin_jobs(job_title: str, location: str, work_model: str = "", experience_level: str = "") -> List[Dict]:
-    """Scrapes job listings from LinkedIn using filters."""
+# Point at a local stand-in server for tests and benchmarks
+LINKEDIN_SEARCH_URL = os.environ.get('LINKEDIN_SEARCH_URL', 'https://www.linkedin.com/jobs/search')
+
+# Jobs per search (fetched as result pages of SCRAPE_PAGE_SIZE) and how many
+# pages are requested ahead of the consumer
+SCRAPE_MAX_JOBS = int(os.environ.get('SCRAPE_MAX_JOBS', 50))
+SCRAPE_PAGE_SIZE = int(os.environ.get('SCRAPE_PAGE_SIZE', 25))
+SCRAPE_PREFETCH_PAGES = int(os.environ.get('SCRAPE_PREFETCH_PAGES', 2))
+
+# Shared by every thread, so concurrent searches stay polite per host
+rate_limiter = HostRateLimiter()
+
+def search_url(job_title: str, location: str, work_model: str = "", experience_level: str = "", start: int = 0) -> str:
+    """LinkedIn search URL with filters; start is the result offset of the page."""
     job_title_formatted = quote(job_title)
     location_formatted = quote(location)
-    url = f"https://www.linkedin.com/jobs/search?keywords={job_title_formatted}&location={location_formatted}"
+    url = f"{LINKEDIN_SEARCH_URL}?keywords={job_title_formatted}&location={location_formatted}"
 
     # Add filters
     if "remote" in work_model.lower():
@@ -27,33 +44,72 @@ def scrape_linkedin_jobs(job_title: str, location: str, work_model: str = "", ex
     elif "entry" in experience_level.lower():
         url += "&f_E=2"    # Entry level
 
+    if start:
+        url += f"&start={start}"
+    return url
+
+def fetch_job_page(url: str) -> List[Dict]:
+    """Fetch and parse one results page; raises on HTTP or connection errors."""
     logging.info(f"Scraping LinkedIn with URL: {url}")
+    # Served from the response cache when fresh; otherwise fetched through the pooled,
+    # retrying session (or replayed from fixtures in HTTP_CACHE_MODE=replay)
+    response = http_cache.cached_get(url, headers=HEADERS, timeout=10, rate_limiter=rate_limiter)
+    response.raise_for_status()
+    return parse_job_cards(response.text)
+
+def iter_linkedin_jobs(job_title: str, location: str, work_model: str = "", experience_level: str = "",
+                       max_jobs: int = None, prefetch: int = None) -> Iterator[Dict]:
+    """
+    Yield LinkedIn jobs page by page, up to max_jobs.
+
+    Result pages are requested by offset, up to `prefetch` at a time ahead of
+    the consumer, and the jobs of each page are yielded (in page order) as soon
+    as it arrives. The walk ends at the budget, at a page with no new jobs, or
+    at the first failed page; closing the generator early cancels the pages
+    not yet fetched.
+    """
+    max_jobs = SCRAPE_MAX_JOBS if max_jobs is None else max_jobs
+    if max_jobs <= 0:
+        return
+    pages = math.ceil(max_jobs / SCRAPE_PAGE_SIZE)
+    workers = min(pages, prefetch or SCRAPE_PREFETCH_PAGES)
+    executor = ThreadPoolExecutor(max_workers=workers)
+    pending = deque()
+    next_page = 0
+    seen, yielded = set(), 0
+
+    def submit_next():
+        nonlocal next_page
+        url = search_url(job_title, location, work_model, experience_level, start=next_page * SCRAPE_PAGE_SIZE)
+        pending.append(executor.submit(fetch_job_page, url))
+        next_page += 1
 
     try:
-        response = requests.get(url, headers=HEADERS, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        job_cards = soup.find_all('div', class_='base-card')
-
-        jobs_list = []
-        for card in job_cards[:15]:  # limit to 15 jobs
-            title_tag = card.find('h3', class_='base-search-card__title')
-            company_tag = card.find('h4', class_='base-search-card__subtitle')
-            location_tag = card.find('span', class_='job-search-card__location')
-            link_tag = card.find('a', class_='base-card__full-link')
-
-            if all([title_tag, company_tag, location_tag, link_tag]):
-                jobs_list.append({
-                    "title": title_tag.get_text(strip=True),
-                    "company": company_tag.get_text(strip=True),
-                    "location": location_tag.get_text(strip=True),
-                    "link": link_tag['href'],
-                    "source": "LinkedIn"
-                })
-
-        logging.info(f"Successfully scraped {len(jobs_list)} jobs from LinkedIn.")
-        return jobs_list
-
-    except Exception as e:
-        logging.error(f"Failed to scrape LinkedIn: {e}")
-        return []
+        while next_page < pages and len(pending) < workers:
+            submit_next()
+        while pending:
+            try:
+                jobs = pending.popleft().result()
+            except Exception as e:
+                logging.error(f"Failed to scrape LinkedIn: {e}")
+                return
+            if next_page < pages:
+                submit_next()
+            new_jobs = [job for job in jobs if job['link'] not in seen]
+            if not new_jobs:  # past the last page of results
+                return
+            for job in new_jobs:
+                seen.add(job['link'])
+                yield job
+                yielded += 1
+                if yielded >= max_jobs:
+                    return
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def scrape_linkedin_jobs(job_title: str, location: str, work_model: str = "", experience_level: str = "",
+                         max_jobs: int = None) -> List[Dict]:
+    """Scrapes job listings from LinkedIn using filters, up to max_jobs (default: SCRAPE_MAX_JOBS)."""
+    jobs_list = list(iter_linkedin_jobs(job_title, location, work_model, experience_level, max_jobs=max_jobs))
+    logging.info(f"Successfully scraped {len(jobs_list)} jobs from LinkedIn.")
+    return jobs_list